@@ -14,3 +14,10 @@ from django.core.asgi import get_asgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'Faculty_Portal.settings')
 
 application = get_asgi_application()
+
+from django.conf import settings  # noqa: E402  (needs the settings configured above)
+
+if settings.TEMPLATE_WARMUP:
+    from accounts.template_warmup import warm_templates
+
+    warm_templates()
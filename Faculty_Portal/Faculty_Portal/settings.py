@@ -13,6 +13,7 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 from pathlib import Path
 import os
 import dj_database_url
+from django.core.exceptions import ImproperlyConfigured
 
 # Cloudinary configuration
 import cloudinary
@@ -64,18 +65,34 @@ MIDDLEWARE = [
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
+    'accounts.middleware.CurrentUserMiddleware',
+    'accounts.middleware.SlidingSessionMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
     
 ]
 
 ROOT_URLCONF = 'Faculty_Portal.urls'
 
+# Templates
+# Compiled templates are kept per process by the cached loader (runserver's
+# autoreloader still clears it when a template changes). With TEMPLATE_WARMUP
+# on, wsgi.py/asgi.py compile every template while the worker boots instead of
+# on its first request (accounts/template_warmup.py).
+
+TEMPLATE_LOADERS = [
+    'django.template.loaders.filesystem.Loader',
+    'django.template.loaders.app_directories.Loader',
+]
+TEMPLATE_WARMUP = os.environ.get('TEMPLATE_WARMUP', str(not DEBUG)) == 'True'
+
 TEMPLATES = [
     {
         'BACKEND': 'django.template.backends.django.DjangoTemplates',
         'DIRS': [os.path.join(BASE_DIR, 'templates')],
-        'APP_DIRS': True,
         'OPTIONS': {
+            'loaders': [
+                ('django.template.loaders.cached.Loader', TEMPLATE_LOADERS),
+            ],
             'context_processors': [
                 'django.template.context_processors.request',
                 'django.contrib.auth.context_processors.auth',
@@ -95,6 +112,44 @@ DATABASES = {
     'default': { 'ENGINE': 'django.db.backends.sqlite3', 'NAME': BASE_DIR / 'db.sqlite3', }
 }
 
+# Cache
+# Local memory in development; set REDIS_URL in production so every worker
+# shares the submission generation counters (accounts/cache.py).
+
+if os.environ.get('REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.environ['REDIS_URL'],
+            'KEY_PREFIX': 'faculty_portal',
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'faculty-portal',
+        }
+    }
+
+# Sessions
+# SESSION_MODE picks the store: 'db' (django_session table), 'cached_db'
+# (reads served from the cache, writes go through to the table) or 'redis'
+# (cache only; needs REDIS_URL). cached_db/redis need a cache shared by every
+# worker, so without REDIS_URL the default stays 'db'.
+# Sessions are only rewritten once SESSION_REFRESH_AFTER of their age has
+# passed (accounts.middleware.SlidingSessionMiddleware).
+
+SESSION_MODE = os.environ.get('SESSION_MODE', 'cached_db' if os.environ.get('REDIS_URL') else 'db')
+SESSION_ENGINE = {
+    'db': 'django.contrib.sessions.backends.db',
+    'cached_db': 'django.contrib.sessions.backends.cached_db',
+    'redis': 'django.contrib.sessions.backends.cache',
+}[SESSION_MODE]
+if SESSION_MODE == 'redis' and not os.environ.get('REDIS_URL'):
+    raise ImproperlyConfigured("SESSION_MODE=redis requires REDIS_URL.")
+SESSION_REFRESH_AFTER = 0.5
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -164,12 +219,6 @@ AUTH_USER_MODEL = 'accounts.FacultyUser'
 LOGIN_URL = '/login/'
 
 
-DEAN_EMAIL = ['shamik.tiwari@iilm.edu']
-
-CLUSTER_HEAD_EMAIL = ['amar.shukla@iilm.edu', 'umang.garg@iilm.edu', 'akshat.agrawal@iilm.edu']
-
-FACULTY_EMAIL = ['puja.acharya@iilm.edu', 'pallavi.pandey@iilm.edu', 'sonam.lata@iilm.edu', 'pooja.nagpal@iilm.edu', 'aarti.chugh@iilm.edu', 'sapna.arora@iilm.edu', 'neha.bansal@iilm.edu', 'samridhi.singhal@iilm.edu',  'preeti.mehta@iilm.edu', 'jayati.tripathi@iilm.edu', 'rahul.thakur@iilm.edu', 'aarti.tewari@iilm.edu', 'naved.ahmad@iilm.edu', 'shagun.panghal@iilm.edu', 'abhishek.toofani@iilm.edu', 'amit.kumar.tiwari@iilm.edu', 'tanu.gupta@iilm.edu', 'vikas.jayswal@iilm.edu', 'puneet.bawa@iilm.edu', 'vardaan.pajnoo@iilm.edu', 'vishwa.prakash@iilm.edu', 'devraj.sharma@iilm.edu', 'anurag.jain@iilm.edu', 'aashish.kaushik@iilm.edu', 'rudraksh.sachdeva.ug24@iilm.edu']
-
 # settings.py
 X_FRAME_OPTIONS = 'SAMEORIGIN' # To allow embedding in iframes from the same origin
 
@@ -14,3 +14,10 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'Faculty_Portal.settings')
 
 application = get_wsgi_application()
+
+from django.conf import settings  # noqa: E402  (needs the settings configured above)
+
+if settings.TEMPLATE_WARMUP:
+    from accounts.template_warmup import warm_templates
+
+    warm_templates()
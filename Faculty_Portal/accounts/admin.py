@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import FacultyUser, FacultyProfile, JournalPublication,ConferencePublication, ResearchProject, Copyright, Patents, PhdGuidance, BookChapter, BooksAuthored, ConsultancyProjects, EditorialRoles, ReviewerRoles, AwardsAchievements, IndustryCollaboration
+from .models import FacultyUser, FacultyProfile, JournalPublication,ConferencePublication, ResearchProject, Copyright, Patents, PhdGuidance, BookChapter, BooksAuthored, ConsultancyProjects, EditorialRoles, ReviewerRoles, AwardsAchievements, IndustryCollaboration, SubmissionStats, SubmissionIndex, RoleAssignment, ReviewEvent
 
 # Register your models here.
 
@@ -17,4 +17,8 @@ admin.site.register(ConsultancyProjects)
 admin.site.register(EditorialRoles)
 admin.site.register(ReviewerRoles)
 admin.site.register(AwardsAchievements)
-admin.site.register(IndustryCollaboration)
\ No newline at end of file
+admin.site.register(IndustryCollaboration)
+admin.site.register(SubmissionStats)
+admin.site.register(SubmissionIndex)
+admin.site.register(RoleAssignment)
+admin.site.register(ReviewEvent)
\ No newline at end of file
@@ -0,0 +1,106 @@
+# accounts/backlog.py
+"""
+Depth and age of the review queues, per stage and per submission type.
+
+A stage's backlog is every SubmissionIndex entry in the status the stage
+decides (REVIEW_STAGES' from_status), and its age is how long the oldest
+entry has been sitting in that status. The index keeps queued_at current as
+transitions happen (set on submission, moved by each decision in
+accounts/review.py and by saves that change the status), so the whole report is one GROUP BY status, type
+query answered from the subindex_status_backlog index, without touching
+the 13 submission tables.
+
+The snapshot is cached under the backlog generation, which only moves when
+an entry enters, leaves or changes status (a new submission, a decision, a
+resubmission, a delete; see queues_changed()), not on every submission save,
+so edits and claims never invalidate it. Recomputing after a transition
+costs that one query, an index-only range scan over the queued entries:
+it grows with the depth of the queues, not with the number of submissions.
+Only the ages are worked out per call, from the cached timestamps, so they
+keep growing while the queue is idle.
+
+REVIEW_BACKLOG_MAX_AGE maps a stage to the age in seconds past which it is
+reported as over its threshold, e.g. {'dean': 48 * 3600}. Monitoring that
+has no reviewer session can read the endpoint with the bearer token in
+REVIEW_BACKLOG_TOKEN.
+"""
+
+import hmac
+
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import Count, Min
+from django.utils import timezone
+
+from .cache import BACKLOG_GENERATION, BACKLOG_TTL, cached
+from .models import SubmissionIndex
+from .review import REVIEW_STAGES
+from .submissions import get_submission_type
+
+
+BACKLOG_MAX_AGE = getattr(settings, 'REVIEW_BACKLOG_MAX_AGE', {})
+BACKLOG_TOKEN = getattr(settings, 'REVIEW_BACKLOG_TOKEN', None)
+
+
+def queue_snapshot():
+    """{stage: {type key: (depth, oldest queued_at)}} for every non-empty queue, from one grouped query."""
+
+    stages_by_status = {stage.from_status: name for name, stage in REVIEW_STAGES.items()}
+    rows = (
+        SubmissionIndex.objects.filter(status__in=stages_by_status)
+        .values_list('status', 'content_type')
+        .annotate(depth=Count('id'), oldest=Min('queued_at'))
+        .order_by()
+    )
+
+    snapshot = {name: {} for name in REVIEW_STAGES}
+    for status, content_type_id, depth, oldest in rows:
+        key = get_submission_type(ContentType.objects.get_for_id(content_type_id).model_class()).key
+        snapshot[stages_by_status[status]][key] = (depth, oldest)
+    return snapshot
+
+
+def has_backlog_token(request):
+    """Whether the request carries ``Authorization: Bearer <REVIEW_BACKLOG_TOKEN>``."""
+
+    if not BACKLOG_TOKEN:
+        return False
+    return hmac.compare_digest(request.headers.get('Authorization', ''), f'Bearer {BACKLOG_TOKEN}')
+
+
+def _age(oldest, now):
+    return round((now - oldest).total_seconds()) if oldest else None
+
+
+def review_backlog(max_age=None):
+    """
+    The backlog report: per stage the queue depth, the oldest entry's
+    queued_at and age in seconds, whether that age is over the stage's
+    threshold (`max_age`, default REVIEW_BACKLOG_MAX_AGE) and the same figures
+    per submission type.
+    """
+
+    max_age = BACKLOG_MAX_AGE if max_age is None else max_age
+    snapshot = cached('review_backlog', queue_snapshot, BACKLOG_TTL, (BACKLOG_GENERATION,))
+    now = timezone.now()
+
+    stages = {}
+    for name, types in snapshot.items():
+        oldest = min((at for _, at in types.values() if at), default=None)
+        age = _age(oldest, now)
+        stages[name] = {
+            'depth': sum(depth for depth, _ in types.values()),
+            'oldest_queued_at': oldest.isoformat() if oldest else None,
+            'oldest_age_seconds': age,
+            'max_age_seconds': max_age.get(name),
+            'over_threshold': age is not None and max_age.get(name) is not None and age > max_age[name],
+            'types': {
+                key: {
+                    'depth': depth,
+                    'oldest_queued_at': at.isoformat() if at else None,
+                    'oldest_age_seconds': _age(at, now),
+                }
+                for key, (depth, at) in sorted(types.items())
+            },
+        }
+    return {'generated_at': now.isoformat(), 'stages': stages}
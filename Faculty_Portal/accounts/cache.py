@@ -0,0 +1,192 @@
+# accounts/cache.py
+"""
+Generation-counter cache for data derived from the submission tables.
+
+Every submission model, and every faculty member, has a generation counter
+in the cache, bumped after each save or delete of a matching submission
+commits (see submission_changed(), called by the signal receivers). Cached values embed the generations of the
+models they were computed from in their key, so invalidating one model is a
+single atomic ``incr`` and a stale value can never be read back: it simply
+stops being addressed and ages out through its TTL.
+
+Counters live in Django's default cache, the local-memory backend in
+development and Redis in production (see CACHES in settings).
+"""
+
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, Q
+
+from .submissions import SUBMISSION_TYPES, aggregate_submissions, get_submission_type
+
+
+DEAN_ANALYTICS_TTL = getattr(settings, 'DEAN_ANALYTICS_CACHE_TTL', 30)
+REVIEW_STATS_TTL = getattr(settings, 'REVIEW_STATS_CACHE_TTL', 600)
+INSTITUTION_STATS_TTL = getattr(settings, 'INSTITUTION_STATS_CACHE_TTL', 600)
+DASHBOARD_FRAGMENT_TTL = getattr(settings, 'DASHBOARD_FRAGMENT_CACHE_TTL', 3600)
+REVIEW_METRICS_TTL = getattr(settings, 'REVIEW_METRICS_CACHE_TTL', 300)
+BACKLOG_TTL = getattr(settings, 'REVIEW_BACKLOG_CACHE_TTL', 3600)
+
+ALL_TYPES = tuple(st.key for st in SUBMISSION_TYPES)
+
+# Moves whenever a FacultyUser or FacultyProfile is saved or deleted.
+FACULTY_GENERATION = 'faculty'
+
+# Moves only when a submission enters, leaves or changes review status (queues_changed()).
+BACKLOG_GENERATION = 'backlog'
+
+
+def _generation_key(name):
+    return f'accounts:generation:{name}'
+
+
+def user_generation_name(user_id):
+    return f'user:{user_id}'
+
+
+def generations(names):
+    """
+    Current generations of the named counters (submission type keys,
+    user_generation_name()s, ...), in order, read with one get_many round
+    trip. Missing counters start from the clock rather than 1, so a counter
+    evicted from the cache can never come back at a value whose old entries
+    are still cached.
+    """
+
+    keys = [_generation_key(name) for name in names]
+    found = cache.get_many(keys)
+    missing = [key for key in keys if key not in found]
+    if missing:
+        for key in missing:
+            cache.add(key, time.time_ns(), None)
+        found.update(cache.get_many(missing))
+    return tuple(found[key] for key in keys)
+
+
+def bump_generation(name):
+    try:
+        cache.incr(_generation_key(name))
+    except ValueError:
+        cache.set(_generation_key(name), time.time_ns(), None)
+
+
+def user_generation(user):
+    """Generation of everything `user` has submitted; moves whenever one of their submissions changes."""
+    return generations((user_generation_name(user.pk),))[0]
+
+
+def generation_key(name, generation_names=ALL_TYPES, *parts):
+    """Cache key for `name` (plus any extra `parts`) at the current values of the named generations."""
+
+    stamp = '.'.join(str(value) for value in generations(generation_names))
+    if len(generation_names) > 1:
+        stamp = hashlib.md5(stamp.encode()).hexdigest()
+    return ':'.join(['accounts', name, *map(str, parts), stamp])
+
+
+def generation_etag(generation_names, *parts):
+    """
+    Strong ETag for a response computed from the named generations (plus
+    any request specific `parts`). Costs one cache read, no database query.
+    """
+
+    stamp = '.'.join(str(value) for value in generations(generation_names))
+    return hashlib.md5(':'.join([stamp, *map(str, parts)]).encode()).hexdigest()
+
+
+def cached(name, compute, timeout, generation_names=ALL_TYPES, *parts):
+    """
+    Returns compute() cached under generation_key(name, generation_names, *parts).
+    Inside a transaction the value is computed but not stored: it may see rows
+    that are later rolled back, and a rollback does not move any generation.
+    """
+
+    if transaction.get_connection().in_atomic_block:
+        return compute()
+    return cache.get_or_set(generation_key(name, generation_names, *parts), compute, timeout)
+
+
+def dean_analytics():
+    """The four institution-wide counters polled by the dean dashboard, from one aggregate query."""
+
+    def compute():
+        counts = aggregate_submissions()
+        return {
+            'approved': counts['approved'],
+            'pending': counts['pending'],
+            'revision': counts['revision'],
+            'total': counts['total'],
+        }
+
+    return cached('dean_analytics', compute, DEAN_ANALYTICS_TTL)
+
+
+def dean_review_stats(model):
+    """
+    The total / approved / rejected counters shown beside a dean review page,
+    computed for one submission model with a single conditional aggregate and
+    cached until that model's generation moves.
+    """
+
+    st = get_submission_type(model)
+
+    def compute():
+        return st.model.objects.aggregate(
+            total=Count('pk'),
+            approved=Count('pk', filter=Q(dean_status='approved')),
+            rejected=Count('pk', filter=Q(dean_status='rejected')),
+        )
+
+    return cached('review_stats', compute, REVIEW_STATS_TTL, (st.key,))
+
+
+def institution_stats():
+    """Institution-wide counters for the research form landing page, from one aggregate query."""
+
+    def compute():
+        counts = aggregate_submissions()
+        return {
+            'total': counts['total'],
+            'pending': counts['pending'],
+            'cluster_approved': counts['cluster_approved'],
+            'approved': counts['approved'],
+        }
+
+    return cached('institution_stats', compute, INSTITUTION_STATS_TTL)
+
+
+def submission_changed(instance, old_state, new_state):
+    """
+    Moves the generations of the instance's submission type and of its owner
+    (both owners, if it changed hands) once the current transaction commits,
+    so concurrent readers cannot re-cache values computed from before the
+    change. `old_state` / `new_state` are the
+    (user_id, cluster_head_status, dean_status) the row moved between.
+    """
+
+    submissions_changed(
+        [get_submission_type(instance).key],
+        [state[0] for state in (old_state, new_state) if state],
+    )
+
+
+def submissions_changed(type_keys, user_ids):
+    """Bulk form of submission_changed(): one bump per type and owner, after commit."""
+
+    names = set(type_keys)
+    names.update(user_generation_name(user_id) for user_id in user_ids if user_id)
+
+    def bump():
+        for name in names:
+            bump_generation(name)
+
+    transaction.on_commit(bump)
+
+
+def queues_changed():
+    """Moves the backlog generation once the current transaction commits: a queue gained, lost or moved entries."""
+    transaction.on_commit(lambda: bump_generation(BACKLOG_GENERATION))
@@ -0,0 +1,175 @@
+# accounts/claims.py
+"""
+Lease-based distribution of the cluster head queue.
+
+Every cluster head sees the same 'submitted' queue, so without coordination
+two of them regularly open the same submission and review it twice. Instead
+a reviewer claims the next N unclaimed entries, oldest first: claim_next()
+stamps claimed_by / claim_expires_at on their SubmissionIndex rows with one
+conditional UPDATE that only matches entries nobody holds, so two reviewers
+claiming at the same moment never end up with the same submission (on
+PostgreSQL the candidates are also picked with SKIP LOCKED, so concurrent
+claims do not wait on each other).
+
+Claims are leases. They lapse REVIEW_CLAIM_LEASE seconds after they were
+taken or last renewed (opening the review page renews it), after which the
+entry is back in the pool without any cleanup job, and a decision releases
+it. While a lease is live, other cluster heads cannot decide the entry: the
+bulk review skips it (held_by_others) and the review page refuses the
+decision (claim_holder). How many entries a reviewer may hold is capped at their share of the
+queue (queue size / number of cluster heads), so the work is spread by
+current load rather than going to whoever asks first.
+"""
+
+import math
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection, transaction
+from django.db.models import Count, Q
+from django.utils import timezone
+
+from .models import FacultyUser, SubmissionIndex
+from .submission_index import cluster_head_queue
+from .submissions import SUBMISSION_TYPES_BY_KEY, get_submission_type
+
+
+CLAIM_LEASE = getattr(settings, 'REVIEW_CLAIM_LEASE', 30 * 60)
+CLAIM_BATCH = getattr(settings, 'REVIEW_CLAIM_BATCH', 10)
+CLAIM_MAX_BATCH = 50
+
+# Rounds of claim_next() when concurrent reviewers took some of the picked entries first.
+CLAIM_ATTEMPTS = 3
+
+# Oldest first, so no submission is left waiting behind newer ones.
+CLAIM_ORDERING = ('submitted_at', 'content_type_id', 'object_id')
+
+
+def unclaimed(queryset, now=None):
+    """Entries of `queryset` nobody holds a live lease on."""
+    return queryset.filter(Q(claimed_by__isnull=True) | Q(claim_expires_at__lte=now or timezone.now()))
+
+
+def held_by(queryset, reviewer, now=None):
+    """Entries of `queryset` `reviewer` holds a live lease on."""
+    return queryset.filter(claimed_by=reviewer, claim_expires_at__gt=now or timezone.now())
+
+
+def claim_summary(reviewer, now=None):
+    """Queue size, free entries, entries held by `reviewer` and how many more they may claim."""
+
+    now = now or timezone.now()
+    counts = cluster_head_queue().aggregate(
+        total=Count('id'),
+        unclaimed=Count('id', filter=Q(claimed_by__isnull=True) | Q(claim_expires_at__lte=now)),
+        mine=Count('id', filter=Q(claimed_by=reviewer, claim_expires_at__gt=now)),
+    )
+    reviewers = max(FacultyUser.objects.filter(role='cluster_head').count(), 1)
+    share = max(math.ceil(counts['total'] / reviewers), 1)
+    counts['claimable'] = min(max(share - counts['mine'], 0), counts['unclaimed'])
+    return counts
+
+
+def claim_next(reviewer, count=CLAIM_BATCH):
+    """
+    Leases up to `count` of the oldest unclaimed queue entries to `reviewer`,
+    within their share of the queue. Returns how many were claimed.
+    """
+
+    now = timezone.now()
+    expires_at = now + timedelta(seconds=CLAIM_LEASE)
+    wanted = min(count, CLAIM_MAX_BATCH, claim_summary(reviewer, now)['claimable'])
+
+    claimed = 0
+    for _ in range(CLAIM_ATTEMPTS):
+        if claimed >= wanted:
+            break
+        with transaction.atomic():
+            candidates = unclaimed(cluster_head_queue(), now).order_by(*CLAIM_ORDERING)
+            if connection.features.has_select_for_update_skip_locked:
+                candidates = candidates.select_for_update(skip_locked=True)
+            pks = list(candidates.values_list('pk', flat=True)[:wanted - claimed])
+            if not pks:
+                break
+            # Re-checks the entries are still free; anything another reviewer got first is skipped.
+            claimed += unclaimed(SubmissionIndex.objects.filter(pk__in=pks, status='submitted'), now).update(
+                claimed_by=reviewer, claim_expires_at=expires_at,
+            )
+    return claimed
+
+
+def release_claims(reviewer):
+    """Hands every entry `reviewer` holds back to the pool. Returns how many were released."""
+    return held_by(SubmissionIndex.objects.all(), reviewer).update(claimed_by=None, claim_expires_at=None)
+
+
+def renew_claim(reviewer, submission):
+    """
+    Extends `reviewer`'s lease on `submission`, if they hold it. Returns the
+    FacultyUser holding a live lease on it when that is someone else, else None.
+    """
+
+    now = timezone.now()
+    entries = SubmissionIndex.objects.filter(
+        content_type=ContentType.objects.get_for_model(submission),
+        object_id=submission.pk,
+    )
+    if reviewer is not None and held_by(entries, reviewer, now).update(claim_expires_at=now + timedelta(seconds=CLAIM_LEASE)):
+        return None
+    return claim_holder(reviewer, submission, now)
+
+
+def claim_holder(reviewer, submission, now=None):
+    """The FacultyUser other than `reviewer` holding a live lease on `submission`, or None."""
+
+    entry = (
+        SubmissionIndex.objects.filter(
+            content_type=ContentType.objects.get_for_model(submission),
+            object_id=submission.pk,
+            claim_expires_at__gt=now or timezone.now(),
+        )
+        .exclude(claimed_by=reviewer)
+        .select_related('claimed_by')
+        .first()
+    )
+    return entry.claimed_by if entry else None
+
+
+def held_by_others(reviewer, items, now=None):
+    """(type key, pk) of the `items` ((type key, pk, ...) tuples) another reviewer holds a live lease on."""
+
+    pks_by_type = {}
+    for key, pk, *_ in items:
+        try:
+            pk = int(pk)
+        except (TypeError, ValueError):
+            continue
+        if key in SUBMISSION_TYPES_BY_KEY:
+            pks_by_type.setdefault(SUBMISSION_TYPES_BY_KEY[key], set()).add(pk)
+    if not pks_by_type:
+        return set()
+
+    wanted = Q()
+    for st, pks in pks_by_type.items():
+        wanted |= Q(content_type=ContentType.objects.get_for_model(st.model), object_id__in=pks)
+    entries = (
+        SubmissionIndex.objects.filter(wanted, claimed_by__isnull=False, claim_expires_at__gt=now or timezone.now())
+        .exclude(claimed_by=reviewer)
+        .values_list('content_type_id', 'object_id')
+    )
+    return {
+        (get_submission_type(ContentType.objects.get_for_id(content_type_id).model_class()).key, object_id)
+        for content_type_id, object_id in entries
+    }
+
+
+def annotate_claims(submissions, now=None):
+    """Sets `claim_holder` on hydrated queue submissions: the FacultyUser with a live lease, or None."""
+
+    now = now or timezone.now()
+    for submission in submissions:
+        entry = submission.index_entry
+        live = entry.claimed_by_id is not None and entry.claim_expires_at and entry.claim_expires_at > now
+        submission.claim_holder = entry.claimed_by if live else None
+    return submissions
@@ -0,0 +1,23 @@
+# accounts/decorators.py
+
+from functools import wraps
+
+from django.shortcuts import redirect
+
+from .middleware import get_faculty_user
+
+
+def faculty_login_required(view_func):
+    """
+    Redirects to the login page unless the session belongs to an existing
+    FacultyUser. Inside the view `request.faculty_user` is then always a real
+    user, loaded once for the whole request by CurrentUserMiddleware.
+    """
+
+    @wraps(view_func)
+    def wrapper(request, *args, **kwargs):
+        if get_faculty_user(request) is None:
+            return redirect('login')
+        return view_func(request, *args, **kwargs)
+
+    return wrapper
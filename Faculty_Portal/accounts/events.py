@@ -0,0 +1,89 @@
+# accounts/events.py
+"""
+Server-Sent Events stream behind the dean and cluster head dashboards.
+
+Each open dashboard holds one long-lived response, served by the uvicorn
+workers gunicorn runs over Faculty_Portal/asgi.py (see the Procfile). Every
+SSE_CHECK_INTERVAL seconds the stream reads the 13 submission generations
+from the cache, which costs no database query and runs in the shared thread
+pool (thread_sensitive=False), so open streams poll in parallel instead of
+queueing on the one thread sync code gets by default. Only when one of them
+has moved does it recompute the numbers the dashboard shows, through the
+same generation-keyed cache every other connection shares, and push:
+
+- ``queue``: the reviewer's queue depth and how many entries were added
+- ``analytics``: the dean analytics counters plus their change (deans only)
+
+Idle dashboards only receive a comment line now and then as a keep-alive.
+Streams end after SSE_MAX_DURATION seconds; EventSource reconnects on its own.
+The recompute touches the database, so it stays thread sensitive: Django's
+connections belong to the thread that opened them.
+"""
+
+import asyncio
+import json
+import time
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+
+from .cache import ALL_TYPES, cached, dean_analytics, generations
+from .submission_index import cluster_head_queue, dean_queue
+
+
+SSE_CHECK_INTERVAL = getattr(settings, 'SSE_CHECK_INTERVAL', 2)
+SSE_HEARTBEAT_INTERVAL = 15
+SSE_MAX_DURATION = getattr(settings, 'SSE_MAX_DURATION', 300)
+SSE_RETRY_MS = 5000
+
+QUEUE_DEPTH_TTL = 300
+
+REVIEW_QUEUES = {
+    'dean': dean_queue,
+    'cluster_head': cluster_head_queue,
+}
+
+
+def queue_depth(role):
+    """Number of submissions waiting in a reviewer role's queue, cached per submission generation."""
+    return cached('queue_depth', lambda: REVIEW_QUEUES[role]().count(), QUEUE_DEPTH_TTL, ALL_TYPES, role)
+
+
+def _dashboard_state(role):
+    return queue_depth(role), dean_analytics() if role == 'dean' else None
+
+
+def format_event(event, data):
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+async def dashboard_event_stream(role):
+    """Async iterator of SSE frames for a reviewer with `role` ('dean' or 'cluster_head')."""
+
+    read_generations = sync_to_async(generations, thread_sensitive=False)
+    seen_generations = await read_generations(ALL_TYPES)
+    depth, analytics = await sync_to_async(_dashboard_state)(role)
+
+    yield f"retry: {SSE_RETRY_MS}\n\n"
+
+    started = last_sent = time.monotonic()
+    while time.monotonic() - started < SSE_MAX_DURATION:
+        await asyncio.sleep(SSE_CHECK_INTERVAL)
+
+        current = await read_generations(ALL_TYPES)
+        if current != seen_generations:
+            seen_generations = current
+            new_depth, new_analytics = await sync_to_async(_dashboard_state)(role)
+
+            if new_depth != depth:
+                yield format_event('queue', {'queue': role, 'size': new_depth, 'added': max(new_depth - depth, 0)})
+                last_sent = time.monotonic()
+            if new_analytics is not None and new_analytics != analytics:
+                delta = {name: new_analytics[name] - analytics[name] for name in new_analytics}
+                yield format_event('analytics', {**new_analytics, 'delta': delta})
+                last_sent = time.monotonic()
+            depth, analytics = new_depth, new_analytics
+
+        if time.monotonic() - last_sent >= SSE_HEARTBEAT_INTERVAL:
+            yield ": keep-alive\n\n"
+            last_sent = time.monotonic()
@@ -0,0 +1,85 @@
+import time
+
+from django.core import mail
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext, override_settings
+
+from accounts.management.utils import rolled_back
+from accounts.notifications import decision_messages, send_decision_messages
+from accounts.review import REVIEW_STAGES, apply_review, apply_reviews
+from accounts.submissions import SUBMISSION_TYPES, SUBMISSION_TYPES_BY_KEY, get_submission_type
+
+
+class Command(BaseCommand):
+    help = (
+        "Compares a dean sign-off of --items submissions decided one review page at a time "
+        "(one load, UPDATE and counter update per submission, no e-mail, as dean_review does) "
+        "with the batch sign-off, which also sends one summary e-mail per faculty member. "
+        "Each run happens in a transaction that is rolled back; submissions are cloned from "
+        "existing ones when the dean queue is shorter than --items, and e-mail goes to the "
+        "in-memory backend."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--items', type=int, default=500, help="Submissions to sign off.")
+        parser.add_argument('--decision', choices=sorted(REVIEW_STAGES['dean'].decisions), default='approve')
+
+    def handle(self, *args, **options):
+        runs = [('per item', self.one_by_one), ('batch', self.batch)]
+
+        self.stdout.write(f"Dean sign-off of {options['items']} submissions ({options['decision']})")
+        self.stdout.write(f"{'mode':<10} {'applied':>8} {'queries':>8} {'ms':>9} {'e-mails':>8}")
+        with override_settings(EMAIL_BACKEND='django.core.mail.backends.locmem.EmailBackend'):
+            for name, run in runs:
+                with rolled_back():
+                    items = self.dean_queue(options['items'])
+                    mail.outbox = []
+                    with CaptureQueriesContext(connection) as queries:
+                        start = time.perf_counter()
+                        applied = run([(key, pk, options['decision'], 'Benchmark sign-off') for key, pk in items])
+                        elapsed = time.perf_counter() - start
+                    emails = len(mail.outbox)
+                self.stdout.write(
+                    f"{name:<10} {applied:>8} {len(queries.captured_queries):>8} {elapsed * 1000:>9.1f} {emails:>8}"
+                )
+
+    def one_by_one(self, items):
+        """What the dean_review_* pages do: load and decide each submission on its own; they send no e-mail."""
+
+        applied = 0
+        for key, pk, decision, remarks in items:
+            st = SUBMISSION_TYPES_BY_KEY[key]
+            apply_review(st.model.objects.get(pk=pk), 'dean', decision, remarks)
+            applied += 1
+        return applied
+
+    def batch(self, items):
+        outcomes = apply_reviews('dean', items)
+        send_decision_messages(decision_messages('dean', outcomes))
+        return sum(outcome.outcome == 'applied' for outcome in outcomes)
+
+    def dean_queue(self, count):
+        """(type key, pk) of `count` submissions waiting for the dean, cloning existing ones as needed."""
+
+        items = []
+        for st in SUBMISSION_TYPES:
+            pks = st.model.objects.filter(**{st.status_field: 'approved_by_cluster'}).values_list('pk', flat=True)
+            items += [(st.key, pk) for pk in pks[:count - len(items)]]
+
+        sources = [submission for st in SUBMISSION_TYPES for submission in st.model.objects.all()[:10]]
+        if len(items) < count and not sources:
+            raise CommandError("There are no submissions to sign off or to clone.")
+
+        # The clones go through save(), so the stats and index signals see them.
+        while len(items) < count:
+            submission = sources[len(items) % len(sources)]
+            st = get_submission_type(submission)
+            submission.pk = None
+            submission._state.adding = True
+            setattr(submission, st.status_field, 'approved_by_cluster')
+            submission.cluster_head_status = 'approved'
+            submission.dean_status = 'pending'
+            submission.save()
+            items.append((st.key, submission.pk))
+        return items
@@ -0,0 +1,88 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext, override_settings
+
+from accounts.models import FacultyUser
+
+
+ENGINES = {
+    'db': 'django.contrib.sessions.backends.db',
+    'cached_db': 'django.contrib.sessions.backends.cached_db',
+    'cache': 'django.contrib.sessions.backends.cache',
+}
+
+SLIDING_MIDDLEWARE = 'accounts.middleware.SlidingSessionMiddleware'
+
+
+class Command(BaseCommand):
+    help = (
+        "Replays authenticated requests against each session engine and reports the "
+        "django_session reads and writes per request, comparing sliding expiry with "
+        "SESSION_SAVE_EVERY_REQUEST. Cache-backed engines use the configured default cache."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--email', help="User to log in as (default: the first verified user).")
+        parser.add_argument('--url', default='/analytics_api/', help="URL to request.")
+        parser.add_argument('--requests', type=int, default=50, help="Requests per configuration.")
+
+    def handle(self, *args, **options):
+        users = FacultyUser.objects.filter(is_verified=True)
+        if options['email']:
+            users = users.filter(email=options['email'])
+        user = users.first()
+        if user is None:
+            raise CommandError("No matching verified user to log in as.")
+
+        self.stdout.write(f"{options['requests']} x GET {options['url']} as {user.email}")
+        self.stdout.write(f"{'engine':<10} {'expiry':<14} {'reads/req':>10} {'writes/req':>11} {'ms/req':>8}")
+
+        without_sliding = [name for name in settings.MIDDLEWARE if name != SLIDING_MIDDLEWARE]
+        modes = [
+            ('save-every', {'MIDDLEWARE': without_sliding, 'SESSION_SAVE_EVERY_REQUEST': True}),
+            ('sliding', {}),
+        ]
+        for engine_name, engine in ENGINES.items():
+            for mode_name, overrides in modes:
+                with override_settings(
+                    SESSION_ENGINE=engine, ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, 'testserver'], **overrides
+                ):
+                    reads, writes, elapsed = self.replay(user, options['url'], options['requests'])
+                count = options['requests']
+                self.stdout.write(
+                    f"{engine_name:<10} {mode_name:<14} {reads / count:>10.2f} "
+                    f"{writes / count:>11.2f} {elapsed * 1000 / count:>8.2f}"
+                )
+
+    def replay(self, user, url, count):
+        client = Client()
+        session = client.session
+        session['user_id'] = str(user.user_id)
+        session['user_role'] = user.role
+        session.set_expiry(1800)
+        session.save()
+        client.cookies[settings.SESSION_COOKIE_NAME] = session.session_key
+
+        client.get(url)  # warm-up: first refresh of the sliding timestamp, cache fill
+        reads = writes = 0
+        start = time.perf_counter()
+        with CaptureQueriesContext(connection) as queries:
+            for _ in range(count):
+                client.get(url)
+        elapsed = time.perf_counter() - start
+
+        for query in queries.captured_queries:
+            sql = query['sql'].lstrip().upper()
+            if 'DJANGO_SESSION' not in sql:
+                continue
+            if sql.startswith('SELECT'):
+                reads += 1
+            else:
+                writes += 1
+
+        session.delete()
+        return reads, writes, elapsed
@@ -0,0 +1,73 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from accounts.management.utils import rolled_back
+from accounts.models import User
+from accounts.submissions import SUBMISSION_TYPES, SUBMISSION_TYPES_BY_KEY
+
+
+def hot_queries(st, user_id):
+    """The per-model queries the review queues and dashboards run, as (name, queryset)."""
+
+    status = st.status_field
+    objects = st.model.objects
+    return [
+        ('cluster queue', objects.filter(**{status: 'submitted'}).order_by('-submitted_at')[:25]),
+        ('dean queue', objects.filter(**{status: 'approved_by_cluster'}).order_by('-submitted_at')[:25]),
+        ('user recent', objects.filter(user_id=user_id).order_by('-submitted_at')[:3]),
+        ('user pending', objects.filter(user_id=user_id, dean_status='pending').values('pk')),
+        ('cluster pending', objects.filter(cluster_head_status='pending').values('pk')),
+    ]
+
+
+class Command(BaseCommand):
+    help = (
+        "Prints EXPLAIN plans and timings of the hot submission queries with and without "
+        "the review indexes. The indexes are dropped inside a transaction that is rolled back, "
+        "so the schema is left untouched (requires a backend with transactional DDL)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--type', action='append', dest='types', choices=sorted(SUBMISSION_TYPES_BY_KEY),
+                            help="Submission type key to benchmark (repeatable; default: all).")
+        parser.add_argument('--repeat', type=int, default=20, help="Executions per query when timing.")
+
+    def handle(self, *args, **options):
+        if not connection.features.can_rollback_ddl:
+            raise CommandError(f"{connection.vendor} cannot roll back DDL; run this against SQLite or PostgreSQL.")
+
+        types = [SUBMISSION_TYPES_BY_KEY[key] for key in options['types']] if options['types'] else SUBMISSION_TYPES
+        user_id = User.objects.values_list('pk', flat=True).first() or 0
+
+        after = self.measure(types, user_id, options['repeat'])
+        # The atomic schema editor wraps everything in one transaction;
+        # rolling it back restores the dropped indexes.
+        with rolled_back(connection.schema_editor(atomic=True)) as schema_editor:
+            for st in types:
+                for index in st.model._meta.indexes:
+                    schema_editor.remove_index(st.model, index)
+            before = self.measure(types, user_id, options['repeat'])
+
+        for st in types:
+            self.stdout.write(self.style.MIGRATE_HEADING(f"{st.label} ({st.model._meta.db_table})"))
+            for name, _ in hot_queries(st, user_id):
+                plan_before, ms_before = before[(st.key, name)]
+                plan_after, ms_after = after[(st.key, name)]
+                self.stdout.write(f"  {name}: {ms_before:.3f} ms -> {ms_after:.3f} ms")
+                self.stdout.write(f"    before: {plan_before}")
+                self.stdout.write(f"    after:  {plan_after}")
+
+    def measure(self, types, user_id, repeat):
+        """Returns {(type key, query name): (one-line plan, mean milliseconds)}."""
+
+        results = {}
+        for st in types:
+            for name, queryset in hot_queries(st, user_id):
+                plan = ' | '.join(line.strip() for line in queryset.explain().splitlines())
+                start = time.perf_counter()
+                for _ in range(repeat):
+                    list(queryset.all())
+                results[(st.key, name)] = (plan, (time.perf_counter() - start) * 1000 / repeat)
+        return results
@@ -0,0 +1,98 @@
+import statistics
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.template import Engine
+from django.test import Client
+from django.test.utils import override_settings
+from django.urls import reverse
+
+from accounts.models import FacultyUser
+from accounts.template_warmup import reset_templates, template_names, warm_templates
+
+
+DASHBOARDS = {
+    'dean': 'dean_dashboard',
+    'cluster_head': 'cluster_head_dashboard',
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Measures template compile time with an empty cached loader, and the latency of a "
+        "worker's first request to a page with and without the boot-time template warm-up."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--email', help="User to log in as (default: the first verified user).")
+        parser.add_argument('--url', action='append',
+                            help="URL to request; repeatable (default: the user's dashboard).")
+        parser.add_argument('--repeat', type=int, default=5, help="Runs per measurement; the median is reported.")
+        parser.add_argument('--top', type=int, default=10, help="How many of the slowest templates to list.")
+
+    def handle(self, *args, **options):
+        engine = Engine.get_default()
+        repeat = options['repeat']
+
+        self.stdout.write(f"{'template':<48} {'compile ms':>11} {'cached ms':>10}")
+        timings = []
+        for name in template_names(engine):
+            cold = self.median(repeat, lambda: reset_templates(engine), lambda: engine.get_template(name))
+            cached = self.median(repeat, lambda: None, lambda: engine.get_template(name))
+            timings.append((cold, cached, name))
+        timings.sort(reverse=True)
+        for cold, cached, name in timings[:options['top']]:
+            self.stdout.write(f"{name:<48} {cold * 1000:>11.2f} {cached * 1000:>10.3f}")
+        self.stdout.write(
+            f"{f'all {len(timings)} templates':<48} {sum(t[0] for t in timings) * 1000:>11.2f} "
+            f"{sum(t[1] for t in timings) * 1000:>10.3f}"
+        )
+
+        warmed_count, warm_up = warm_templates(engine)
+        self.stdout.write(f"\nBoot-time warm-up: {warmed_count} templates in {warm_up * 1000:.1f} ms\n")
+
+        user = self.pick_user(options['email'])
+        urls = options['url'] or [reverse(DASHBOARDS.get(user.role, 'dashboard'))]
+        self.stdout.write(f"First request as {user.email} (median of {repeat}):")
+        self.stdout.write(f"{'url':<40} {'cold ms':>9} {'warmed ms':>10} {'steady ms':>10}")
+
+        with override_settings(ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, 'testserver']):
+            client = self.login(user)
+            for url in urls:
+                response = client.get(url)  # URL resolver, middleware and query caches, not templates
+                if response.status_code != 200:
+                    raise CommandError(f"GET {url} returned {response.status_code}.")
+
+                cold = self.median(repeat, lambda: reset_templates(engine), lambda: client.get(url))
+                warmed = self.median(repeat, lambda: (reset_templates(engine), warm_templates(engine)),
+                                     lambda: client.get(url))
+                steady = self.median(repeat, lambda: None, lambda: client.get(url))
+                self.stdout.write(f"{url:<40} {cold * 1000:>9.2f} {warmed * 1000:>10.2f} {steady * 1000:>10.2f}")
+
+    def median(self, repeat, setup, run):
+        samples = []
+        for _ in range(repeat):
+            setup()
+            start = time.perf_counter()
+            run()
+            samples.append(time.perf_counter() - start)
+        return statistics.median(samples)
+
+    def pick_user(self, email):
+        users = FacultyUser.objects.filter(is_verified=True)
+        if email:
+            users = users.filter(email=email)
+        user = users.first()
+        if user is None:
+            raise CommandError("No matching verified user to log in as.")
+        return user
+
+    def login(self, user):
+        client = Client()
+        session = client.session
+        session['user_id'] = str(user.user_id)
+        session['user_role'] = user.role
+        session.save()
+        client.cookies[settings.SESSION_COOKIE_NAME] = session.session_key
+        return client
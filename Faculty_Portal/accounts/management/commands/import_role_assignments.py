@@ -0,0 +1,76 @@
+import csv
+import sys
+
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+from django.core.validators import validate_email
+from django.db import transaction
+
+from accounts.models import FacultyUser, RoleAssignment
+from accounts.roles import roles_changed
+
+
+class Command(BaseCommand):
+    help = (
+        "Bulk-loads the role roster from a CSV file of `email,role` rows (a header row is "
+        "optional; '-' reads standard input). Existing addresses get their role updated."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help="CSV file to import, or '-' for standard input.")
+        parser.add_argument('--replace', action='store_true',
+                            help="Also remove roster entries that are not in the file.")
+        parser.add_argument('--dry-run', action='store_true', help="Validate and report without writing.")
+
+    def handle(self, *args, **options):
+        roster = self.read(options['path'])
+
+        existing = dict(RoleAssignment.objects.values_list('email', 'role'))
+        added = [email for email in roster if email not in existing]
+        changed = [email for email in roster if email in existing and existing[email] != roster[email]]
+        removed = [email for email in existing if email not in roster] if options['replace'] else []
+
+        self.stdout.write(f"{len(roster)} row(s): {len(added)} new, {len(changed)} role change(s), {len(removed)} removal(s).")
+        if options['dry_run']:
+            return
+
+        with transaction.atomic():
+            RoleAssignment.objects.bulk_create(
+                [RoleAssignment(email=email, role=role) for email, role in roster.items()],
+                update_conflicts=True,
+                unique_fields=['email'],
+                update_fields=['role', 'updated_at'],
+            )
+            if removed:
+                RoleAssignment.objects.filter(email__in=removed).delete()
+            # bulk_create sends no signals; the workers notice the new updated_at / row count.
+            roles_changed()
+
+        self.stdout.write(self.style.SUCCESS("Role roster imported."))
+
+    def read(self, path):
+        """Returns {email: role} from the CSV, raising CommandError on the first bad row."""
+
+        valid_roles = {role for role, _ in FacultyUser.ROLE_CHOICES}
+        handle = sys.stdin if path == '-' else open(path, newline='', encoding='utf-8')
+        roster = {}
+        try:
+            for line_number, row in enumerate(csv.reader(handle), start=1):
+                if not row or not ''.join(row).strip():
+                    continue
+                if len(row) != 2:
+                    raise CommandError(f"line {line_number}: expected `email,role`, got {row!r}")
+                email, role = row[0].strip().lower(), row[1].strip()
+                if line_number == 1 and (email, role) == ('email', 'role'):
+                    continue
+                if role not in valid_roles:
+                    raise CommandError(f"line {line_number}: unknown role {role!r} (expected one of {sorted(valid_roles)})")
+                try:
+                    validate_email(email)
+                except ValidationError:
+                    raise CommandError(f"line {line_number}: invalid email {email!r}")
+                roster[email] = role
+        finally:
+            if handle is not sys.stdin:
+                handle.close()
+        return roster
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from accounts.submission_index import rebuild_submission_index
+
+
+class Command(BaseCommand):
+    help = "Recreates the SubmissionIndex table that backs the review queues from the submission tables."
+
+    def handle(self, *args, **options):
+        total = rebuild_submission_index()
+        self.stdout.write(self.style.SUCCESS(f"Indexed {total} submission(s)."))
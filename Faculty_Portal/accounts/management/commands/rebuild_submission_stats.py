@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from accounts.stats import compute_submission_stats, find_drift, rebuild_submission_stats
+
+
+class Command(BaseCommand):
+    help = "Recomputes the SubmissionStats counter table from the submission tables and reports drift."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--check',
+            action='store_true',
+            help="Only report drift between stored and recomputed counts; exit non-zero if any is found.",
+        )
+
+    def handle(self, *args, **options):
+        expected = compute_submission_stats()
+        drift = find_drift(expected=expected)
+
+        for (user_id, submission_type, cluster_head_status, dean_status), (stored, actual) in sorted(drift.items(), key=str):
+            self.stdout.write(
+                f"drift: user={user_id} type={submission_type} "
+                f"cluster_head={cluster_head_status} dean={dean_status} stored={stored} actual={actual}"
+            )
+
+        if options['check']:
+            if drift:
+                raise CommandError(f"{len(drift)} SubmissionStats bucket(s) out of sync.")
+            self.stdout.write(self.style.SUCCESS("SubmissionStats is in sync."))
+            return
+
+        buckets = rebuild_submission_stats(expected=expected)
+        self.stdout.write(self.style.SUCCESS(
+            f"Rebuilt {buckets} SubmissionStats bucket(s); corrected {len(drift)} drifted bucket(s)."
+        ))
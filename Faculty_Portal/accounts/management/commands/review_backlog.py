@@ -0,0 +1,55 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from accounts.backlog import BACKLOG_MAX_AGE, review_backlog
+from accounts.review import REVIEW_STAGES
+
+
+def parse_max_age(value):
+    """'dean=48' -> ('dean', 172800): a stage and its threshold given in hours."""
+
+    stage, _, hours = value.partition('=')
+    if stage not in REVIEW_STAGES:
+        raise ValueError(f"unknown stage {stage!r}")
+    return stage, round(float(hours) * 3600)
+
+
+class Command(BaseCommand):
+    help = (
+        "Prints the depth and oldest-item age of each review queue, per stage and submission type. "
+        "Exits with status 2 when a stage's oldest submission is older than its threshold "
+        "(--max-age, default REVIEW_BACKLOG_MAX_AGE), so it can drive an alert from cron."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--max-age', action='append', type=parse_max_age, default=[], metavar='STAGE=HOURS',
+                            help="Age threshold of a stage's oldest submission, e.g. dean=48 (repeatable).")
+        parser.add_argument('--json', action='store_true', help="Print the report as JSON.")
+
+    def handle(self, *args, **options):
+        max_age = {**BACKLOG_MAX_AGE, **dict(options['max_age'])}
+        report = review_backlog(max_age)
+
+        if options['json']:
+            self.stdout.write(json.dumps(report, indent=2))
+        else:
+            self.stdout.write(f"{'stage / type':<28} {'depth':>6} {'oldest age':>12}  oldest queued at")
+            for name, stage in report['stages'].items():
+                line = f"{name:<28} {stage['depth']:>6} {self.hours(stage['oldest_age_seconds']):>12}  {stage['oldest_queued_at'] or '-'}"
+                self.stdout.write(self.style.ERROR(line) if stage['over_threshold'] else self.style.MIGRATE_HEADING(line))
+                for key, counts in stage['types'].items():
+                    self.stdout.write(
+                        f"  {key:<26} {counts['depth']:>6} {self.hours(counts['oldest_age_seconds']):>12}  "
+                        f"{counts['oldest_queued_at'] or '-'}"
+                    )
+
+        over = [
+            f"{name} ({self.hours(stage['oldest_age_seconds'])} > {self.hours(stage['max_age_seconds'])})"
+            for name, stage in report['stages'].items() if stage['over_threshold']
+        ]
+        if over:
+            raise CommandError(f"Oldest submission over the age threshold: {', '.join(over)}.", returncode=2)
+
+    def hours(self, seconds):
+        return '-' if seconds is None else f"{seconds / 3600:.1f} h"
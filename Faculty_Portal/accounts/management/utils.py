@@ -0,0 +1,27 @@
+# accounts/management/utils.py
+"""Helpers shared by the accounts management commands."""
+
+from contextlib import contextmanager
+
+from django.db import transaction
+
+
+class _Rollback(Exception):
+    pass
+
+
+@contextmanager
+def rolled_back(context=None):
+    """
+    Runs the block inside `context` (a new transaction.atomic() by default, or
+    e.g. an atomic schema editor) and then rolls everything it did back by
+    raising out of it. Yields what `context` yields; errors raised by the
+    block itself still propagate.
+    """
+
+    try:
+        with context if context is not None else transaction.atomic() as value:
+            yield value
+            raise _Rollback
+    except _Rollback:
+        pass
@@ -0,0 +1,142 @@
+# accounts/middleware.py
+"""
+Request-scoped access to the logged-in FacultyUser and FacultyProfile.
+
+Authentication is session based (`request.session['user_id']` holds the
+user's UUID), so every view used to run its own
+``FacultyUser.objects.get(user_id=...)`` and often a separate profile query.
+CurrentUserMiddleware instead attaches lazy `request.faculty_user` and
+`request.faculty_profile` attributes: the first access loads both with one
+``select_related`` query, later accesses in the same request are free.
+
+With FACULTY_USER_CACHE_TTL > 0 the loaded pair is also kept in a small
+per-process cache keyed by user_id for that many seconds. Each entry is
+stamped with the shared FACULTY_GENERATION (accounts/cache.py) it was loaded
+at, and is only used while that generation is still current. Saving or
+deleting a FacultyUser or FacultyProfile drops the entry in the writing
+process and moves the generation on commit (see accounts/signals.py), so a
+role change or deactivation reaches every worker process on its next
+request. A hit costs one shared cache read instead of a database query.
+
+SlidingSessionMiddleware keeps logged-in sessions alive without rewriting
+the session store on every request.
+"""
+
+import copy
+import threading
+import time
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.utils.functional import SimpleLazyObject
+
+from .cache import FACULTY_GENERATION, generations
+from .models import FacultyProfile, FacultyUser
+
+
+FACULTY_USER_CACHE_TTL = getattr(settings, 'FACULTY_USER_CACHE_TTL', 30)
+FACULTY_USER_CACHE_SIZE = 1000
+
+_cache = {}
+_cache_lock = threading.Lock()
+
+
+def _load(user_id):
+    """Returns (user, profile) for a session user_id; (None, None) if it no longer exists."""
+
+    if FACULTY_USER_CACHE_TTL:
+        # Read before the query, so a change committed meanwhile invalidates what we store.
+        generation = generations((FACULTY_GENERATION,))[0]
+        with _cache_lock:
+            entry = _cache.get(user_id)
+        if entry and entry[0] > time.monotonic() and entry[1] == generation:
+            # Copies, so a view editing its instances cannot leak into other requests.
+            return copy.copy(entry[2]), copy.copy(entry[3])
+
+    try:
+        user = FacultyUser.objects.select_related('facultyprofile').get(user_id=user_id)
+    except (FacultyUser.DoesNotExist, ValidationError):
+        return None, None
+    try:
+        profile = user.facultyprofile
+    except FacultyProfile.DoesNotExist:
+        profile = None
+
+    if FACULTY_USER_CACHE_TTL:
+        now = time.monotonic()
+        with _cache_lock:
+            if len(_cache) >= FACULTY_USER_CACHE_SIZE:
+                for key in [key for key, entry in _cache.items() if entry[0] <= now]:
+                    del _cache[key]
+            _cache[user_id] = (now + FACULTY_USER_CACHE_TTL, generation, user, profile)
+        return copy.copy(user), copy.copy(profile)
+    return user, profile
+
+
+def forget_faculty_user(pk):
+    """Drops the per-process cache entry of the FacultyUser with primary key `pk`."""
+
+    with _cache_lock:
+        for key in [key for key, entry in _cache.items() if entry[2].pk == pk]:
+            del _cache[key]
+
+
+def _current(request):
+    if not hasattr(request, '_faculty_user_cache'):
+        user_id = request.session.get('user_id')
+        request._faculty_user_cache = _load(str(user_id)) if user_id else (None, None)
+    return request._faculty_user_cache
+
+
+def get_faculty_user(request):
+    """The logged-in FacultyUser, or None. Loaded at most once per request."""
+    return _current(request)[0]
+
+
+def get_faculty_profile(request):
+    """The logged-in user's FacultyProfile, or None if there is no user or no profile yet."""
+    return _current(request)[1]
+
+
+class CurrentUserMiddleware:
+    """
+    Adds lazy `request.faculty_user` / `request.faculty_profile`. For requests
+    without a logged-in user (or profile) they wrap None, so code that has
+    not gone through @faculty_login_required should call get_faculty_user().
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        request.faculty_user = SimpleLazyObject(lambda: get_faculty_user(request))
+        request.faculty_profile = SimpleLazyObject(lambda: get_faculty_profile(request))
+        return self.get_response(request)
+
+
+SESSION_REFRESH_AFTER = getattr(settings, 'SESSION_REFRESH_AFTER', 0.5)
+
+
+class SlidingSessionMiddleware:
+    """
+    Sliding expiry for logged-in sessions. A session is saved (pushing its
+    expiry forward by its full age) only when SESSION_REFRESH_AFTER of that
+    age has passed since it was last refreshed. Every other request leaves it
+    unmodified, so it costs no write to the session store. The session still
+    expires after between (1 - SESSION_REFRESH_AFTER) and 1 times its age of
+    inactivity.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+
+        session = getattr(request, 'session', None)
+        if session is not None and 'user_id' in session:
+            now = int(time.time())
+            refreshed_at = session.get('_refreshed_at')
+            if refreshed_at is None or now - refreshed_at >= session.get_expiry_age() * SESSION_REFRESH_AFTER:
+                session['_refreshed_at'] = now
+        return response
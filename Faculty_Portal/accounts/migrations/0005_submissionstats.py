@@ -0,0 +1,58 @@
+# Generated by Django 5.2.7 on 2026-10-18 09:27
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count
+
+
+SUBMISSION_MODELS = {
+    'journal': 'JournalPublication',
+    'conference': 'ConferencePublication',
+    'research': 'ResearchProject',
+    'patent': 'Patents',
+    'copyright': 'Copyright',
+    'phd_guidance': 'PhdGuidance',
+    'book_chapter': 'BookChapter',
+    'books_authored': 'BooksAuthored',
+    'consultancy_project': 'ConsultancyProjects',
+    'editorial_roles': 'EditorialRoles',
+    'reviewer_roles': 'ReviewerRoles',
+    'awards_achievements': 'AwardsAchievements',
+    'industry_collaboration': 'IndustryCollaboration',
+}
+
+
+def populate_submission_stats(apps, schema_editor):
+    SubmissionStats = apps.get_model('accounts', 'SubmissionStats')
+    buckets = []
+    for key, model_name in SUBMISSION_MODELS.items():
+        model = apps.get_model('accounts', model_name)
+        rows = model.objects.values('user_id', 'cluster_head_status', 'dean_status').annotate(count=Count('pk')).order_by()
+        buckets.extend(SubmissionStats(submission_type=key, **row) for row in rows)
+    SubmissionStats.objects.bulk_create(buckets)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0004_alter_facultyprofile_emp_id'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SubmissionStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('submission_type', models.CharField(max_length=30)),
+                ('cluster_head_status', models.CharField(max_length=30)),
+                ('dean_status', models.CharField(max_length=30)),
+                ('count', models.IntegerField(default=0)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='submission_stats', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('user', 'submission_type', 'cluster_head_status', 'dean_status'), name='unique_submission_stats_bucket')],
+            },
+        ),
+        migrations.RunPython(populate_submission_stats, migrations.RunPython.noop),
+    ]
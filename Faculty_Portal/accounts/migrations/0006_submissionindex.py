@@ -0,0 +1,74 @@
+# Generated by Django 5.2.7 on 2026-10-18 09:29
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+# model name -> (title field, consolidated review status field)
+SUBMISSION_MODELS = {
+    'JournalPublication': ('title_of_paper', 'status'),
+    'ConferencePublication': ('title_of_paper', 'status'),
+    'ResearchProject': ('project_title', 'overall_status'),
+    'Patents': ('title_of_patent', 'status'),
+    'Copyright': ('title_of_work', 'status'),
+    'PhdGuidance': ('thesis_title', 'status'),
+    'BookChapter': ('chapter_title', 'status'),
+    'BooksAuthored': ('book_title', 'status'),
+    'ConsultancyProjects': ('project_title', 'status'),
+    'EditorialRoles': ('journal_name', 'status'),
+    'ReviewerRoles': ('journal_or_conference_name', 'status'),
+    'AwardsAchievements': ('title_of_award', 'status'),
+    'IndustryCollaboration': ('industry_name', 'status'),
+}
+
+
+def populate_submission_index(apps, schema_editor):
+    ContentType = apps.get_model('contenttypes', 'ContentType')
+    SubmissionIndex = apps.get_model('accounts', 'SubmissionIndex')
+    for model_name, (title_field, status_field) in SUBMISSION_MODELS.items():
+        model = apps.get_model('accounts', model_name)
+        content_type, _ = ContentType.objects.get_or_create(app_label='accounts', model=model_name.lower())
+        SubmissionIndex.objects.bulk_create([
+            SubmissionIndex(
+                content_type=content_type,
+                object_id=obj.pk,
+                user_id=obj.user_id,
+                title=(getattr(obj, title_field) or '')[:255],
+                status=getattr(obj, status_field),
+                cluster_head_status=obj.cluster_head_status,
+                dean_status=obj.dean_status,
+                submitted_at=obj.submitted_at,
+            )
+            for obj in model.objects.all().iterator()
+        ], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0005_submissionstats'),
+        ('contenttypes', '0002_remove_content_type_name'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SubmissionIndex',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('object_id', models.PositiveBigIntegerField()),
+                ('title', models.CharField(blank=True, max_length=255)),
+                ('status', models.CharField(max_length=30)),
+                ('cluster_head_status', models.CharField(max_length=30)),
+                ('dean_status', models.CharField(max_length=30)),
+                ('submitted_at', models.DateTimeField()),
+                ('content_type', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='contenttypes.contenttype')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='submission_index', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['status', '-submitted_at'], name='subindex_status_submitted'), models.Index(fields=['user', '-submitted_at'], name='subindex_user_submitted')],
+                'constraints': [models.UniqueConstraint(fields=('content_type', 'object_id'), name='unique_submission_index_entry')],
+            },
+        ),
+        migrations.RunPython(populate_submission_index, migrations.RunPython.noop),
+    ]
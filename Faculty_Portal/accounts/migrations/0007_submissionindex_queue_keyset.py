@@ -0,0 +1,22 @@
+# Generated by Django 5.2.7 on 2026-10-18 09:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0006_submissionindex'),
+        ('contenttypes', '0002_remove_content_type_name'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='submissionindex',
+            name='subindex_status_submitted',
+        ),
+        migrations.AddIndex(
+            model_name='submissionindex',
+            index=models.Index(fields=['status', '-submitted_at', '-content_type', '-object_id'], name='subindex_status_queue'),
+        ),
+    ]
@@ -0,0 +1,325 @@
+# Generated by Django 5.2.7 on 2026-10-18 09:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0007_submissionindex_queue_keyset'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='awardsachievements',
+            index=models.Index(fields=['status', 'submitted_at'], name='awards_status_sub_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='awardsachievements',
+            index=models.Index(fields=['user', 'submitted_at'], name='awards_user_sub_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='awardsachievements',
+            index=models.Index(fields=['user', 'dean_status'], name='awards_user_dean_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='awardsachievements',
+            index=models.Index(fields=['cluster_head_status'], name='awards_cluster_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='awardsachievements',
+            index=models.Index(condition=models.Q(('status', 'submitted')), fields=['submitted_at'], name='awards_cluster_queue_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='awardsachievements',
+            index=models.Index(condition=models.Q(('status', 'approved_by_cluster')), fields=['submitted_at'], name='awards_dean_queue_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='bookchapter',
+            index=models.Index(fields=['status', 'submitted_at'], name='bookchapter_status_sub_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='bookchapter',
+            index=models.Index(fields=['user', 'submitted_at'], name='bookchapter_user_sub_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='bookchapter',
+            index=models.Index(fields=['user', 'dean_status'], name='bookchapter_user_dean_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='bookchapter',
+            index=models.Index(fields=['cluster_head_status'], name='bookchapter_cluster_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='bookchapter',
+            index=models.Index(condition=models.Q(('status', 'submitted')), fields=['submitted_at'], name='bookchapter_cluster_queue_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='bookchapter',
+            index=models.Index(condition=models.Q(('status', 'approved_by_cluster')), fields=['submitted_at'], name='bookchapter_dean_queue_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='booksauthored',
+            index=models.Index(fields=['status', 'submitted_at'], name='booksauth_status_sub_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='booksauthored',
+            index=models.Index(fields=['user', 'submitted_at'], name='booksauth_user_sub_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='booksauthored',
+            index=models.Index(fields=['user', 'dean_status'], name='booksauth_user_dean_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='booksauthored',
+            index=models.Index(fields=['cluster_head_status'], name='booksauth_cluster_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='booksauthored',
+            index=models.Index(condition=models.Q(('status', 'submitted')), fields=['submitted_at'], name='booksauth_cluster_queue_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='booksauthored',
+            index=models.Index(condition=models.Q(('status', 'approved_by_cluster')), fields=['submitted_at'], name='booksauth_dean_queue_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='conferencepublication',
+            index=models.Index(fields=['status', 'submitted_at'], name='conference_status_sub_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='conferencepublication',
+            index=models.Index(fields=['user', 'submitted_at'], name='conference_user_sub_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='conferencepublication',
+            index=models.Index(fields=['user', 'dean_status'], name='conference_user_dean_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='conferencepublication',
+            index=models.Index(fields=['cluster_head_status'], name='conference_cluster_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='conferencepublication',
+            index=models.Index(condition=models.Q(('status', 'submitted')), fields=['submitted_at'], name='conference_cluster_queue_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='conferencepublication',
+            index=models.Index(condition=models.Q(('status', 'approved_by_cluster')), fields=['submitted_at'], name='conference_dean_queue_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='consultancyprojects',
+            index=models.Index(fields=['status', 'submitted_at'], name='consult_status_sub_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='consultancyprojects',
+            index=models.Index(fields=['user', 'submitted_at'], name='consult_user_sub_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='consultancyprojects',
+            index=models.Index(fields=['user', 'dean_status'], name='consult_user_dean_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='consultancyprojects',
+            index=models.Index(fields=['cluster_head_status'], name='consult_cluster_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='consultancyprojects',
+            index=models.Index(condition=models.Q(('status', 'submitted')), fields=['submitted_at'], name='consult_cluster_queue_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='consultancyprojects',
+            index=models.Index(condition=models.Q(('status', 'approved_by_cluster')), fields=['submitted_at'], name='consult_dean_queue_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='copyright',
+            index=models.Index(fields=['status', 'submitted_at'], name='copyright_status_sub_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='copyright',
+            index=models.Index(fields=['user', 'submitted_at'], name='copyright_user_sub_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='copyright',
+            index=models.Index(fields=['user', 'dean_status'], name='copyright_user_dean_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='copyright',
+            index=models.Index(fields=['cluster_head_status'], name='copyright_cluster_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='copyright',
+            index=models.Index(condition=models.Q(('status', 'submitted')), fields=['submitted_at'], name='copyright_cluster_queue_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='copyright',
+            index=models.Index(condition=models.Q(('status', 'approved_by_cluster')), fields=['submitted_at'], name='copyright_dean_queue_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='editorialroles',
+            index=models.Index(fields=['status', 'submitted_at'], name='editorial_status_sub_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='editorialroles',
+            index=models.Index(fields=['user', 'submitted_at'], name='editorial_user_sub_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='editorialroles',
+            index=models.Index(fields=['user', 'dean_status'], name='editorial_user_dean_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='editorialroles',
+            index=models.Index(fields=['cluster_head_status'], name='editorial_cluster_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='editorialroles',
+            index=models.Index(condition=models.Q(('status', 'submitted')), fields=['submitted_at'], name='editorial_cluster_queue_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='editorialroles',
+            index=models.Index(condition=models.Q(('status', 'approved_by_cluster')), fields=['submitted_at'], name='editorial_dean_queue_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='industrycollaboration',
+            index=models.Index(fields=['status', 'submitted_at'], name='industry_status_sub_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='industrycollaboration',
+            index=models.Index(fields=['user', 'submitted_at'], name='industry_user_sub_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='industrycollaboration',
+            index=models.Index(fields=['user', 'dean_status'], name='industry_user_dean_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='industrycollaboration',
+            index=models.Index(fields=['cluster_head_status'], name='industry_cluster_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='industrycollaboration',
+            index=models.Index(condition=models.Q(('status', 'submitted')), fields=['submitted_at'], name='industry_cluster_queue_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='industrycollaboration',
+            index=models.Index(condition=models.Q(('status', 'approved_by_cluster')), fields=['submitted_at'], name='industry_dean_queue_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='journalpublication',
+            index=models.Index(fields=['status', 'submitted_at'], name='journal_status_sub_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='journalpublication',
+            index=models.Index(fields=['user', 'submitted_at'], name='journal_user_sub_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='journalpublication',
+            index=models.Index(fields=['user', 'dean_status'], name='journal_user_dean_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='journalpublication',
+            index=models.Index(fields=['cluster_head_status'], name='journal_cluster_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='journalpublication',
+            index=models.Index(condition=models.Q(('status', 'submitted')), fields=['submitted_at'], name='journal_cluster_queue_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='journalpublication',
+            index=models.Index(condition=models.Q(('status', 'approved_by_cluster')), fields=['submitted_at'], name='journal_dean_queue_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='patents',
+            index=models.Index(fields=['status', 'submitted_at'], name='patent_status_sub_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='patents',
+            index=models.Index(fields=['user', 'submitted_at'], name='patent_user_sub_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='patents',
+            index=models.Index(fields=['user', 'dean_status'], name='patent_user_dean_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='patents',
+            index=models.Index(fields=['cluster_head_status'], name='patent_cluster_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='patents',
+            index=models.Index(condition=models.Q(('status', 'submitted')), fields=['submitted_at'], name='patent_cluster_queue_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='patents',
+            index=models.Index(condition=models.Q(('status', 'approved_by_cluster')), fields=['submitted_at'], name='patent_dean_queue_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='phdguidance',
+            index=models.Index(fields=['status', 'submitted_at'], name='phd_status_sub_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='phdguidance',
+            index=models.Index(fields=['user', 'submitted_at'], name='phd_user_sub_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='phdguidance',
+            index=models.Index(fields=['user', 'dean_status'], name='phd_user_dean_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='phdguidance',
+            index=models.Index(fields=['cluster_head_status'], name='phd_cluster_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='phdguidance',
+            index=models.Index(condition=models.Q(('status', 'submitted')), fields=['submitted_at'], name='phd_cluster_queue_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='phdguidance',
+            index=models.Index(condition=models.Q(('status', 'approved_by_cluster')), fields=['submitted_at'], name='phd_dean_queue_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='researchproject',
+            index=models.Index(fields=['overall_status', 'submitted_at'], name='research_status_sub_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='researchproject',
+            index=models.Index(fields=['user', 'submitted_at'], name='research_user_sub_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='researchproject',
+            index=models.Index(fields=['user', 'dean_status'], name='research_user_dean_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='researchproject',
+            index=models.Index(fields=['cluster_head_status'], name='research_cluster_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='researchproject',
+            index=models.Index(condition=models.Q(('overall_status', 'submitted')), fields=['submitted_at'], name='research_cluster_queue_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='researchproject',
+            index=models.Index(condition=models.Q(('overall_status', 'approved_by_cluster')), fields=['submitted_at'], name='research_dean_queue_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='reviewerroles',
+            index=models.Index(fields=['status', 'submitted_at'], name='reviewer_status_sub_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='reviewerroles',
+            index=models.Index(fields=['user', 'submitted_at'], name='reviewer_user_sub_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='reviewerroles',
+            index=models.Index(fields=['user', 'dean_status'], name='reviewer_user_dean_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='reviewerroles',
+            index=models.Index(fields=['cluster_head_status'], name='reviewer_cluster_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='reviewerroles',
+            index=models.Index(condition=models.Q(('status', 'submitted')), fields=['submitted_at'], name='reviewer_cluster_queue_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='reviewerroles',
+            index=models.Index(condition=models.Q(('status', 'approved_by_cluster')), fields=['submitted_at'], name='reviewer_dean_queue_idx'),
+        ),
+    ]
@@ -0,0 +1,72 @@
+# Generated by Django 5.2.7 on 2026-10-18 09:38
+
+from django.db import migrations, models
+
+
+# The roster previously hard-coded in settings.DEAN_EMAIL / CLUSTER_HEAD_EMAIL /
+# FACULTY_EMAIL, so existing deployments keep accepting the same sign-ups.
+INITIAL_ROSTER = {
+    'dean': [
+        'shamik.tiwari@iilm.edu',
+    ],
+    'cluster_head': [
+        'amar.shukla@iilm.edu',
+        'umang.garg@iilm.edu',
+        'akshat.agrawal@iilm.edu',
+    ],
+    'faculty': [
+        'puja.acharya@iilm.edu',
+        'pallavi.pandey@iilm.edu',
+        'sonam.lata@iilm.edu',
+        'pooja.nagpal@iilm.edu',
+        'aarti.chugh@iilm.edu',
+        'sapna.arora@iilm.edu',
+        'neha.bansal@iilm.edu',
+        'samridhi.singhal@iilm.edu',
+        'preeti.mehta@iilm.edu',
+        'jayati.tripathi@iilm.edu',
+        'rahul.thakur@iilm.edu',
+        'aarti.tewari@iilm.edu',
+        'naved.ahmad@iilm.edu',
+        'shagun.panghal@iilm.edu',
+        'abhishek.toofani@iilm.edu',
+        'amit.kumar.tiwari@iilm.edu',
+        'tanu.gupta@iilm.edu',
+        'vikas.jayswal@iilm.edu',
+        'puneet.bawa@iilm.edu',
+        'vardaan.pajnoo@iilm.edu',
+        'vishwa.prakash@iilm.edu',
+        'devraj.sharma@iilm.edu',
+        'anurag.jain@iilm.edu',
+        'aashish.kaushik@iilm.edu',
+        'rudraksh.sachdeva.ug24@iilm.edu',
+    ],
+}
+
+
+def load_initial_roster(apps, schema_editor):
+    RoleAssignment = apps.get_model('accounts', 'RoleAssignment')
+    RoleAssignment.objects.bulk_create(
+        [RoleAssignment(email=email.lower(), role=role) for role, emails in INITIAL_ROSTER.items() for email in emails],
+        ignore_conflicts=True,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0008_submission_review_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RoleAssignment',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('email', models.EmailField(max_length=254, unique=True)),
+                ('role', models.CharField(choices=[('faculty', 'Faculty'), ('dean', 'Dean'), ('cluster_head', 'Cluster Head')], max_length=20)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.RunPython(load_initial_roster, migrations.RunPython.noop),
+    ]
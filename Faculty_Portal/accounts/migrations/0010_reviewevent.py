@@ -0,0 +1,76 @@
+# Generated by Django 5.2.7 on 2026-10-18 09:54
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+SUBMISSION_MODELS = {
+    'journal': 'JournalPublication',
+    'conference': 'ConferencePublication',
+    'research': 'ResearchProject',
+    'patent': 'Patents',
+    'copyright': 'Copyright',
+    'phd_guidance': 'PhdGuidance',
+    'book_chapter': 'BookChapter',
+    'books_authored': 'BooksAuthored',
+    'consultancy_project': 'ConsultancyProjects',
+    'editorial_roles': 'EditorialRoles',
+    'reviewer_roles': 'ReviewerRoles',
+    'awards_achievements': 'AwardsAchievements',
+    'industry_collaboration': 'IndustryCollaboration',
+}
+
+
+def log_queued_submissions(apps, schema_editor):
+    # Give the submissions already waiting in a queue the event that put them
+    # there, so their turnaround can be measured once they are decided. The
+    # cluster head approval time is only known as the last save, reviewed_at.
+    ReviewEvent = apps.get_model('accounts', 'ReviewEvent')
+    events = []
+    for key, model_name in SUBMISSION_MODELS.items():
+        model = apps.get_model('accounts', model_name)
+        status_field = 'overall_status' if key == 'research' else 'status'
+        for pk, user_id, submitted_at in model.objects.filter(**{status_field: 'submitted'}).values_list(
+            'pk', 'user_id', 'submitted_at'
+        ):
+            events.append(ReviewEvent(
+                submission_type=key, object_id=pk, stage='submission', actor_id=user_id,
+                to_status='submitted', created_at=submitted_at,
+            ))
+        for pk, reviewed_at in model.objects.filter(**{status_field: 'approved_by_cluster'}).values_list(
+            'pk', 'reviewed_at'
+        ):
+            events.append(ReviewEvent(
+                submission_type=key, object_id=pk, stage='cluster_head',
+                from_status='submitted', to_status='approved_by_cluster', created_at=reviewed_at,
+            ))
+    ReviewEvent.objects.bulk_create(events, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0009_roleassignment'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReviewEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('submission_type', models.CharField(max_length=30)),
+                ('object_id', models.PositiveBigIntegerField()),
+                ('stage', models.CharField(choices=[('submission', 'Submission'), ('cluster_head', 'Cluster Head'), ('dean', 'Dean')], max_length=20)),
+                ('from_status', models.CharField(blank=True, max_length=30)),
+                ('to_status', models.CharField(max_length=30)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('actor', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='review_events', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['stage', 'created_at'], name='reviewevent_stage_time'), models.Index(fields=['submission_type', 'object_id', 'created_at'], name='reviewevent_submission')],
+            },
+        ),
+        migrations.RunPython(log_queued_submissions, migrations.RunPython.noop),
+    ]
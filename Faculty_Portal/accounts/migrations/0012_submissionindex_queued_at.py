@@ -0,0 +1,61 @@
+# Generated by Django 5.2.7 on 2026-10-18 09:59
+
+from django.db import migrations, models
+from django.db.models import F, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+SUBMISSION_MODELS = {
+    'journal': 'JournalPublication',
+    'conference': 'ConferencePublication',
+    'research': 'ResearchProject',
+    'patent': 'Patents',
+    'copyright': 'Copyright',
+    'phd_guidance': 'PhdGuidance',
+    'book_chapter': 'BookChapter',
+    'books_authored': 'BooksAuthored',
+    'consultancy_project': 'ConsultancyProjects',
+    'editorial_roles': 'EditorialRoles',
+    'reviewer_roles': 'ReviewerRoles',
+    'awards_achievements': 'AwardsAchievements',
+    'industry_collaboration': 'IndustryCollaboration',
+}
+
+
+def backfill_queued_at(apps, schema_editor):
+    # The entry's latest ReviewEvent is the transition into its current status;
+    # entries without one have been in it since they were submitted.
+    ContentType = apps.get_model('contenttypes', 'ContentType')
+    ReviewEvent = apps.get_model('accounts', 'ReviewEvent')
+    SubmissionIndex = apps.get_model('accounts', 'SubmissionIndex')
+    for key, model_name in SUBMISSION_MODELS.items():
+        content_type = ContentType.objects.filter(app_label='accounts', model=model_name.lower()).first()
+        if content_type is None:
+            continue
+        latest_event = ReviewEvent.objects.filter(
+            submission_type=key, object_id=OuterRef('object_id'),
+        ).order_by('-created_at').values('created_at')[:1]
+        SubmissionIndex.objects.filter(content_type=content_type).update(
+            queued_at=Coalesce(Subquery(latest_event), F('submitted_at')),
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0011_submissionindex_claims'),
+        ('contenttypes', '0002_remove_content_type_name'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='submissionindex',
+            name='queued_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='submissionindex',
+            index=models.Index(fields=['status', 'content_type', 'queued_at'], name='subindex_status_backlog'),
+        ),
+        migrations.RunPython(backfill_queued_at, migrations.RunPython.noop),
+    ]
@@ -2,6 +2,7 @@ from django.db import models
 from django.contrib.auth.models import AbstractBaseUser, BaseUserManager, PermissionsMixin
 import uuid
 from django.contrib.auth import get_user_model
+from django.contrib.contenttypes.models import ContentType
 
 
 from django.utils import timezone
@@ -94,6 +95,35 @@ class FacultyProfile(models.Model):
 
 
 
+
+def review_indexes(prefix, status_field='status'):
+    """
+    Composite indexes shared by every submission model, matching the review
+    queues and dashboards: status + submitted_at for the queues, user +
+    submitted_at / dean_status for a faculty member's own submissions, and
+    cluster_head_status for the review counters. The two partial indexes only
+    cover rows still waiting for the cluster head ('submitted') or the dean
+    ('approved_by_cluster'); backends without partial index support skip them.
+    """
+
+    return [
+        models.Index(fields=[status_field, 'submitted_at'], name=f'{prefix}_status_sub_idx'),
+        models.Index(fields=['user', 'submitted_at'], name=f'{prefix}_user_sub_idx'),
+        models.Index(fields=['user', 'dean_status'], name=f'{prefix}_user_dean_idx'),
+        models.Index(fields=['cluster_head_status'], name=f'{prefix}_cluster_idx'),
+        models.Index(
+            fields=['submitted_at'],
+            condition=models.Q(**{status_field: 'submitted'}),
+            name=f'{prefix}_cluster_queue_idx',
+        ),
+        models.Index(
+            fields=['submitted_at'],
+            condition=models.Q(**{status_field: 'approved_by_cluster'}),
+            name=f'{prefix}_dean_queue_idx',
+        ),
+    ]
+
+
 User = get_user_model()
 
 class JournalPublication(models.Model):
@@ -177,6 +207,9 @@ class JournalPublication(models.Model):
     submitted_at = models.DateTimeField(auto_now_add=True)
     reviewed_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = review_indexes('journal')
+
     def __str__(self):
         return f"{self.title_of_paper} ({self.user.full_name})"
 
@@ -271,6 +304,9 @@ class ConferencePublication(models.Model):
     submitted_at = models.DateTimeField(auto_now_add=True)
     reviewed_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = review_indexes('conference')
+
     def __str__(self):
         return f"{self.title_of_paper} ({self.user.full_name})"
 
@@ -352,6 +388,9 @@ class ResearchProject(models.Model):
     submitted_at = models.DateTimeField(auto_now_add=True)
     reviewed_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = review_indexes('research', status_field='overall_status')
+
     def __str__(self):
         return f"{self.project_title} ({self.user.full_name})"
     
@@ -426,6 +465,9 @@ class Patents(models.Model):
     # Overall status
     status = models.CharField(max_length=30, choices=REVIEW_STATUS_CHOICES, default='submitted')
 
+    class Meta:
+        indexes = review_indexes('patent')
+
     def __str__(self):
         return f"{self.title_of_patent} ({self.user.full_name})"
 
@@ -488,6 +530,9 @@ class Copyright(models.Model):
     submitted_at = models.DateTimeField(auto_now_add=True)
     reviewed_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = review_indexes('copyright')
+
     def __str__(self):
         return f"{self.title_of_work} ({self.user.full_name})"
 
@@ -566,6 +611,9 @@ class PhdGuidance(models.Model):
 
     submitted_at = models.DateTimeField(auto_now_add=True)
     reviewed_at = models.DateTimeField(auto_now=True)
+    class Meta:
+        indexes = review_indexes('phd')
+
     def __str__(self):
         return f"{self.name_of_scholar} ({self.user.full_name})"
     
@@ -631,6 +679,9 @@ class BookChapter(models.Model):
     submitted_at = models.DateTimeField(auto_now_add=True)
     reviewed_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = review_indexes('bookchapter')
+
     def __str__(self):
         return f"{self.chapter_title} ({self.user.username})"
 
@@ -700,6 +751,9 @@ class BooksAuthored(models.Model):
     submitted_at = models.DateTimeField(auto_now_add=True)
     reviewed_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = review_indexes('booksauth')
+
     def __str__(self):
         return f"{self.book_title} ({self.user.username})"
     
@@ -768,6 +822,9 @@ class ConsultancyProjects(models.Model):
     submitted_at = models.DateTimeField(auto_now_add=True)
     reviewed_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = review_indexes('consult')
+
     def __str__(self):
         return f"{self.project_title} ({self.user.username})"
 
@@ -833,6 +890,9 @@ class EditorialRoles(models.Model):
     submitted_at = models.DateTimeField(auto_now_add=True)
     reviewed_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = review_indexes('editorial')
+
     def __str__(self):
         return f"{self.journal_name} ({self.user.username})"
     
@@ -894,6 +954,9 @@ class ReviewerRoles(models.Model):
     submitted_at = models.DateTimeField(auto_now_add=True)
     reviewed_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = review_indexes('reviewer')
+
     def __str__(self):
         return f"{self.journal_or_conference_name} ({self.user.username})"
 
@@ -957,6 +1020,9 @@ class AwardsAchievements(models.Model):
     submitted_at = models.DateTimeField(auto_now_add=True)
     reviewed_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = review_indexes('awards')
+
     def __str__(self):
         return f"{self.title_of_award} ({self.user.username})"
 
@@ -1021,5 +1087,129 @@ class IndustryCollaboration(models.Model):
     submitted_at = models.DateTimeField(auto_now_add=True)
     reviewed_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = review_indexes('industry')
+
     def __str__(self):
-        return f"{self.industry_name} ({self.user.username})"
\ No newline at end of file
+        return f"{self.industry_name} ({self.user.username})"
+
+class SubmissionStats(models.Model):
+    """
+    Denormalized per-user submission counters, one row per
+    (user, submission type, cluster head status, dean status) bucket.
+
+    Rows are kept current by the post_save / post_delete hooks in
+    accounts/signals.py and can be recomputed from scratch with
+    `python manage.py rebuild_submission_stats`.
+    """
+
+    user = models.ForeignKey(FacultyUser, on_delete=models.CASCADE, related_name='submission_stats')
+    submission_type = models.CharField(max_length=30)
+    cluster_head_status = models.CharField(max_length=30)
+    dean_status = models.CharField(max_length=30)
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['user', 'submission_type', 'cluster_head_status', 'dean_status'],
+                name='unique_submission_stats_bucket',
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id} {self.submission_type} {self.cluster_head_status}/{self.dean_status}: {self.count}"
+
+
+class SubmissionIndex(models.Model):
+    """
+    Narrow, indexed copy of the review columns of every submission, one row per
+    submission across all 13 models. The cluster head, dean and "my submissions"
+    queues page through this table instead of merging 13 tables in memory.
+
+    Kept in sync by the post_save / post_delete hooks in accounts/signals.py;
+    `python manage.py rebuild_submission_index` recreates it from scratch.
+    """
+
+    content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE)
+    object_id = models.PositiveBigIntegerField()
+    user = models.ForeignKey(FacultyUser, on_delete=models.CASCADE, related_name='submission_index')
+    title = models.CharField(max_length=255, blank=True)
+    status = models.CharField(max_length=30)
+    cluster_head_status = models.CharField(max_length=30)
+    dean_status = models.CharField(max_length=30)
+    submitted_at = models.DateTimeField()
+    # When the entry entered its current status; the age of a queue's backlog (accounts/backlog.py).
+    queued_at = models.DateTimeField(null=True, blank=True)
+    # Cluster head lease on the entry (accounts/claims.py); free once claim_expires_at has passed.
+    claimed_by = models.ForeignKey(
+        FacultyUser, on_delete=models.SET_NULL, null=True, blank=True, related_name='claimed_submissions',
+    )
+    claim_expires_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['content_type', 'object_id'], name='unique_submission_index_entry'),
+        ]
+        indexes = [
+            models.Index(fields=['status', '-submitted_at', '-content_type', '-object_id'], name='subindex_status_queue'),
+            models.Index(fields=['user', '-submitted_at'], name='subindex_user_submitted'),
+            models.Index(fields=['status', 'content_type', 'queued_at'], name='subindex_status_backlog'),
+        ]
+
+    def __str__(self):
+        return f"{self.title} ({self.content_type.model} #{self.object_id})"
+
+
+class ReviewEvent(models.Model):
+    """
+    Append-only log of review transitions, one row per status change of a
+    submission: its creation (stage 'submission') and every cluster head and
+    dean decision, written in the same transaction as the change itself.
+    Unlike `reviewed_at`, which moves on every save, the log keeps when each
+    stage was entered and left, which accounts/review_metrics.py turns into
+    turnaround percentiles. Rows are never updated.
+    """
+
+    STAGE_CHOICES = [
+        ('submission', 'Submission'),
+        ('cluster_head', 'Cluster Head'),
+        ('dean', 'Dean'),
+    ]
+
+    submission_type = models.CharField(max_length=30)
+    object_id = models.PositiveBigIntegerField()
+    stage = models.CharField(max_length=20, choices=STAGE_CHOICES)
+    actor = models.ForeignKey(FacultyUser, on_delete=models.SET_NULL, null=True, blank=True, related_name='review_events')
+    from_status = models.CharField(max_length=30, blank=True)
+    to_status = models.CharField(max_length=30)
+    created_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['stage', 'created_at'], name='reviewevent_stage_time'),
+            models.Index(fields=['submission_type', 'object_id', 'created_at'], name='reviewevent_submission'),
+        ]
+
+    def __str__(self):
+        return f"{self.submission_type} #{self.object_id}: {self.from_status or '-'} -> {self.to_status}"
+
+
+class RoleAssignment(models.Model):
+    """
+    The roster deciding which role an @iilm.edu address signs up with. Looked
+    up through the per-process cache in accounts/roles.py; edit it in the admin
+    or load it with `python manage.py import_role_assignments`.
+    """
+
+    email = models.EmailField(unique=True)
+    role = models.CharField(max_length=20, choices=FacultyUser.ROLE_CHOICES)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def save(self, *args, **kwargs):
+        self.email = self.email.strip().lower()
+        super().save(*args, **kwargs)
+
+    def __str__(self):
+        return f"{self.email} ({self.role})"
+
@@ -0,0 +1,111 @@
+# accounts/notifications.py
+"""
+Review decision e-mails to faculty members.
+
+A batch sign-off can decide dozens of one faculty member's submissions at
+once. Instead of one e-mail per submission, decision_messages() groups the
+applied outcomes of a batch by owner and builds one summary e-mail per
+faculty member (one query per submission type reads the titles, remarks and
+addresses), and queue_decision_notifications() sends them all over a single
+backend connection once the transaction that recorded the decisions has
+committed, so a rolled back batch never reports decisions that did not
+happen.
+"""
+
+import logging
+from functools import partial
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.db import transaction
+
+from .review import REVIEW_STAGES
+from .submissions import SUBMISSION_TYPES_BY_KEY
+
+
+logger = logging.getLogger(__name__)
+
+DECISION_LABELS = {
+    'approved_by_cluster': 'Approved by the Cluster Head',
+    'rejected_by_cluster': 'Rejected by the Cluster Head',
+    'revision': 'Sent back for revision',
+    'approved_by_dean': 'Approved by the Dean',
+    'rejected_by_dean': 'Rejected by the Dean',
+}
+
+SUBJECT = 'IILM University, Gurugram | Faculty Portal - Submission Review Update'
+
+
+def decision_messages(stage, outcomes):
+    """One EmailMessage per faculty member summarising the applied outcomes of a batch decided at `stage`."""
+
+    remarks_field = REVIEW_STAGES[stage].remarks_field
+    applied = {}
+    for outcome in outcomes:
+        if outcome.outcome == 'applied':
+            applied.setdefault(outcome.key, {})[outcome.pk] = outcome.status
+
+    recipients = {}  # email -> (full name, [(label, title, status, remarks)])
+    for key, statuses in applied.items():
+        st = SUBMISSION_TYPES_BY_KEY[key]
+        rows = st.model.objects.filter(pk__in=statuses).values_list(
+            'pk', 'user__email', 'user__full_name', st.title_field, remarks_field,
+        )
+        for pk, email, full_name, title, remarks in rows:
+            recipients.setdefault(email, (full_name, []))[1].append((st.label, title, statuses[pk], remarks))
+
+    return [
+        EmailMessage(
+            subject=SUBJECT,
+            body=_summary(full_name, decisions),
+            from_email=settings.DEFAULT_FROM_EMAIL,
+            to=[email],
+        )
+        for email, (full_name, decisions) in recipients.items()
+    ]
+
+
+def _summary(full_name, decisions):
+    lines = [
+        f"Dear {full_name},",
+        '',
+        (
+            "One of your submissions on the IILM Faculty Portal has been reviewed:" if len(decisions) == 1 else
+            f"{len(decisions)} of your submissions on the IILM Faculty Portal have been reviewed:"
+        ),
+        '',
+    ]
+    for label, title, status, remarks in sorted(decisions, key=lambda decision: (decision[0], str(decision[1]))):
+        lines.append(f"- {label}: {title} - {DECISION_LABELS.get(status, status)}")
+        if remarks:
+            lines.append(f"  Remarks: {remarks}")
+    lines += [
+        '',
+        'You can see the full details on your dashboard.',
+        '',
+        'Warm regards,',
+        'IILM University, Gurugram',
+        'Team AIgnite',
+    ]
+    return '\n'.join(lines)
+
+
+def send_decision_messages(messages):
+    """Sends the messages over one connection; returns how many were sent."""
+
+    if not messages:
+        return 0
+    try:
+        return get_connection().send_messages(messages) or 0
+    except Exception:
+        # The decisions are committed already; a mail outage must not turn them into a 500.
+        logger.exception("Could not send %d review decision e-mails", len(messages))
+        return 0
+
+
+def queue_decision_notifications(stage, outcomes):
+    """Builds the per-faculty summaries now and sends them when the current transaction commits."""
+
+    messages = decision_messages(stage, outcomes)
+    transaction.on_commit(partial(send_decision_messages, messages))
+    return messages
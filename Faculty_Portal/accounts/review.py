@@ -0,0 +1,284 @@
+# accounts/review.py
+"""
+The review state machine shared by the cluster head and dean review views.
+
+A decision is applied with one conditional UPDATE that only matches the row
+while it is still in the state the reviewer loaded it in (same consolidated
+status and same cluster head / dean statuses), and only writes the review
+columns: the consolidated status, the stage status, the stage remarks and
+reviewed_at. The transition is appended to the ReviewEvent log in the same
+transaction. If a second reviewer acted on a stale page, the UPDATE matches
+nothing and ReviewConflict is raised instead of silently overwriting the
+first decision.
+
+apply_reviews() does the same for a whole batch of decisions across
+submission types: per model it locks and reads the batch once, then writes
+every decision in one conditional UPDATE (CASE expressions carry the
+per-row status and remarks), and reports an outcome for each item.
+
+Because ``QuerySet.update()`` sends no post_save signal, both keep
+SubmissionStats, SubmissionIndex and the cache generations in step
+themselves, in the same transaction; the index update also releases any
+cluster head claim on the decided entries (accounts/claims.py).
+"""
+
+from collections import Counter, namedtuple
+
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.db import models, transaction
+from django.db.models import Case, Value, When
+from django.utils import timezone
+
+from .cache import queues_changed, submission_changed, submissions_changed
+from .models import ReviewEvent, SubmissionIndex
+from .stats import bump_many, move, review_state
+from .submissions import SUBMISSION_TYPES_BY_KEY, get_submission_type
+
+
+BULK_REVIEW_MAX_ITEMS = getattr(settings, 'BULK_REVIEW_MAX_ITEMS', 500)
+
+# status_field  -> per-stage status column
+# remarks_field -> per-stage remarks column
+# from_status   -> consolidated status a submission must have to be decided at this stage
+# decisions     -> posted decision -> (stage status, new consolidated status)
+ReviewStage = namedtuple('ReviewStage', ['status_field', 'remarks_field', 'from_status', 'decisions'])
+
+REVIEW_STAGES = {
+    'cluster_head': ReviewStage('cluster_head_status', 'cluster_head_remarks', 'submitted', {
+        'approved_by_cluster': ('approved', 'approved_by_cluster'),
+        'rejected_by_cluster': ('rejected', 'rejected_by_cluster'),
+        'revision': ('revision', 'revision'),
+    }),
+    'dean': ReviewStage('dean_status', 'dean_remarks', 'approved_by_cluster', {
+        'approve': ('approved', 'approved_by_dean'),
+        'reject': ('rejected', 'rejected_by_dean'),
+    }),
+}
+
+
+class InvalidDecision(ValueError):
+    """The posted decision is not one the review stage offers."""
+
+
+class ReviewConflict(Exception):
+    """The submission changed (or was deleted) after the reviewer loaded it."""
+
+    def __init__(self, submission, current_status):
+        self.submission = submission
+        self.current_status = current_status
+        super().__init__(f"{type(submission).__name__} #{submission.pk} is now {current_status or 'deleted'}")
+
+    def get_current_status_display(self):
+        """Human readable label of the status the submission has now."""
+        st = get_submission_type(self.submission)
+        choices = dict(self.submission._meta.get_field(st.status_field).choices or ())
+        return choices.get(self.current_status, self.current_status or 'deleted')
+
+
+def log_submission(submission):
+    """Appends the ReviewEvent of a newly created submission entering the review queues."""
+
+    st = get_submission_type(submission)
+    ReviewEvent.objects.create(
+        submission_type=st.key, object_id=submission.pk, stage='submission', actor_id=submission.user_id,
+        to_status=getattr(submission, st.status_field), created_at=submission.submitted_at or timezone.now(),
+    )
+
+
+def apply_review(submission, stage, decision, remarks, actor=None):
+    """
+    Applies a reviewer's decision to a loaded submission at `stage`
+    ('cluster_head' or 'dean'). Raises InvalidDecision for an unknown decision
+    and ReviewConflict if the row no longer is in the loaded state. On success
+    the instance is updated in place, the transition is logged with `actor` as
+    the reviewer and the instance is returned.
+    """
+
+    review_stage = REVIEW_STAGES[stage]
+    if decision not in review_stage.decisions:
+        raise InvalidDecision(decision)
+    stage_status, new_status = review_stage.decisions[decision]
+
+    st = get_submission_type(submission)
+    old_state = review_state(submission)
+    if getattr(submission, st.status_field) != review_stage.from_status:
+        raise ReviewConflict(submission, getattr(submission, st.status_field))
+
+    changes = {
+        st.status_field: new_status,
+        review_stage.status_field: stage_status,
+        review_stage.remarks_field: remarks,
+        'reviewed_at': timezone.now(),
+    }
+
+    with transaction.atomic():
+        updated = type(submission).objects.filter(
+            pk=submission.pk,
+            **{st.status_field: review_stage.from_status},
+            cluster_head_status=submission.cluster_head_status,
+            dean_status=submission.dean_status,
+        ).update(**changes)
+        if not updated:
+            current = type(submission).objects.filter(pk=submission.pk).values_list(st.status_field, flat=True).first()
+            raise ReviewConflict(submission, current)
+
+        for field, value in changes.items():
+            setattr(submission, field, value)
+        new_state = review_state(submission)
+        submission._review_state = new_state
+
+        # What the post_save receivers in accounts/signals.py would have done.
+        move(submission, old_state, new_state)
+        SubmissionIndex.objects.filter(
+            content_type=ContentType.objects.get_for_model(submission),
+            object_id=submission.pk,
+        ).update(
+            status=new_status, cluster_head_status=submission.cluster_head_status, dean_status=submission.dean_status,
+            queued_at=changes['reviewed_at'], claimed_by=None, claim_expires_at=None,
+        )
+        submission_changed(submission, old_state, new_state)
+        queues_changed()
+        ReviewEvent.objects.create(
+            submission_type=st.key, object_id=submission.pk, stage=stage, actor=actor,
+            from_status=review_stage.from_status, to_status=new_status, created_at=changes['reviewed_at'],
+        )
+
+    return submission
+
+
+# key     -> submission type key of the item
+# pk      -> primary key of the item
+# outcome -> 'applied', 'conflict' (not in the stage's from_status any more),
+#            'claimed' (leased to another reviewer, see accounts/claims.py),
+#            'not_found' or 'invalid' (unknown type, id or decision, or a duplicate)
+# status  -> consolidated status of the submission after the batch, when known
+ReviewOutcome = namedtuple('ReviewOutcome', ['key', 'pk', 'outcome', 'status'])
+
+
+def _case(pk_values, output_field, key='pk'):
+    return Case(
+        *(When(**{key: pk}, then=Value(value, output_field=output_field)) for pk, value in pk_values),
+        output_field=output_field,
+    )
+
+
+def apply_reviews(stage, items, actor=None, held=frozenset()):
+    """
+    Applies a batch of (type key, pk, decision, remarks) decisions at `stage`
+    in one transaction and returns a ReviewOutcome per item, in input order.
+    Items that cannot be applied are reported, never raised, so one stale
+    entry does not block the rest of the batch. Items whose (type key, pk) is
+    in `held`, leased to another reviewer, are reported as 'claimed'.
+    """
+
+    review_stage = REVIEW_STAGES[stage]
+    outcomes = {}
+    batches = {}  # SubmissionType -> {pk: (decision, remarks)}
+    order = []  # (key, pk) of each item, or its ReviewOutcome if it was rejected up front
+
+    for key, pk, decision, remarks in items:
+        try:
+            pk = int(pk)
+        except (TypeError, ValueError):
+            pk = None
+        st = SUBMISSION_TYPES_BY_KEY.get(key)
+        if st is None or pk is None or decision not in review_stage.decisions or (key, pk) in outcomes:
+            order.append(ReviewOutcome(key, pk, 'invalid', None))
+            continue
+        if (key, pk) in held:
+            order.append(ReviewOutcome(key, pk, 'claimed', None))
+            continue
+        order.append((key, pk))
+        outcomes[(key, pk)] = None
+        batches.setdefault(st, {})[pk] = (decision, remarks)
+
+    now = timezone.now()
+    deltas = Counter()
+    user_ids = set()
+    events = []
+
+    with transaction.atomic():
+        for st, decisions in batches.items():
+            rows = {
+                pk: (user_id, cluster_head_status, dean_status, status)
+                for pk, user_id, cluster_head_status, dean_status, status in
+                st.model.objects.select_for_update().filter(pk__in=decisions).values_list(
+                    'pk', 'user_id', 'cluster_head_status', 'dean_status', st.status_field,
+                )
+            }
+
+            # Eligible rows grouped by the review state they were read in, so the
+            # UPDATE can require that state; normally this is a single group.
+            groups = {}
+            for pk in decisions:
+                if pk not in rows:
+                    outcomes[(st.key, pk)] = ReviewOutcome(st.key, pk, 'not_found', None)
+                elif rows[pk][3] != review_stage.from_status:
+                    outcomes[(st.key, pk)] = ReviewOutcome(st.key, pk, 'conflict', rows[pk][3])
+                else:
+                    groups.setdefault(rows[pk][1:3], []).append(pk)
+
+            for (cluster_head_status, dean_status), pks in groups.items():
+                targets = [(pk, review_stage.decisions[decisions[pk][0]]) for pk in pks]
+                updated = st.model.objects.filter(
+                    pk__in=pks,
+                    **{st.status_field: review_stage.from_status},
+                    cluster_head_status=cluster_head_status,
+                    dean_status=dean_status,
+                ).update(**{
+                    st.status_field: _case([(pk, new_status) for pk, (_, new_status) in targets], models.CharField()),
+                    review_stage.status_field: _case([(pk, stage_status) for pk, (stage_status, _) in targets], models.CharField()),
+                    review_stage.remarks_field: _case([(pk, decisions[pk][1]) for pk in pks], models.TextField()),
+                    'reviewed_at': now,
+                })
+
+                applied = set(pks)
+                if updated != len(pks):
+                    # Another writer got some rows first (only possible without row
+                    # locks, e.g. on SQLite); ours are the ones stamped with `now`.
+                    applied = set(st.model.objects.filter(pk__in=pks, reviewed_at=now).values_list('pk', flat=True))
+                    current = dict(st.model.objects.filter(pk__in=set(pks) - applied).values_list('pk', st.status_field))
+                    for pk in set(pks) - applied:
+                        outcomes[(st.key, pk)] = ReviewOutcome(st.key, pk, 'conflict', current.get(pk))
+
+                applied_targets = [(pk, statuses) for pk, statuses in targets if pk in applied]
+                for pk, (stage_status, new_status) in applied_targets:
+                    outcomes[(st.key, pk)] = ReviewOutcome(st.key, pk, 'applied', new_status)
+                    events.append(ReviewEvent(
+                        submission_type=st.key, object_id=pk, stage=stage, actor=actor,
+                        from_status=review_stage.from_status, to_status=new_status, created_at=now,
+                    ))
+                    user_id = rows[pk][0]
+                    old_state = (user_id, cluster_head_status, dean_status)
+                    new_state = (
+                        user_id,
+                        stage_status if review_stage.status_field == 'cluster_head_status' else cluster_head_status,
+                        stage_status if review_stage.status_field == 'dean_status' else dean_status,
+                    )
+                    deltas[(st.key, old_state)] -= 1
+                    deltas[(st.key, new_state)] += 1
+                    user_ids.add(user_id)
+
+                if applied_targets:
+                    SubmissionIndex.objects.filter(
+                        content_type=ContentType.objects.get_for_model(st.model),
+                        object_id__in=applied,
+                    ).update(**{
+                        'status': _case([(pk, new_status) for pk, (_, new_status) in applied_targets],
+                                        models.CharField(), key='object_id'),
+                        review_stage.status_field: _case([(pk, stage_status) for pk, (stage_status, _) in applied_targets],
+                                                         models.CharField(), key='object_id'),
+                        'queued_at': now,
+                        'claimed_by': None,
+                        'claim_expires_at': None,
+                    })
+
+        # All affected counters in one read, one UPDATE and one INSERT.
+        bump_many(deltas)
+        ReviewEvent.objects.bulk_create(events)
+        submissions_changed([st.key for st in batches], user_ids)
+        if events:
+            queues_changed()
+
+    return [item if isinstance(item, ReviewOutcome) else outcomes[item] for item in order]
@@ -0,0 +1,151 @@
+# accounts/review_metrics.py
+"""
+Review turnaround metrics computed from the ReviewEvent log.
+
+A stage's turnaround is the time between the event that put a submission in
+the stage's queue (its creation for the cluster head, the cluster head's
+approval for the dean) and the decision taken at that stage. Both the
+turnarounds and their percentiles are computed in one SQL query with window
+functions:
+
+- LAG() over each submission's events pairs every decision with the event
+  before it; only the submissions decided inside the time range are read,
+  through the reviewevent_stage_time and reviewevent_submission indexes;
+- ROW_NUMBER() and COUNT() over (stage) and over (stage, reviewer) rank the
+  turnarounds, and conditional MIN()s pick the nearest-rank percentiles.
+
+Submissions whose queue entry predates the log have no previous event and
+are left out rather than guessed.
+"""
+
+from datetime import timedelta
+
+from django.db import NotSupportedError, connection
+from django.utils import timezone
+
+from .cache import ALL_TYPES, REVIEW_METRICS_TTL, cached
+from .models import FacultyUser, ReviewEvent
+from .review import REVIEW_STAGES
+
+
+PERCENTILES = (50, 90, 99)
+METRICS_DAYS = 30
+METRICS_MAX_DAYS = 365
+
+# Seconds between two timestamp columns, per database vendor.
+SECONDS_BETWEEN = {
+    'sqlite': "(julianday({end}) - julianday({start})) * 86400.0",
+    'postgresql': "EXTRACT(EPOCH FROM ({end} - {start}))",
+    'mysql': "TIMESTAMPDIFF(MICROSECOND, {start}, {end}) / 1000000.0",
+}
+
+TURNAROUND_SQL = """
+WITH decided AS (
+    SELECT DISTINCT submission_type, object_id
+    FROM {table}
+    WHERE stage IN ({stages}) AND created_at >= %s AND created_at < %s
+),
+steps AS (
+    SELECT e.stage, e.actor_id, e.from_status, e.created_at,
+           LAG(e.created_at) OVER w AS entered_at,
+           LAG(e.to_status) OVER w AS entered_status
+    FROM {table} e
+    JOIN decided d ON d.submission_type = e.submission_type AND d.object_id = e.object_id
+    WHERE e.created_at < %s
+    WINDOW w AS (PARTITION BY e.submission_type, e.object_id ORDER BY e.created_at, e.id)
+),
+turnaround AS (
+    SELECT stage, actor_id, {seconds} AS seconds
+    FROM steps
+    WHERE stage IN ({stages}) AND created_at >= %s AND entered_status = from_status
+),
+ranked AS (
+    SELECT stage, actor_id, seconds,
+           ROW_NUMBER() OVER (PARTITION BY stage ORDER BY seconds) AS stage_rank,
+           COUNT(*) OVER (PARTITION BY stage) AS stage_count,
+           ROW_NUMBER() OVER (PARTITION BY stage, actor_id ORDER BY seconds) AS actor_rank,
+           COUNT(*) OVER (PARTITION BY stage, actor_id) AS actor_count
+    FROM turnaround
+)
+SELECT 'stage', stage, NULL, COUNT(*), AVG(seconds){stage_percentiles}
+FROM ranked
+GROUP BY stage
+UNION ALL
+SELECT 'reviewer', stage, actor_id, COUNT(*), AVG(seconds){actor_percentiles}
+FROM ranked
+GROUP BY stage, actor_id
+"""
+
+
+def _percentiles(prefix):
+    # Nearest rank: the smallest turnaround whose rank reaches p% of the group.
+    return ''.join(
+        f", MIN(CASE WHEN {prefix}_rank * 100 >= {prefix}_count * {p} THEN seconds END)"
+        for p in PERCENTILES
+    )
+
+
+def turnaround_sql():
+    """The turnaround query for the current database vendor."""
+
+    if connection.vendor not in SECONDS_BETWEEN:
+        raise NotSupportedError(f"Review turnaround metrics are not implemented for {connection.vendor}.")
+    return TURNAROUND_SQL.format(
+        table=connection.ops.quote_name(ReviewEvent._meta.db_table),
+        stages=', '.join(['%s'] * len(REVIEW_STAGES)),
+        seconds=SECONDS_BETWEEN[connection.vendor].format(start='entered_at', end='created_at'),
+        stage_percentiles=_percentiles('stage'),
+        actor_percentiles=_percentiles('actor'),
+    )
+
+
+def compute_turnaround(since, until):
+    """
+    Turnaround percentiles (in seconds) of the decisions taken in [since, until),
+    per stage and per (stage, reviewer).
+    """
+
+    stages = list(REVIEW_STAGES)
+    since_value = connection.ops.adapt_datetimefield_value(since)
+    until_value = connection.ops.adapt_datetimefield_value(until)
+    with connection.cursor() as cursor:
+        cursor.execute(turnaround_sql(), [*stages, since_value, until_value, until_value, *stages, since_value])
+        rows = cursor.fetchall()
+
+    reviewers = dict(FacultyUser.objects.filter(pk__in={row[2] for row in rows if row[2]}).values_list('pk', 'full_name'))
+
+    by_stage, by_reviewer = [], []
+    for grouping, stage, actor_id, count, mean, *percentiles in rows:
+        entry = {'stage': stage, 'count': count, 'mean': round(mean, 1)}
+        entry.update({f'p{p}': round(value, 1) for p, value in zip(PERCENTILES, percentiles)})
+        if grouping == 'stage':
+            by_stage.append(entry)
+        else:
+            by_reviewer.append({'reviewer_id': actor_id, 'reviewer': reviewers.get(actor_id), **entry})
+
+    by_stage.sort(key=lambda entry: stages.index(entry['stage']))
+    by_reviewer.sort(key=lambda entry: (stages.index(entry['stage']), entry['reviewer'] or ''))
+    return {
+        'since': since.isoformat(),
+        'until': until.isoformat(),
+        'stages': by_stage,
+        'reviewers': by_reviewer,
+    }
+
+
+def parse_days(value):
+    try:
+        days = int(value)
+    except (TypeError, ValueError):
+        return METRICS_DAYS
+    return max(1, min(days, METRICS_MAX_DAYS))
+
+
+def review_turnaround(days=METRICS_DAYS):
+    """compute_turnaround() over the last `days` days, cached until the next decision or REVIEW_METRICS_TTL."""
+
+    def compute():
+        until = timezone.now()
+        return compute_turnaround(until - timedelta(days=days), until)
+
+    return cached('review_turnaround', compute, REVIEW_METRICS_TTL, ALL_TYPES, days)
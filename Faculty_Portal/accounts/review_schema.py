@@ -0,0 +1,176 @@
+# accounts/review_schema.py
+"""
+Field schemas for the generic review page (templates/review_submission.html).
+
+The cluster head and dean review pages of every submission type only differ
+in which model fields they list, so a single template renders all 26 of
+them from a per-model schema. The schema is compiled from the model's Meta
+(field labels, choices, field types) and the display list in REVIEW_LAYOUTS,
+once per model and process. A submission type without a layout entry still
+gets a page: every descriptive field of its model is shown in declaration
+order, so adding a 14th submission type needs no new template.
+"""
+
+from collections import namedtuple
+from functools import lru_cache
+
+from django.db import models
+
+from .submissions import get_submission_type
+
+
+# name   -> model field to display
+# label  -> heading shown above the value
+# kind   -> 'link' (URLField), 'text' (multi-line TextField) or 'value'
+# other  -> companion free-text field shown when the value is "Other"
+ReviewField = namedtuple('ReviewField', ['name', 'label', 'kind', 'other'])
+
+ReviewSchema = namedtuple('ReviewSchema', ['submission_type', 'heading', 'document', 'fields'])
+
+# heading  -> "<heading> Review" page title
+# document -> title of the uploaded PDF card
+# fields   -> field names in display order; (label, name) overrides the Meta label
+ReviewLayout = namedtuple('ReviewLayout', ['heading', 'document', 'fields'])
+
+OTHER_IILM_AUTHORS = ('Other IILM Authors', 'no_of_other_authors_from_iilm')
+
+REVIEW_LAYOUTS = {
+    'journal': ReviewLayout('Research Paper', 'Research Paper', (
+        'author_position', 'corresponding_author', 'journal_name', 'publisher', ('ISSN', 'issn'), 'volume',
+        'issue', ('Page Numbers', 'page_no'), ('Publication Month', 'month_of_publication'),
+        ('Publication Year', 'year_of_publication'), 'indexed_in', 'impact_factor', ('DOI / Link', 'doi_link'),
+        'funding_acknowledged', OTHER_IILM_AUTHORS,
+    )),
+    'conference': ReviewLayout('Conference Publication', 'Research Paper', (
+        'author_position', 'first_author', 'corresponding_author', 'conference_name', 'organizing_body',
+        ('ISBN', 'isbn'), 'type', 'mode', 'location', 'date_of_presentation', 'indexed_in',
+        ('DOI / Link', 'doi_link'), 'funding_acknowledged', OTHER_IILM_AUTHORS,
+    )),
+    'research': ReviewLayout('Research Projects', 'Sanctioned Letter', (
+        'project_title', 'funding_agency', 'principal_investigator', ('Co-Principal Investigator', 'co_pi'),
+        'amount_sanctioned', 'duration_from', 'duration_to', 'status', 'outcome', OTHER_IILM_AUTHORS,
+    )),
+    'patent': ReviewLayout('Patent', 'Patent Document', (
+        'title_of_patent', 'inventors', 'patent_number', 'patent_status', 'date_published', 'date_granted',
+        'jurisdiction', 'patent_type', OTHER_IILM_AUTHORS,
+    )),
+    'copyright': ReviewLayout('Copyright', 'Copyright Document', (
+        ('Title of Copyright', 'title_of_work'), ('Type of Copyright', 'type_of_work'), ('Author(s)', 'authors'),
+        'registration_number', 'date_of_grant', OTHER_IILM_AUTHORS,
+    )),
+    'phd_guidance': ReviewLayout('PHD Guidance', 'Thesis Document', (
+        'name_of_scholar', ('Outside IILM', 'outside_iilm'), 'thesis_title', 'role', ('PHD Status', 'phd_status'),
+        'date_of_completion', 'other_supervisors', OTHER_IILM_AUTHORS,
+    )),
+    'book_chapter': ReviewLayout('Book Chapter', 'Book Chapter Document', (
+        'chapter_title', 'book_title', 'publisher', ('ISBN', 'isbn'), 'publication_year', 'indexed',
+        'author_position', 'corresponding_author', OTHER_IILM_AUTHORS,
+    )),
+    'books_authored': ReviewLayout('Books Authored or Edited', 'Books Authored Proof Document', (
+        'book_title', 'authored_or_edited', 'publisher', ('ISBN', 'isbn'), 'publication_year', 'indexed',
+        ('Name of Author(s) or Editor(s)', 'authors_or_editors'), OTHER_IILM_AUTHORS,
+    )),
+    'consultancy_project': ReviewLayout('Consultancy Project', 'Consultancy Project Document', (
+        ('Consultancy Project Title', 'project_title'), 'industry_partner', 'duration',
+        ('Amount Sanctioned', 'amount_received'), 'role', 'outcomes', ('MOU Signed', 'mou_signed'),
+        OTHER_IILM_AUTHORS,
+    )),
+    'editorial_roles': ReviewLayout('Editorial Roles', 'Editorial Role Proof Document', (
+        'journal_name', 'publisher', ('Editorial Roles', 'editorial_role'), 'start_date', 'end_date',
+        ('Other IILM Editors', 'no_of_other_editors_from_iilm'),
+    )),
+    'reviewer_roles': ReviewLayout('Reviewer Roles', 'Reviewer Role Proof Document', (
+        ('Journal / Conference Name', 'journal_or_conference_name'),
+        ('Publisher / Organizer', 'publisher_or_organizer'), 'frequency_of_review', 'indexing_of_journal',
+    )),
+    'awards_achievements': ReviewLayout('Awards and Achievements', 'Awards & Achievements Proof Document', (
+        'title_of_award', 'awarding_body', 'level', 'date', 'nature_of_contribution',
+    )),
+    'industry_collaboration': ReviewLayout('Industry Collaboration', 'Industry Collaboration Proof Document', (
+        ('Industry Name', 'industry_name'), 'nature_of_collaboration', 'start_date', 'end_date', 'outcomes',
+        ('MOU Signed', 'mou_signed'),
+    )),
+}
+
+# Companion "please specify" fields, shown under their parent when it is "Other".
+OTHER_FIELDS = {
+    'indexed_in': 'other_index',
+}
+
+# Review bookkeeping that the page renders on its own (or not at all); never
+# part of a derived schema.
+REVIEW_COLUMNS = {
+    'id', 'user', 'pdf_upload', 'cluster_head_status', 'cluster_head_remarks', 'dean_status', 'dean_remarks',
+    'remarks', 'submitted_at', 'reviewed_at',
+}
+
+
+LOWERCASE_WORDS = {'a', 'an', 'and', 'from', 'in', 'of', 'or', 'the', 'to'}
+
+
+def _label(field):
+    words = str(field.verbose_name).split()
+    return ' '.join(
+        word if index and word in LOWERCASE_WORDS else word[:1].upper() + word[1:]
+        for index, word in enumerate(words)
+    )
+
+
+def _field_kind(field):
+    if isinstance(field, models.URLField):
+        return 'link'
+    if isinstance(field, models.TextField):
+        return 'text'
+    return 'value'
+
+
+def _derived_fields(submission_type):
+    hidden = REVIEW_COLUMNS | {submission_type.status_field} | set(OTHER_FIELDS.values())
+    return tuple(field.name for field in submission_type.model._meta.concrete_fields if field.name not in hidden)
+
+
+@lru_cache(maxsize=None)
+def review_schema(model):
+    """The compiled ReviewSchema of a submission model, built once per process."""
+
+    submission_type = get_submission_type(model)
+    layout = REVIEW_LAYOUTS.get(submission_type.key) or ReviewLayout(
+        submission_type.label, f"{submission_type.label} Document", _derived_fields(submission_type),
+    )
+
+    fields = []
+    for entry in layout.fields:
+        label, name = entry if isinstance(entry, tuple) else (None, entry)
+        field = model._meta.get_field(name)
+        other = OTHER_FIELDS.get(name)
+        if other is not None and not any(f.name == other for f in model._meta.concrete_fields):
+            other = None
+        fields.append(ReviewField(name, label or _label(field), _field_kind(field), other))
+
+    return ReviewSchema(submission_type, layout.heading, layout.document, tuple(fields))
+
+
+def review_rows(submission, schema):
+    """(field, value, other value) for each schema field, with choice fields shown by their label."""
+
+    rows = []
+    for field in schema.fields:
+        display = getattr(submission, f"get_{field.name}_display", None)
+        value = display() if display is not None else getattr(submission, field.name)
+        other = getattr(submission, field.other) if field.other and getattr(submission, field.name) == 'Other' else None
+        rows.append((field, value, other))
+    return rows
+
+
+def review_context(submission, reviewer, **extra):
+    """Template context for review_submission.html; `reviewer` is 'cluster_head' or 'dean'."""
+
+    schema = review_schema(type(submission))
+    return {
+        'submission': submission,
+        'reviewer': reviewer,
+        'schema': schema,
+        'title': getattr(submission, schema.submission_type.title_field),
+        'rows': review_rows(submission, schema),
+        **extra,
+    }
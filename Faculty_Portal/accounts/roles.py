@@ -0,0 +1,74 @@
+# accounts/roles.py
+"""
+Per-process cache of the RoleAssignment roster.
+
+Each worker keeps the whole roster as an {email: role} dict together with the
+version of the table it was loaded at: the latest updated_at and the row
+count, which every save, delete and bulk import moves. The version is read
+from the database, not from the cache, because the default cache is
+per-process LocMem when REDIS_URL is unset and a counter bumped there by
+`manage.py import_role_assignments` would never reach the web workers.
+
+Lookups inside ROLE_ROSTER_CHECK_INTERVAL seconds of the last check are a
+plain dict lookup; after that one aggregate query compares versions and the
+table is only re-read when it moved. roles_changed() makes the process that
+changed the roster skip the wait.
+"""
+
+import threading
+import time
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, Max
+
+from .models import RoleAssignment
+
+
+ROSTER_CHECK_INTERVAL = getattr(settings, 'ROLE_ROSTER_CHECK_INTERVAL', 10)
+
+_lock = threading.Lock()
+_roster = {}
+_loaded_version = None
+_checked_at = None
+
+
+def roster_version():
+    """(latest updated_at, row count) of the RoleAssignment table."""
+    version = RoleAssignment.objects.aggregate(latest=Max('updated_at'), count=Count('id'))
+    return version['latest'], version['count']
+
+
+def _current_roster():
+    global _roster, _loaded_version, _checked_at
+
+    checked_at = _checked_at
+    if checked_at is not None and time.monotonic() - checked_at < ROSTER_CHECK_INTERVAL:
+        return _roster
+
+    with _lock:
+        if _checked_at is None or time.monotonic() - _checked_at >= ROSTER_CHECK_INTERVAL:
+            version = roster_version()
+            if version != _loaded_version:
+                _roster = dict(RoleAssignment.objects.values_list('email', 'role'))
+                _loaded_version = version
+            _checked_at = time.monotonic()
+    return _roster
+
+
+def role_for_email(email):
+    """The role an email address is assigned, or None if it is not on the roster."""
+    return _current_roster().get(email.strip().lower())
+
+
+def _expire_roster():
+    global _checked_at
+    _checked_at = None
+
+
+def roles_changed():
+    """
+    Makes this process re-check the roster on its next lookup, once the current
+    transaction commits; other workers see the change within ROLE_ROSTER_CHECK_INTERVAL.
+    """
+    transaction.on_commit(_expire_roster)
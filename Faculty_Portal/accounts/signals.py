@@ -0,0 +1,102 @@
+# accounts/signals.py
+"""
+Model signal receivers that keep the denormalized submission data in sync
+with the 13 submission tables.
+"""
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_init, post_save, pre_delete, pre_save
+
+from .cache import FACULTY_GENERATION, bump_generation, submission_changed
+from .middleware import forget_faculty_user
+from .models import FacultyProfile, FacultyUser, RoleAssignment
+from .review import log_submission
+from .roles import roles_changed
+from .stats import move, review_state
+from .submission_index import remove_from_index, sync_index
+from .submissions import SUBMISSION_MODELS
+
+
+def remember_review_state(sender, instance, **kwargs):
+    # Snapshot of the bucket the row was loaded in, so post_save knows what it moved from.
+    instance._review_state = review_state(instance)
+
+
+def complete_review_state(sender, instance, raw=False, **kwargs):
+    # Rows loaded with .only()/.defer() have no snapshot of the deferred review
+    # columns; read the stored values once before they get overwritten.
+    if raw or instance._state.adding or None not in getattr(instance, '_review_state', (None,)):
+        return
+    instance._review_state = sender.objects.filter(pk=instance.pk).values_list(
+        'user_id', 'cluster_head_status', 'dean_status'
+    ).first()
+
+
+def update_stats_on_save(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    new_state = review_state(instance)
+    old_state = None if created else getattr(instance, '_review_state', None)
+    if old_state is not None and None in new_state:
+        # Columns still deferred were not loaded, so not changed: they keep their stored values.
+        new_state = tuple(old if new is None else new for new, old in zip(new_state, old_state))
+    move(instance, old_state, new_state)
+    submission_changed(instance, old_state, new_state)
+    instance._review_state = new_state
+
+
+def update_index_on_save(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    sync_index(instance, created)
+
+
+def log_submission_on_create(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        log_submission(instance)
+
+
+def read_review_state_on_delete(sender, instance, **kwargs):
+    # The instance may be older than the row (e.g. decided through apply_review()
+    # since it was loaded); the counter to decrement is the stored one.
+    stored = sender.objects.filter(pk=instance.pk).values_list('user_id', 'cluster_head_status', 'dean_status').first()
+    if stored is not None:
+        instance._review_state = stored
+
+
+def update_stats_on_delete(sender, instance, **kwargs):
+    old_state = getattr(instance, '_review_state', None) or review_state(instance)
+    move(instance, old_state, None)
+    submission_changed(instance, old_state, None)
+
+
+def update_index_on_delete(sender, instance, **kwargs):
+    remove_from_index(instance)
+
+
+def forget_cached_user(sender, instance, **kwargs):
+    # FacultyUser.user_id is the session UUID; FacultyProfile.user_id is the FK.
+    forget_faculty_user(instance.pk if sender is FacultyUser else instance.user_id)
+    transaction.on_commit(lambda: bump_generation(FACULTY_GENERATION))
+
+
+def reload_roster(sender, **kwargs):
+    roles_changed()
+
+
+for model in SUBMISSION_MODELS:
+    post_init.connect(remember_review_state, sender=model, dispatch_uid=f'stats_init_{model.__name__}')
+    pre_save.connect(complete_review_state, sender=model, dispatch_uid=f'stats_pre_save_{model.__name__}')
+    post_save.connect(update_stats_on_save, sender=model, dispatch_uid=f'stats_save_{model.__name__}')
+    pre_delete.connect(read_review_state_on_delete, sender=model, dispatch_uid=f'stats_pre_delete_{model.__name__}')
+    post_delete.connect(update_stats_on_delete, sender=model, dispatch_uid=f'stats_delete_{model.__name__}')
+    post_save.connect(update_index_on_save, sender=model, dispatch_uid=f'index_save_{model.__name__}')
+    post_save.connect(log_submission_on_create, sender=model, dispatch_uid=f'review_log_save_{model.__name__}')
+    post_delete.connect(update_index_on_delete, sender=model, dispatch_uid=f'index_delete_{model.__name__}')
+
+for model in (FacultyUser, FacultyProfile):
+    post_save.connect(forget_cached_user, sender=model, dispatch_uid=f'current_user_save_{model.__name__}')
+    post_delete.connect(forget_cached_user, sender=model, dispatch_uid=f'current_user_delete_{model.__name__}')
+
+post_save.connect(reload_roster, sender=RoleAssignment, dispatch_uid='roles_save')
+post_delete.connect(reload_roster, sender=RoleAssignment, dispatch_uid='roles_delete')
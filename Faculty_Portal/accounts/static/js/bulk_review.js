@@ -0,0 +1,69 @@
+// Bulk review bar shared by the cluster head and dean dashboards.
+//
+// setupBulkReview(url, csrfToken) wires the row checkboxes (.bulk-select,
+// carrying data-type and data-id), the select-all box (#bulkSelectAll) and
+// the bar (#bulkReviewBar with #bulkDecision, #bulkRemarks and #bulkApply)
+// to the bulk review endpoint at `url`: every ticked submission is decided
+// in one request, then the page is reloaded with the outcome summarised.
+
+function setupBulkReview(url, csrfToken) {
+  const bulkBar = document.getElementById('bulkReviewBar');
+  const bulkBoxes = Array.from(document.querySelectorAll('.bulk-select'));
+  const selectAll = document.getElementById('bulkSelectAll');
+  if (!bulkBar || !selectAll) {
+    return;
+  }
+
+  function updateBulkBar() {
+    const selected = bulkBoxes.filter((box) => box.checked).length;
+    document.getElementById('bulkSelectedCount').textContent = selected;
+    bulkBar.classList.toggle('hidden', selected === 0);
+  }
+
+  bulkBoxes.forEach((box) => box.addEventListener('change', updateBulkBar));
+  selectAll.addEventListener('change', () => {
+    bulkBoxes.forEach((box) => { box.checked = selectAll.checked; });
+    updateBulkBar();
+  });
+
+  document.getElementById('bulkApply').addEventListener('click', async () => {
+    const decision = document.getElementById('bulkDecision').value;
+    const remarks = document.getElementById('bulkRemarks').value;
+    const items = bulkBoxes.filter((box) => box.checked).map((box) => ({
+      type: box.dataset.type,
+      id: Number(box.dataset.id),
+      decision: decision,
+      remarks: remarks,
+    }));
+    if (!items.length || !confirm(`Apply this decision to ${items.length} submission(s)?`)) {
+      return;
+    }
+
+    const response = await fetch(url, {
+      method: 'POST',
+      headers: { 'Content-Type': 'application/json', 'X-CSRFToken': csrfToken },
+      body: JSON.stringify({ items: items }),
+    });
+    const result = await response.json();
+    if (!response.ok) {
+      alert(result.error || 'Bulk review failed.');
+      return;
+    }
+
+    let message = `${result.applied} submission(s) reviewed.`;
+    if (result.conflict) {
+      message += ` ${result.conflict} had already been reviewed by someone else and were left unchanged.`;
+    }
+    if (result.claimed) {
+      message += ` ${result.claimed} are claimed by another reviewer and were skipped.`;
+    }
+    if (result.not_found || result.invalid) {
+      message += ` ${result.not_found + result.invalid} could not be found.`;
+    }
+    if (result.notified) {
+      message += ` ${result.notified} faculty member(s) will be notified by e-mail.`;
+    }
+    alert(message);
+    window.location.reload();
+  });
+}
@@ -0,0 +1,53 @@
+// Live updates for the reviewer dashboards over Server-Sent Events.
+//
+// connectDashboardEvents(url, handlers, fallback) subscribes to the
+// dashboard event stream; `handlers` maps event names ("queue", "analytics")
+// to callbacks receiving the parsed JSON payload. `fallback` runs once if the
+// browser has no EventSource or the server refuses the stream (it answers
+// 204 when not running under ASGI), so the page can go back to polling.
+
+function connectDashboardEvents(url, handlers, fallback) {
+  if (!window.EventSource) {
+    fallback();
+    return null;
+  }
+
+  const source = new EventSource(url);
+  let fellBack = false;
+
+  Object.entries(handlers).forEach(([name, handler]) => {
+    source.addEventListener(name, (event) => handler(JSON.parse(event.data)));
+  });
+
+  source.onerror = () => {
+    // CONNECTING means the browser is already retrying; CLOSED means it gave up.
+    if (source.readyState === EventSource.CLOSED && !fellBack) {
+      fellBack = true;
+      fallback();
+    }
+  };
+
+  return source;
+}
+
+// Small banner telling a reviewer that new submissions reached their queue.
+function showQueueNotice(data) {
+  if (!data.added) {
+    return;
+  }
+
+  let notice = document.getElementById("queueNotice");
+  if (!notice) {
+    notice = document.createElement("div");
+    notice.id = "queueNotice";
+    notice.className =
+      "fixed bottom-6 right-6 z-50 bg-blue-600 text-white px-5 py-3 rounded-lg shadow-lg cursor-pointer";
+    notice.addEventListener("click", () => window.location.reload());
+    notice.dataset.count = "0";
+    document.body.appendChild(notice);
+  }
+
+  const count = parseInt(notice.dataset.count, 10) + data.added;
+  notice.dataset.count = String(count);
+  notice.textContent = `${count} new submission${count === 1 ? "" : "s"} in your queue - click to refresh`;
+}
@@ -0,0 +1,188 @@
+# accounts/stats.py
+"""
+Maintenance of the denormalized SubmissionStats counter table.
+
+Each bucket is (user, submission type, cluster head status, dean status).
+Saves and deletes of submission rows move one unit between buckets using
+atomic ``count = count + 1`` updates, so concurrent reviewers never lose an
+increment; batch reviews apply all of their moves at once with bump_many().
+rebuild_submission_stats() recomputes everything from the source
+tables (one UNION ALL query) and is used by the management command of the
+same name to repair drift.
+"""
+
+from django.db import IntegrityError, transaction
+from django.db.models import Case, CharField, Count, F, IntegerField, Value, When
+
+from .models import SubmissionStats
+from .submissions import SUBMISSION_TYPES, get_submission_type
+
+
+def review_state(instance):
+    """
+    The stats bucket an instance currently belongs to, read straight from
+    __dict__ so deferred fields never trigger an extra query.
+    """
+
+    return (
+        instance.__dict__.get('user_id'),
+        instance.__dict__.get('cluster_head_status'),
+        instance.__dict__.get('dean_status'),
+    )
+
+
+def bump(submission_type, state, delta):
+    """Atomically adds `delta` to the bucket for `state` = (user_id, cluster_head_status, dean_status)."""
+
+    user_id, cluster_head_status, dean_status = state
+    if user_id is None:
+        return
+
+    bucket = SubmissionStats.objects.filter(
+        user_id=user_id,
+        submission_type=submission_type,
+        cluster_head_status=cluster_head_status,
+        dean_status=dean_status,
+    )
+    if bucket.update(count=F('count') + delta) or delta < 0:
+        # A missing bucket on decrement is drift (or the user is being deleted
+        # and its buckets are already gone); rebuild_submission_stats repairs it.
+        return
+
+    try:
+        with transaction.atomic():
+            SubmissionStats.objects.create(
+                user_id=user_id,
+                submission_type=submission_type,
+                cluster_head_status=cluster_head_status,
+                dean_status=dean_status,
+                count=delta,
+            )
+    except IntegrityError:
+        # Another request created the bucket between our UPDATE and INSERT.
+        bucket.update(count=F('count') + delta)
+
+
+def bump_many(deltas):
+    """
+    Applies {(submission_type, state): delta} for a whole batch: one read of
+    the affected buckets, one UPDATE for those that exist and one INSERT for
+    the new ones, instead of a bump() round trip per bucket.
+    """
+
+    deltas = {key: delta for key, delta in deltas.items() if delta and key[1][0] is not None}
+    if not deltas:
+        return
+
+    existing = {
+        (submission_type, (user_id, cluster_head_status, dean_status)): pk
+        for pk, user_id, submission_type, cluster_head_status, dean_status in
+        SubmissionStats.objects.filter(
+            user_id__in={state[0] for _, state in deltas},
+            submission_type__in={submission_type for submission_type, _ in deltas},
+        ).values_list('pk', 'user_id', 'submission_type', 'cluster_head_status', 'dean_status')
+    }
+
+    updates = [(existing[key], delta) for key, delta in deltas.items() if key in existing]
+    if updates:
+        SubmissionStats.objects.filter(pk__in=[pk for pk, _ in updates]).update(count=F('count') + Case(
+            *(When(pk=pk, then=Value(delta)) for pk, delta in updates),
+            output_field=IntegerField(),
+        ))
+
+    # Decrements of missing buckets are drift, as in bump().
+    missing = {key: delta for key, delta in deltas.items() if key not in existing and delta > 0}
+    if not missing:
+        return
+
+    try:
+        with transaction.atomic():
+            SubmissionStats.objects.bulk_create([
+                SubmissionStats(
+                    user_id=user_id,
+                    submission_type=submission_type,
+                    cluster_head_status=cluster_head_status,
+                    dean_status=dean_status,
+                    count=delta,
+                )
+                for (submission_type, (user_id, cluster_head_status, dean_status)), delta in missing.items()
+            ])
+    except IntegrityError:
+        # Another request created one of the buckets meanwhile; fall back to bump()'s retry.
+        for (submission_type, state), delta in missing.items():
+            bump(submission_type, state, delta)
+
+
+def move(instance, old_state, new_state):
+    """Records a submission moving from one review state to another (None = not present)."""
+
+    if old_state == new_state:
+        return
+    submission_type = get_submission_type(instance).key
+    if old_state is not None:
+        bump(submission_type, old_state, -1)
+    if new_state is not None:
+        bump(submission_type, new_state, 1)
+
+
+def compute_submission_stats():
+    """
+    Recomputes every bucket from the submission tables in a single UNION ALL
+    query. Returns {(user_id, submission_type, cluster_head_status, dean_status): count}.
+    """
+
+    querysets = [
+        st.model.objects.annotate(kind=Value(st.key, output_field=CharField()))
+        .values('user_id', 'kind', 'cluster_head_status', 'dean_status')
+        .annotate(count=Count('pk'))
+        .order_by()
+        for st in SUBMISSION_TYPES
+    ]
+    rows = querysets[0].union(*querysets[1:], all=True)
+    return {
+        (row['user_id'], row['kind'], row['cluster_head_status'], row['dean_status']): row['count']
+        for row in rows
+    }
+
+
+def stored_submission_stats():
+    """Current contents of the SubmissionStats table, keyed like compute_submission_stats()."""
+
+    return {
+        (user_id, submission_type, cluster_head_status, dean_status): count
+        for user_id, submission_type, cluster_head_status, dean_status, count in
+        SubmissionStats.objects.exclude(count=0).values_list(
+            'user_id', 'submission_type', 'cluster_head_status', 'dean_status', 'count'
+        )
+    }
+
+
+def find_drift(expected=None, stored=None):
+    """Returns {bucket: (stored, expected)} for every bucket whose stored count is wrong."""
+
+    expected = compute_submission_stats() if expected is None else expected
+    stored = stored_submission_stats() if stored is None else stored
+    return {
+        key: (stored.get(key, 0), expected.get(key, 0))
+        for key in set(expected) | set(stored)
+        if stored.get(key, 0) != expected.get(key, 0)
+    }
+
+
+@transaction.atomic
+def rebuild_submission_stats(expected=None):
+    """Replaces the SubmissionStats table with freshly computed counts."""
+
+    expected = compute_submission_stats() if expected is None else expected
+    SubmissionStats.objects.all().delete()
+    SubmissionStats.objects.bulk_create([
+        SubmissionStats(
+            user_id=user_id,
+            submission_type=submission_type,
+            cluster_head_status=cluster_head_status,
+            dean_status=dean_status,
+            count=count,
+        )
+        for (user_id, submission_type, cluster_head_status, dean_status), count in expected.items()
+    ])
+    return len(expected)
@@ -0,0 +1,302 @@
+# accounts/submission_index.py
+"""
+Maintenance of, and queries over, the polymorphic SubmissionIndex table.
+
+Every submission row has exactly one SubmissionIndex entry carrying its
+content type, owner, title, the three review status columns and
+submitted_at. Review queues are a single ordered, paginated query over that
+table; only the rows on the requested page are then loaded from their
+source models for the templates.
+"""
+
+import base64
+from datetime import datetime
+
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.core.paginator import Paginator
+from django.db import transaction
+from django.db.models import F, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
+from django.http import QueryDict
+from django.urls import reverse
+from django.utils import timezone
+
+from .cache import queues_changed
+from .models import ReviewEvent, SubmissionIndex
+from .submissions import SUBMISSION_TYPES, get_submission_type
+
+
+QUEUE_PAGE_SIZE = getattr(settings, 'REVIEW_QUEUE_PAGE_SIZE', 25)
+QUEUE_MAX_PAGE_SIZE = 100
+
+# Newest first. (content type, object id) makes the order total and stable
+# across all 13 submission types, which keyset pagination relies on.
+QUEUE_ORDERING = ('-submitted_at', '-content_type_id', '-object_id')
+
+
+def index_fields(instance):
+    """The SubmissionIndex column values for a submission instance."""
+
+    st = get_submission_type(instance)
+    return {
+        'user_id': instance.user_id,
+        'title': (getattr(instance, st.title_field) or '')[:255],
+        'status': getattr(instance, st.status_field),
+        'cluster_head_status': instance.cluster_head_status,
+        'dean_status': instance.dean_status,
+        'submitted_at': instance.submitted_at,
+    }
+
+
+def sync_index(instance, created=False):
+    """
+    Creates or refreshes the index entry for a saved submission. A new entry
+    is queued since its submission, and an entry whose status moved is
+    re-queued now (decisions taken through accounts/review.py update the
+    index themselves). Either way the backlog generation moves; saves that
+    leave the status alone do not touch it.
+    """
+
+    fields = index_fields(instance)
+    key = {'content_type': ContentType.objects.get_for_model(instance), 'object_id': instance.pk}
+    if not created:
+        entry = SubmissionIndex.objects.filter(**key)
+        if entry.exclude(status=fields['status']).update(**fields, queued_at=timezone.now()):
+            queues_changed()
+            return
+        if entry.update(**fields):
+            return
+
+    SubmissionIndex.objects.create(**key, **fields, queued_at=instance.submitted_at or timezone.now())
+    queues_changed()
+
+
+def remove_from_index(instance):
+    if SubmissionIndex.objects.filter(
+        content_type=ContentType.objects.get_for_model(instance),
+        object_id=instance.pk,
+    ).delete()[0]:
+        queues_changed()
+
+
+@transaction.atomic
+def rebuild_submission_index(batch_size=500):
+    """Recreates the whole index from the submission tables. Returns the number of entries."""
+
+    SubmissionIndex.objects.all().delete()
+    total = 0
+    for st in SUBMISSION_TYPES:
+        content_type = ContentType.objects.get_for_model(st.model)
+        entries = [
+            SubmissionIndex(content_type=content_type, object_id=obj.pk, **index_fields(obj))
+            for obj in st.model.objects.all().iterator(chunk_size=batch_size)
+        ]
+        SubmissionIndex.objects.bulk_create(entries, batch_size=batch_size)
+        refresh_queued_at(st, content_type)
+        total += len(entries)
+    queues_changed()
+    return total
+
+
+def refresh_queued_at(submission_type, content_type):
+    """
+    Recomputes queued_at for every index entry of one submission type: the time
+    of its latest ReviewEvent, or submitted_at when it has none. One UPDATE.
+    """
+
+    latest_event = ReviewEvent.objects.filter(
+        submission_type=submission_type.key, object_id=OuterRef('object_id'),
+    ).order_by('-created_at').values('created_at')[:1]
+    SubmissionIndex.objects.filter(content_type=content_type).update(
+        queued_at=Coalesce(Subquery(latest_event), F('submitted_at')),
+    )
+
+
+def cluster_head_queue():
+    """Submissions waiting for a cluster head decision."""
+    return SubmissionIndex.objects.filter(status='submitted').order_by(*QUEUE_ORDERING)
+
+
+def dean_queue():
+    """Submissions approved by a cluster head and waiting for the dean."""
+    return SubmissionIndex.objects.filter(status='approved_by_cluster').order_by(*QUEUE_ORDERING)
+
+
+def user_queue(user):
+    """Everything a faculty member has submitted."""
+    return SubmissionIndex.objects.filter(user=user).order_by(*QUEUE_ORDERING)
+
+
+def hydrate(entries, review_url_attr=None):
+    """
+    Loads the source submission objects behind a page of index entries, in the
+    same order, tagged with `submission_type`, `submission_key`, their
+    `index_entry` (and `review_url` when `review_url_attr` names a
+    SubmissionType url field).
+    One query per submission type present on the page.
+    """
+
+    entries = list(entries)
+    ids_by_content_type = {}
+    for entry in entries:
+        ids_by_content_type.setdefault(entry.content_type_id, []).append(entry.object_id)
+
+    objects = {}
+    for content_type_id, ids in ids_by_content_type.items():
+        model = ContentType.objects.get_for_id(content_type_id).model_class()
+        for obj in model.objects.filter(pk__in=ids).select_related('user'):
+            objects[(content_type_id, obj.pk)] = obj
+
+    submissions = []
+    for entry in entries:
+        obj = objects.get((entry.content_type_id, entry.object_id))
+        if obj is None:
+            # Deleted between the index query and the hydration query.
+            continue
+        st = get_submission_type(obj)
+        obj.submission_type = st.label
+        obj.submission_key = st.key
+        obj.index_entry = entry
+        if review_url_attr:
+            obj.review_url = reverse(getattr(st, review_url_attr), args=[obj.pk])
+        submissions.append(obj)
+    return submissions
+
+
+def paginate_queue(queryset, page_number, review_url_attr=None, per_page=QUEUE_PAGE_SIZE):
+    """
+    Returns a Paginator page whose object_list holds the hydrated submissions
+    for the requested page of an index queryset.
+    """
+
+    page = Paginator(queryset, per_page).get_page(page_number)
+    page.object_list = hydrate(page.object_list, review_url_attr)
+    return page
+
+
+def encode_cursor(entry):
+    """Opaque cursor for the (submitted_at, type, id) position of an index entry."""
+
+    raw = f"{entry.submitted_at.isoformat()}|{entry.content_type_id}|{entry.object_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    """Inverse of encode_cursor; returns None for anything that is not a valid cursor."""
+
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)).decode()
+        submitted_at, content_type_id, object_id = raw.split('|')
+        return datetime.fromisoformat(submitted_at), int(content_type_id), int(object_id)
+    except (ValueError, UnicodeDecodeError):
+        return None
+
+
+def _older_than(position):
+    submitted_at, content_type_id, object_id = position
+    return (
+        Q(submitted_at__lt=submitted_at)
+        | Q(submitted_at=submitted_at, content_type_id__lt=content_type_id)
+        | Q(submitted_at=submitted_at, content_type_id=content_type_id, object_id__lt=object_id)
+    )
+
+
+def _newer_than(position):
+    submitted_at, content_type_id, object_id = position
+    return (
+        Q(submitted_at__gt=submitted_at)
+        | Q(submitted_at=submitted_at, content_type_id__gt=content_type_id)
+        | Q(submitted_at=submitted_at, content_type_id=content_type_id, object_id__gt=object_id)
+    )
+
+
+class CursorPage:
+    """
+    One keyset-paginated page of a review queue. `object_list` holds the
+    hydrated submissions; next/previous links are query strings carrying
+    `after` / `before` cursors and the page size, on top of the other
+    parameters of the current request (filters such as `view`).
+    """
+
+    def __init__(self, object_list, page_size, next_cursor=None, previous_cursor=None, params=None):
+        self.object_list = object_list
+        self.page_size = page_size
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+        self.params = params
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def has_previous(self):
+        return self.previous_cursor is not None
+
+    def has_other_pages(self):
+        return self.has_next() or self.has_previous()
+
+    def _querystring(self, **cursor):
+        params = self.params.copy() if self.params is not None else QueryDict(mutable=True)
+        for key in ('after', 'before', 'page_size'):
+            params.pop(key, None)
+        params.update({**cursor, 'page_size': self.page_size})
+        return params.urlencode()
+
+    def next_querystring(self):
+        return self._querystring(after=self.next_cursor)
+
+    def previous_querystring(self):
+        return self._querystring(before=self.previous_cursor)
+
+
+def parse_page_size(value):
+    try:
+        page_size = int(value)
+    except (TypeError, ValueError):
+        return QUEUE_PAGE_SIZE
+    return max(1, min(page_size, QUEUE_MAX_PAGE_SIZE))
+
+
+def keyset_page(queryset, after=None, before=None, page_size=QUEUE_PAGE_SIZE, review_url_attr=None, params=None):
+    """
+    Returns the CursorPage of an index queryset that follows `after` or precedes
+    `before` in QUEUE_ORDERING. Each page is a single `WHERE (position) < cursor
+    ORDER BY ... LIMIT page_size + 1` range scan, so deep pages cost the same as
+    the first one. Invalid cursors fall back to the first page. `params` (the
+    request's GET QueryDict) is kept in the page's next/previous links.
+    """
+
+    after = decode_cursor(after) if after else None
+    before = decode_cursor(before) if before and not after else None
+
+    if before is not None:
+        # Walk backwards from the cursor, then restore the display order.
+        ascending = [field.lstrip('-') for field in QUEUE_ORDERING]
+        rows = list(queryset.filter(_newer_than(before)).order_by(*ascending)[:page_size + 1])
+        has_more_before = len(rows) > page_size
+        rows = rows[:page_size][::-1]
+        has_more_after = True
+    else:
+        if after is not None:
+            queryset = queryset.filter(_older_than(after))
+        rows = list(queryset.order_by(*QUEUE_ORDERING)[:page_size + 1])
+        has_more_after = len(rows) > page_size
+        rows = rows[:page_size]
+        has_more_before = after is not None
+
+    return CursorPage(
+        hydrate(rows, review_url_attr),
+        page_size,
+        next_cursor=encode_cursor(rows[-1]) if rows and has_more_after else None,
+        previous_cursor=encode_cursor(rows[0]) if rows and has_more_before else None,
+        params=params,
+    )
@@ -0,0 +1,259 @@
+# accounts/submissions.py
+"""
+Shared registry of the 13 faculty submission models and the aggregation
+engine that every dashboard / analytics view reads its counters from.
+
+All submission models carry the same review columns (cluster_head_status,
+dean_status, a consolidated review status and submitted_at), so instead of
+repeating 13 ``.count()`` calls per counter the views ask this module for the
+numbers and it answers them in a single ``UNION ALL`` round trip.
+"""
+
+import heapq
+import operator
+from collections import namedtuple
+from functools import reduce
+from itertools import islice
+from operator import attrgetter
+
+from django.db.models import CharField, Count, IntegerField, OuterRef, Q, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+
+from .models import (
+    SubmissionStats, JournalPublication, ConferencePublication, ResearchProject, Patents, Copyright, PhdGuidance,
+    BookChapter, BooksAuthored, ConsultancyProjects, EditorialRoles, ReviewerRoles,
+    AwardsAchievements, IndustryCollaboration,
+)
+
+
+# key            -> short identifier used in URLs, cache keys and the union query
+# label          -> the `submission_type` string the templates switch on
+# title_field    -> field holding the human readable title of the submission
+# status_field   -> consolidated review status ('overall_status' on ResearchProject,
+#                   whose `status` column is the project's own lifecycle)
+# review_url     -> cluster head review view name
+# dean_review_url-> dean review view name
+SubmissionType = namedtuple(
+    'SubmissionType',
+    ['key', 'model', 'label', 'title_field', 'status_field', 'review_url', 'dean_review_url'],
+)
+
+SUBMISSION_TYPES = [
+    SubmissionType('journal', JournalPublication, 'Journal Publication', 'title_of_paper', 'status',
+                   'review_submission_journal', 'dean_review_journal'),
+    SubmissionType('conference', ConferencePublication, 'Conference Publication', 'title_of_paper', 'status',
+                   'review_submission_conference', 'dean_review_conference'),
+    SubmissionType('research', ResearchProject, 'Research Project', 'project_title', 'overall_status',
+                   'review_submission_research', 'dean_review_research'),
+    SubmissionType('patent', Patents, 'Patent Submission', 'title_of_patent', 'status',
+                   'review_submission_patent', 'dean_review_patent'),
+    SubmissionType('copyright', Copyright, 'Copyright Submission', 'title_of_work', 'status',
+                   'review_submission_copyright', 'dean_review_copyright'),
+    SubmissionType('phd_guidance', PhdGuidance, 'PhD Guidance', 'thesis_title', 'status',
+                   'review_submission_phd_guidance', 'dean_review_phd_guidance'),
+    SubmissionType('book_chapter', BookChapter, 'Book Chapter', 'chapter_title', 'status',
+                   'review_submission_book_chapter', 'dean_review_book_chapter'),
+    SubmissionType('books_authored', BooksAuthored, 'Books Authored', 'book_title', 'status',
+                   'review_submission_books_authored', 'dean_review_books_authored'),
+    SubmissionType('consultancy_project', ConsultancyProjects, 'Consultancy Project', 'project_title', 'status',
+                   'review_submission_consultancy_project', 'dean_review_consultancy_project'),
+    SubmissionType('editorial_roles', EditorialRoles, 'Editorial Roles', 'journal_name', 'status',
+                   'review_submission_editorial_roles', 'dean_review_editorial_roles'),
+    SubmissionType('reviewer_roles', ReviewerRoles, 'Reviewer Roles', 'journal_or_conference_name', 'status',
+                   'review_submission_reviewer_roles', 'dean_review_reviewer_roles'),
+    SubmissionType('awards_achievements', AwardsAchievements, 'Awards & Achievements', 'title_of_award', 'status',
+                   'review_submission_awards_achievements', 'dean_review_awards_achievements'),
+    SubmissionType('industry_collaboration', IndustryCollaboration, 'Industry Collaboration', 'industry_name', 'status',
+                   'review_submission_industry_collaboration', 'dean_review_industry_collaboration'),
+]
+
+SUBMISSION_TYPES_BY_KEY = {st.key: st for st in SUBMISSION_TYPES}
+SUBMISSION_TYPES_BY_MODEL = {st.model: st for st in SUBMISSION_TYPES}
+SUBMISSION_MODELS = tuple(st.model for st in SUBMISSION_TYPES)
+
+
+def get_submission_type(model_or_key):
+    """Looks up the registry entry for a submission model, instance or key."""
+    if isinstance(model_or_key, str):
+        return SUBMISSION_TYPES_BY_KEY[model_or_key]
+    if not isinstance(model_or_key, type):
+        model_or_key = type(model_or_key)
+    return SUBMISSION_TYPES_BY_MODEL[model_or_key]
+
+
+# Every counter the dashboards display, expressed once as (review column,
+# accepted values) so it can be evaluated both in SQL and against the
+# pre-aggregated SubmissionStats buckets. `None` means "count every row".
+COUNTERS = {
+    'total': None,
+    'pending': ('dean_status', ('submitted', 'pending')),
+    'approved': ('dean_status', ('approved',)),
+    'rejected': ('dean_status', ('rejected',)),
+    'revision': ('dean_status', ('revision',)),
+    'cluster_pending': ('cluster_head_status', ('pending',)),
+    'cluster_approved': ('cluster_head_status', ('approved',)),
+    'cluster_rejected': ('cluster_head_status', ('rejected',)),
+    'cluster_revision': ('cluster_head_status', ('revision',)),
+}
+
+
+def _empty_counts():
+    return {name: 0 for name in COUNTERS}
+
+
+def _counter_annotations():
+    annotations = {}
+    for name, condition in COUNTERS.items():
+        if condition is None:
+            annotations[name] = Count('pk')
+        else:
+            field, values = condition
+            annotations[name] = Count('pk', filter=Q(**{f'{field}__in': values}))
+    return annotations
+
+
+def _bucket_matches(condition, cluster_head_status, dean_status):
+    if condition is None:
+        return True
+    field, values = condition
+    value = cluster_head_status if field == 'cluster_head_status' else dean_status
+    return value in values
+
+
+def aggregate_submissions(user=None, types=None):
+    """
+    Computes every counter in COUNTERS for all submission models in one query.
+
+    Each model contributes a single conditionally-aggregated row tagged with its
+    registry key, and the 13 rows are glued together with UNION ALL so the
+    database is hit exactly once no matter how many types are involved.
+
+    Returns ``{'total': ..., 'pending': ..., ..., 'by_type': {key: {...}}}``;
+    types without any rows still appear in ``by_type`` with zero counts.
+    """
+
+    submission_types = [SUBMISSION_TYPES_BY_KEY[key] for key in types] if types else SUBMISSION_TYPES
+
+    querysets = []
+    for st in submission_types:
+        qs = st.model.objects.all()
+        if user is not None:
+            qs = qs.filter(user=user)
+        qs = (
+            qs.annotate(kind=Value(st.key, output_field=CharField()))
+            .values('kind')
+            .annotate(**_counter_annotations())
+            .order_by()
+        )
+        querysets.append(qs)
+
+    rows = querysets[0].union(*querysets[1:], all=True) if len(querysets) > 1 else querysets[0]
+
+    counts = _empty_counts()
+    counts['by_type'] = {st.key: _empty_counts() for st in submission_types}
+    for row in rows:
+        kind = row.pop('kind')
+        counts['by_type'][kind] = row
+        for name, value in row.items():
+            counts[name] += value
+    return counts
+
+
+def counts_from_stats(stats_rows):
+    """
+    Folds SubmissionStats buckets into the same shape aggregate_submissions returns.
+    `stats_rows` is an iterable of (submission_type, cluster_head_status, dean_status, count).
+    """
+
+    counts = _empty_counts()
+    counts['by_type'] = {st.key: _empty_counts() for st in SUBMISSION_TYPES}
+    for submission_type, cluster_head_status, dean_status, count in stats_rows:
+        type_counts = counts['by_type'].setdefault(submission_type, _empty_counts())
+        for name, condition in COUNTERS.items():
+            if _bucket_matches(condition, cluster_head_status, dean_status):
+                type_counts[name] += count
+                counts[name] += count
+    return counts
+
+
+def user_submission_counts(user):
+    """
+    Dashboard counters for a single faculty member, read from the incrementally
+    maintained SubmissionStats table (one indexed lookup on user_id).
+    """
+
+    rows = SubmissionStats.objects.filter(user=user).values_list(
+        'submission_type', 'cluster_head_status', 'dean_status', 'count'
+    )
+    return counts_from_stats(rows)
+
+
+def annotate_submission_totals(users, types=None, year=None):
+    """
+    Annotates a FacultyUser queryset with `total`, the number of their
+    submissions, optionally restricted to some submission type keys and a year
+    of submission. Users without any matching submission get 0.
+
+    The totals are correlated subqueries of the same query, so ordering by
+    `total` and slicing (top N) happen in the database: without a year filter
+    one SUM over the user's SubmissionStats buckets, with one a COUNT per model
+    served by its (user, submitted_at) index.
+    """
+
+    submission_types = [SUBMISSION_TYPES_BY_KEY[key] for key in types] if types else SUBMISSION_TYPES
+
+    if year is None:
+        buckets = SubmissionStats.objects.filter(
+            user=OuterRef('pk'), submission_type__in=[st.key for st in submission_types],
+        ).values('user').annotate(total=Sum('count')).values('total')
+        return users.annotate(total=Coalesce(Subquery(buckets, output_field=IntegerField()), 0))
+
+    counts = [
+        Coalesce(Subquery(
+            st.model.objects.filter(user=OuterRef('pk'), submitted_at__year=year)
+            .values('user').annotate(count=Count('pk')).values('count'),
+            output_field=IntegerField(),
+        ), 0)
+        for st in submission_types
+    ]
+    return users.annotate(total=reduce(operator.add, counts))
+
+
+def merge_submission_feeds(feeds, limit=None, chunk_size=100):
+    """
+    Lazily merges per-type submission querysets that are each already ordered
+    newest first (`-submitted_at`) into a single newest-first stream.
+
+    `feeds` is an iterable of (SubmissionType, queryset) pairs. Every queryset
+    is consumed through a DB-side `.iterator()`, heapq.merge only keeps one
+    pending row per type in memory, and the stream stops after `limit` items,
+    so the first N submissions never require materializing the rest. Each
+    yielded object is tagged with its `submission_type` label.
+    """
+
+    def tagged(st, queryset):
+        for obj in queryset.iterator(chunk_size=chunk_size):
+            obj.submission_type = st.label
+            yield obj
+
+    merged = heapq.merge(
+        *(tagged(st, queryset) for st, queryset in feeds),
+        key=attrgetter('submitted_at'),
+        reverse=True,
+    )
+    return islice(merged, limit) if limit is not None else merged
+
+
+def user_submission_feed(user, limit=None):
+    """
+    Newest-first stream of everything `user` has submitted, across all types.
+    With a limit, each per-type query is capped at `limit` rows as well.
+    """
+
+    feeds = []
+    for st in SUBMISSION_TYPES:
+        queryset = st.model.objects.filter(user=user).order_by('-submitted_at')
+        if limit is not None:
+            queryset = queryset[:limit]
+        feeds.append((st, queryset))
+    return merge_submission_feeds(feeds, limit=limit, chunk_size=limit or 100)
@@ -0,0 +1,68 @@
+# accounts/template_warmup.py
+"""
+Precompiles the project's templates into the cached template loader.
+
+The cached loader keeps every template it has compiled for the lifetime of
+the process, but only compiles one when it is first requested, so each new
+worker pays the parsing cost of the large review templates on its first few
+requests. warm_templates() is called from wsgi.py and asgi.py when
+TEMPLATE_WARMUP is on and loads every template under the project template
+directories and accounts/templates up front. Under ``gunicorn --preload``
+this happens once in the master and the forked workers inherit the cache.
+"""
+
+import logging
+import os
+import time
+from pathlib import Path
+
+from django.apps import apps
+from django.template import Engine, TemplateSyntaxError
+
+
+logger = logging.getLogger(__name__)
+
+
+def template_names(engine=None):
+    """Names of every template in the engine's DIRS and accounts/templates."""
+
+    engine = engine or Engine.get_default()
+    directories = [Path(directory) for directory in engine.dirs]
+    directories.append(Path(apps.get_app_config('accounts').path) / 'templates')
+
+    names = set()
+    for directory in directories:
+        if not directory.is_dir():
+            continue
+        for root, _, files in os.walk(directory):
+            for filename in files:
+                if filename.endswith(('.html', '.txt')):
+                    names.add((Path(root) / filename).relative_to(directory).as_posix())
+    return sorted(names)
+
+
+def warm_templates(engine=None):
+    """Compiles every template into the cached loader; returns (templates loaded, seconds taken)."""
+
+    engine = engine or Engine.get_default()
+    names = template_names(engine)
+
+    start = time.perf_counter()
+    for name in names:
+        try:
+            engine.get_template(name)
+        except TemplateSyntaxError:
+            # Leave it to fail on the request that renders it rather than taking the worker down.
+            logger.exception("Template %s could not be compiled during warm-up", name)
+    elapsed = time.perf_counter() - start
+
+    logger.info("Warmed %d templates in %.1f ms", len(names), elapsed * 1000)
+    return len(names), elapsed
+
+
+def reset_templates(engine=None):
+    """Empties the cached loader, as in a freshly started worker."""
+
+    engine = engine or Engine.get_default()
+    for loader in engine.template_loaders:
+        loader.reset()
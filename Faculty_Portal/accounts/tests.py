@@ -1,3 +1,766 @@
+import base64
+import datetime
+import json
+from datetime import timedelta
+from unittest import mock
+
+import cloudinary
+from asgiref.sync import sync_to_async
+from django.core import mail
+from django.core.cache import cache
+from django.db import transaction
+from django.http import QueryDict
 from django.test import TestCase
+from django.urls import reverse, reverse_lazy
+from django.utils import timezone
+
+from .backlog import review_backlog
+from .cache import BACKLOG_GENERATION, FACULTY_GENERATION, bump_generation, generations
+from .claims import (
+    CLAIM_LEASE, claim_holder, claim_next, claim_summary, held_by, held_by_others, release_claims, renew_claim,
+    unclaimed,
+)
+from .events import dashboard_event_stream, format_event
+from .models import AwardsAchievements, FacultyUser, ReviewEvent, ReviewerRoles, SubmissionIndex
+from .notifications import queue_decision_notifications
+from .review import BULK_REVIEW_MAX_ITEMS, REVIEW_STAGES, InvalidDecision, ReviewConflict, apply_review, apply_reviews
+from .stats import bump_many, find_drift, stored_submission_stats
+from .submission_index import (
+    QUEUE_MAX_PAGE_SIZE, QUEUE_PAGE_SIZE, cluster_head_queue, decode_cursor, keyset_page, parse_page_size,
+)
+from .submissions import annotate_submission_totals, get_submission_type, user_submission_counts
+
+
+def make_user(email, role='faculty', **extra):
+    return FacultyUser.objects.create(
+        full_name=email.split('@')[0].title(), email=email, role=role, is_verified=True, **extra
+    )
+
+
+def make_award(user, title='Best Paper', **extra):
+    return AwardsAchievements.objects.create(
+        user=user, title_of_award=title, awarding_body='IEEE', level='national',
+        date=datetime.date(2024, 1, 1), nature_of_contribution='Author', pdf_upload='award.pdf', **extra
+    )
+
+
+def make_reviewer_role(user, name='Journal of Testing', **extra):
+    return ReviewerRoles.objects.create(
+        user=user, journal_or_conference_name=name, publisher_or_organizer='Elsevier',
+        frequency_of_review='Monthly', indexing_of_journal='scopus', pdf_upload='review.pdf', **extra
+    )
+
+
+def login(client, user):
+    session = client.session
+    session['user_id'] = str(user.user_id)
+    session['user_role'] = user.role
+    session.save()
+    return client
+
+
+def approved_by_cluster(submission):
+    """Moves a fresh submission into the dean queue through the cluster head stage."""
+    return apply_review(submission, 'cluster_head', 'approved_by_cluster', 'Looks good')
+
+
+class PortalTestCase(TestCase):
+    """Clears the generation counters and cached values the LocMem cache keeps across tests."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Templates build Cloudinary URLs for the uploads; only the cloud name is needed for that.
+        if not cloudinary.config().cloud_name:
+            cloudinary.config(cloud_name='faculty-portal-tests')
+
+    def setUp(self):
+        cache.clear()
+        self.faculty = make_user('faculty@iilm.edu')
+        self.cluster_head = make_user('head@iilm.edu', role='cluster_head')
+        self.dean = make_user('dean@iilm.edu', role='dean')
+
+
+class ApplyReviewTests(PortalTestCase):
+
+    def test_every_stage_decision(self):
+        for stage, review_stage in REVIEW_STAGES.items():
+            for decision, (stage_status, new_status) in review_stage.decisions.items():
+                with self.subTest(stage=stage, decision=decision):
+                    award = make_award(self.faculty)
+                    if stage == 'dean':
+                        approved_by_cluster(award)
+
+                    apply_review(award, stage, decision, 'Remarks')
+
+                    award.refresh_from_db()
+                    self.assertEqual(award.status, new_status)
+                    self.assertEqual(getattr(award, review_stage.status_field), stage_status)
+                    self.assertEqual(getattr(award, review_stage.remarks_field), 'Remarks')
+                    entry = SubmissionIndex.objects.get(object_id=award.pk, content_type__model='awardsachievements')
+                    self.assertEqual((entry.status, getattr(entry, review_stage.status_field)), (new_status, stage_status))
+
+    def test_unknown_decision_is_rejected(self):
+        award = make_award(self.faculty)
+        with self.assertRaises(InvalidDecision):
+            apply_review(award, 'cluster_head', 'approve', '')
+        with self.assertRaises(InvalidDecision):
+            apply_review(award, 'dean', 'approved_by_cluster', '')
+        award.refresh_from_db()
+        self.assertEqual(award.status, 'submitted')
+
+    def test_dean_cannot_decide_before_the_cluster_head(self):
+        award = make_award(self.faculty)
+        with self.assertRaises(ReviewConflict) as raised:
+            apply_review(award, 'dean', 'approve', '')
+        self.assertEqual(raised.exception.current_status, 'submitted')
+
+    def test_second_reviewer_on_a_stale_page_gets_a_conflict(self):
+        award = make_award(self.faculty)
+        first = AwardsAchievements.objects.get(pk=award.pk)
+        second = AwardsAchievements.objects.get(pk=award.pk)
+
+        apply_review(first, 'cluster_head', 'approved_by_cluster', 'First')
+        with self.assertRaises(ReviewConflict) as raised:
+            apply_review(second, 'cluster_head', 'rejected_by_cluster', 'Second')
+
+        self.assertEqual(raised.exception.current_status, 'approved_by_cluster')
+        self.assertEqual(raised.exception.get_current_status_display(), 'Approved by Cluster Head')
+        award.refresh_from_db()
+        self.assertEqual((award.status, award.cluster_head_remarks), ('approved_by_cluster', 'First'))
+
+    def test_conflict_on_a_deleted_submission(self):
+        award = make_award(self.faculty)
+        stale = AwardsAchievements.objects.get(pk=award.pk)
+        award.delete()
+        with self.assertRaises(ReviewConflict) as raised:
+            apply_review(stale, 'cluster_head', 'revision', '')
+        self.assertIsNone(raised.exception.current_status)
+
+    def test_each_transition_is_logged(self):
+        award = make_award(self.faculty)
+        apply_review(award, 'cluster_head', 'approved_by_cluster', '', actor=self.cluster_head)
+        apply_review(award, 'dean', 'reject', '', actor=self.dean)
+
+        events = list(
+            ReviewEvent.objects.filter(submission_type='awards_achievements', object_id=award.pk)
+            .order_by('created_at', 'id')
+            .values_list('stage', 'actor', 'from_status', 'to_status')
+        )
+        self.assertEqual(events, [
+            ('submission', self.faculty.pk, '', 'submitted'),
+            ('cluster_head', self.cluster_head.pk, 'submitted', 'approved_by_cluster'),
+            ('dean', self.dean.pk, 'approved_by_cluster', 'rejected_by_dean'),
+        ])
+
+    def test_a_conflict_logs_nothing(self):
+        award = make_award(self.faculty)
+        stale = AwardsAchievements.objects.get(pk=award.pk)
+        apply_review(award, 'cluster_head', 'revision', '')
+        with self.assertRaises(ReviewConflict):
+            apply_review(stale, 'cluster_head', 'approved_by_cluster', '')
+        self.assertEqual(ReviewEvent.objects.filter(stage='cluster_head', object_id=award.pk).count(), 1)
+
+
+class ApplyReviewsTests(PortalTestCase):
+
+    def test_outcome_per_item_in_input_order(self):
+        fresh = make_award(self.faculty, title='Fresh')
+        decided = make_award(self.faculty, title='Decided')
+        apply_review(decided, 'cluster_head', 'rejected_by_cluster', '')
+        role = make_reviewer_role(self.faculty)
+
+        outcomes = apply_reviews('cluster_head', [
+            ('awards_achievements', fresh.pk, 'approved_by_cluster', 'ok'),
+            ('awards_achievements', decided.pk, 'approved_by_cluster', 'ok'),
+            ('awards_achievements', 999999, 'approved_by_cluster', 'ok'),
+            ('reviewer_roles', str(role.pk), 'revision', 'fix the scan'),
+            ('awards_achievements', fresh.pk, 'revision', 'duplicate'),
+            ('patents', 1, 'approved_by_cluster', ''),
+            ('awards_achievements', 'abc', 'approved_by_cluster', ''),
+            ('awards_achievements', role.pk, 'approve', ''),
+        ], actor=self.cluster_head)
+
+        self.assertEqual([(outcome.outcome, outcome.status) for outcome in outcomes], [
+            ('applied', 'approved_by_cluster'),
+            ('conflict', 'rejected_by_cluster'),
+            ('not_found', None),
+            ('applied', 'revision'),
+            ('invalid', None),
+            ('invalid', None),
+            ('invalid', None),
+            ('invalid', None),
+        ])
+        fresh.refresh_from_db()
+        role.refresh_from_db()
+        self.assertEqual((fresh.status, fresh.cluster_head_status, fresh.cluster_head_remarks), ('approved_by_cluster', 'approved', 'ok'))
+        self.assertEqual((role.status, role.cluster_head_status, role.cluster_head_remarks), ('revision', 'revision', 'fix the scan'))
+
+    def test_every_dean_decision_in_one_batch(self):
+        approve, reject = make_award(self.faculty, title='A'), make_award(self.faculty, title='B')
+        approved_by_cluster(approve)
+        approved_by_cluster(reject)
+
+        outcomes = apply_reviews('dean', [
+            ('awards_achievements', approve.pk, 'approve', ''),
+            ('awards_achievements', reject.pk, 'reject', 'Out of scope'),
+        ])
+
+        self.assertEqual([outcome.status for outcome in outcomes], ['approved_by_dean', 'rejected_by_dean'])
+        self.assertEqual(
+            set(SubmissionIndex.objects.filter(object_id__in=[approve.pk, reject.pk]).values_list('status', 'dean_status')),
+            {('approved_by_dean', 'approved'), ('rejected_by_dean', 'rejected')},
+        )
+
+    def test_applied_items_are_logged(self):
+        award, role = make_award(self.faculty), make_reviewer_role(self.faculty)
+        apply_reviews('cluster_head', [
+            ('awards_achievements', award.pk, 'approved_by_cluster', ''),
+            ('reviewer_roles', role.pk, 'rejected_by_cluster', ''),
+            ('reviewer_roles', 999999, 'rejected_by_cluster', ''),
+        ], actor=self.cluster_head)
+
+        self.assertEqual(
+            set(ReviewEvent.objects.filter(stage='cluster_head').values_list('submission_type', 'object_id', 'actor', 'to_status')),
+            {
+                ('awards_achievements', award.pk, self.cluster_head.pk, 'approved_by_cluster'),
+                ('reviewer_roles', role.pk, self.cluster_head.pk, 'rejected_by_cluster'),
+            },
+        )
+
+    def test_rows_taken_by_a_concurrent_writer_are_conflicts(self):
+        # Without row locks (SQLite) another reviewer can decide a row between
+        # our read and our UPDATE; only the rows stamped with our reviewed_at are ours.
+        ours, theirs = make_award(self.faculty, title='Ours'), make_award(self.faculty, title='Theirs')
+        read = AwardsAchievements.objects.select_for_update
+
+        def read_then_lose_race():
+            rows = list(read().filter(pk__in=[ours.pk, theirs.pk]).values_list(
+                'pk', 'user_id', 'cluster_head_status', 'dean_status', 'status',
+            ))
+            apply_review(AwardsAchievements.objects.get(pk=theirs.pk), 'cluster_head', 'revision', 'Theirs')
+            stale = mock.MagicMock()
+            stale.filter.return_value.values_list.return_value = rows
+            return stale
+
+        with mock.patch.object(AwardsAchievements.objects, 'select_for_update', side_effect=read_then_lose_race):
+            outcomes = apply_reviews('cluster_head', [
+                ('awards_achievements', ours.pk, 'approved_by_cluster', 'Ours'),
+                ('awards_achievements', theirs.pk, 'approved_by_cluster', 'Ours'),
+            ])
+
+        self.assertEqual([(outcome.outcome, outcome.status) for outcome in outcomes], [
+            ('applied', 'approved_by_cluster'),
+            ('conflict', 'revision'),
+        ])
+        theirs.refresh_from_db()
+        self.assertEqual((theirs.status, theirs.cluster_head_remarks), ('revision', 'Theirs'))
+        self.assertEqual(ReviewEvent.objects.filter(stage='cluster_head', object_id=theirs.pk).count(), 1)
+
+
+class ReviewAccessTests(PortalTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.award = make_award(self.faculty)
+        self.cluster_pages = [
+            reverse('cluster_head_dashboard'),
+            reverse('review_submission_awards_achievements', args=[self.award.pk]),
+        ]
+        self.dean_pages = [
+            reverse('dean_dashboard'),
+            reverse('dean_review_awards_achievements', args=[self.award.pk]),
+        ]
+
+    def test_anonymous_users_are_sent_to_login(self):
+        for url in self.cluster_pages + self.dean_pages:
+            with self.subTest(url=url):
+                self.assertRedirects(self.client.get(url), reverse('login'), fetch_redirect_response=False)
+
+    def test_pages_are_limited_to_their_role(self):
+        for user, allowed in ((self.faculty, []), (self.cluster_head, self.cluster_pages), (self.dean, self.dean_pages)):
+            login(self.client, user)
+            for url in self.cluster_pages + self.dean_pages:
+                with self.subTest(role=user.role, url=url):
+                    self.assertEqual(self.client.get(url).status_code, 200 if url in allowed else 403)
+
+    def test_other_roles_cannot_post_decisions(self):
+        login(self.client, self.faculty)
+        response = self.client.post(self.cluster_pages[1], {'status': 'approved_by_cluster', 'remarks': ''})
+        self.assertEqual(response.status_code, 403)
+        login(self.client, self.cluster_head)
+        approved_by_cluster(self.award)
+        response = self.client.post(self.dean_pages[1], {'action': 'approve', 'remarks': ''})
+        self.assertEqual(response.status_code, 403)
+
+        self.award.refresh_from_db()
+        self.assertEqual(self.award.status, 'approved_by_cluster')
+
+    def test_role_changes_from_other_workers_apply_on_the_next_request(self):
+        login(self.client, self.cluster_head)
+        self.assertEqual(self.client.get(self.cluster_pages[0]).status_code, 200)
+
+        # Another worker process demotes the cluster head: the row changes and
+        # the shared generation moves on commit, but this process's entry stays.
+        FacultyUser.objects.filter(pk=self.cluster_head.pk).update(role='faculty')
+        self.assertEqual(self.client.get(self.cluster_pages[0]).status_code, 200)
+        bump_generation(FACULTY_GENERATION)
+        self.assertEqual(self.client.get(self.cluster_pages[0]).status_code, 403)
+
+    def test_deleted_users_are_logged_out(self):
+        login(self.client, self.cluster_head)
+        self.assertEqual(self.client.get(self.cluster_pages[0]).status_code, 200)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.cluster_head.delete()
+        self.assertRedirects(self.client.get(self.cluster_pages[0]), reverse('login'), fetch_redirect_response=False)
+
+
+class ClaimTests(PortalTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.other_head = make_user('other.head@iilm.edu', role='cluster_head')
+        self.awards = [make_award(self.faculty, title=f'Award {i}') for i in range(4)]
+
+    def entry(self, submission):
+        return SubmissionIndex.objects.get(content_type__model='awardsachievements', object_id=submission.pk)
+
+    def test_claims_the_oldest_unclaimed_entries(self):
+        self.assertEqual(claim_next(self.cluster_head, 1), 1)
+        self.assertEqual(claim_next(self.other_head, 1), 1)
+
+        self.assertEqual(self.entry(self.awards[0]).claimed_by, self.cluster_head)
+        self.assertEqual(self.entry(self.awards[1]).claimed_by, self.other_head)
+        self.assertGreater(self.entry(self.awards[0]).claim_expires_at, timezone.now())
+
+    def test_claims_are_capped_at_the_reviewer_share(self):
+        self.assertEqual(claim_next(self.cluster_head, 10), 2)
+        self.assertEqual(claim_next(self.cluster_head, 10), 0)
+        self.assertEqual(claim_summary(self.cluster_head), {'total': 4, 'unclaimed': 2, 'mine': 2, 'claimable': 0})
+
+    def test_expired_claims_go_back_to_the_pool(self):
+        claim_next(self.cluster_head, 2)
+        SubmissionIndex.objects.filter(claimed_by=self.cluster_head).update(claim_expires_at=timezone.now() - timedelta(seconds=1))
+
+        self.assertEqual(held_by(cluster_head_queue(), self.cluster_head).count(), 0)
+        self.assertIsNone(claim_holder(self.other_head, self.awards[0]))
+        self.assertEqual(claim_next(self.other_head, 2), 2)
+        self.assertEqual(self.entry(self.awards[0]).claimed_by, self.other_head)
+
+    def test_opening_the_review_page_renews_the_lease(self):
+        claim_next(self.cluster_head, 1)
+        SubmissionIndex.objects.filter(claimed_by=self.cluster_head).update(claim_expires_at=timezone.now() + timedelta(seconds=5))
+
+        self.assertIsNone(renew_claim(self.cluster_head, self.awards[0]))
+        self.assertGreater(self.entry(self.awards[0]).claim_expires_at, timezone.now() + timedelta(seconds=CLAIM_LEASE - 60))
+        self.assertEqual(renew_claim(self.other_head, self.awards[0]), self.cluster_head)
+
+    def test_a_live_claim_refuses_other_reviewers(self):
+        claim_next(self.cluster_head, 1)
+        url = reverse('review_submission_awards_achievements', args=[self.awards[0].pk])
+
+        login(self.client, self.other_head)
+        response = self.client.post(url, {'status': 'approved_by_cluster', 'remarks': ''}, follow=True)
+        self.assertContains(response, 'has claimed this submission')
+        self.awards[0].refresh_from_db()
+        self.assertEqual(self.awards[0].status, 'submitted')
+
+        login(self.client, self.cluster_head)
+        self.client.post(url, {'status': 'approved_by_cluster', 'remarks': ''})
+        self.awards[0].refresh_from_db()
+        self.assertEqual(self.awards[0].status, 'approved_by_cluster')
+
+    def test_bulk_review_skips_entries_claimed_by_others(self):
+        claim_next(self.cluster_head, 1)
+        items = [('awards_achievements', award.pk, 'approved_by_cluster', '') for award in self.awards[:2]]
+
+        held = held_by_others(self.other_head, items)
+        self.assertEqual(held, {('awards_achievements', self.awards[0].pk)})
+        outcomes = apply_reviews('cluster_head', items, actor=self.other_head, held=held)
+        self.assertEqual([outcome.outcome for outcome in outcomes], ['claimed', 'applied'])
+        self.assertEqual(held_by_others(self.cluster_head, items), set())
+
+    def test_a_decision_releases_the_claim(self):
+        claim_next(self.cluster_head, 2)
+        apply_review(self.awards[0], 'cluster_head', 'revision', '', actor=self.cluster_head)
+        apply_reviews('cluster_head', [('awards_achievements', self.awards[1].pk, 'approved_by_cluster', '')])
+
+        for award in self.awards[:2]:
+            entry = self.entry(award)
+            self.assertEqual((entry.claimed_by, entry.claim_expires_at), (None, None))
+
+    def test_release_hands_everything_back(self):
+        claim_next(self.cluster_head, 2)
+        self.assertEqual(release_claims(self.cluster_head), 2)
+        self.assertEqual(unclaimed(cluster_head_queue()).count(), 4)
+
+
+class BulkReviewTests(PortalTestCase):
+
+    url = reverse_lazy('cluster_head_bulk_review')
+
+    def post(self, items):
+        return self.client.post(self.url, json.dumps({'items': items}), content_type='application/json')
+
+    def test_requires_a_cluster_head(self):
+        self.assertEqual(self.post([]).status_code, 401)
+        for user in (self.faculty, self.dean):
+            login(self.client, user)
+            self.assertEqual(self.post([]).status_code, 403)
+
+    def test_rejects_malformed_and_oversized_bodies(self):
+        login(self.client, self.cluster_head)
+        self.assertEqual(self.client.post(self.url, 'not json', content_type='application/json').status_code, 400)
+        self.assertEqual(self.client.post(self.url, json.dumps({'item': []}), content_type='application/json').status_code, 400)
+        self.assertEqual(self.post([{'type': 'journal', 'id': 1}] * (BULK_REVIEW_MAX_ITEMS + 1)).status_code, 400)
+
+    def test_mixed_batch(self):
+        fresh, decided = make_award(self.faculty, title='Fresh'), make_award(self.faculty, title='Decided')
+        apply_review(decided, 'cluster_head', 'revision', '')
+        role = make_reviewer_role(self.faculty)
+
+        login(self.client, self.cluster_head)
+        response = self.post([
+            {'type': 'awards_achievements', 'id': fresh.pk, 'decision': 'approved_by_cluster', 'remarks': 'ok'},
+            {'type': 'awards_achievements', 'id': decided.pk, 'decision': 'approved_by_cluster'},
+            {'type': 'reviewer_roles', 'id': role.pk, 'decision': 'rejected_by_cluster', 'remarks': 'no proof'},
+            {'type': 'reviewer_roles', 'id': 999999, 'decision': 'rejected_by_cluster'},
+            {'type': 'unknown', 'id': 1, 'decision': 'revision'},
+        ])
+
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertEqual(
+            {key: body[key] for key in ('applied', 'conflict', 'claimed', 'not_found', 'invalid', 'notified')},
+            {'applied': 2, 'conflict': 1, 'claimed': 0, 'not_found': 1, 'invalid': 1, 'notified': 0},
+        )
+        self.assertEqual([(result['outcome'], result['status']) for result in body['results']], [
+            ('applied', 'approved_by_cluster'),
+            ('conflict', 'revision'),
+            ('applied', 'rejected_by_cluster'),
+            ('not_found', None),
+            ('invalid', None),
+        ])
+        self.assertEqual(
+            ReviewEvent.objects.filter(stage='cluster_head', actor=self.cluster_head).count(), 2,
+        )
+
+
+class DeanSignOffTests(PortalTestCase):
+
+    url = reverse_lazy('dean_bulk_review')
+
+    def setUp(self):
+        super().setUp()
+        self.colleague = make_user('colleague@iilm.edu')
+        self.waiting = [
+            approved_by_cluster(make_award(self.faculty, title='First')),
+            approved_by_cluster(make_award(self.faculty, title='Second')),
+            approved_by_cluster(make_reviewer_role(self.colleague)),
+        ]
+
+    def items(self, decision='approve'):
+        return [
+            {'type': get_submission_type(submission).key, 'id': submission.pk, 'decision': decision, 'remarks': 'Signed off'}
+            for submission in self.waiting
+        ]
+
+    def test_requires_the_dean(self):
+        body = json.dumps({'items': self.items()})
+        self.assertEqual(self.client.post(self.url, body, content_type='application/json').status_code, 401)
+        login(self.client, self.cluster_head)
+        self.assertEqual(self.client.post(self.url, body, content_type='application/json').status_code, 403)
+        self.assertEqual(mail.outbox, [])
+
+    def test_one_email_per_faculty_member(self):
+        login(self.client, self.dean)
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(self.url, json.dumps({'items': self.items()}), content_type='application/json')
+
+        self.assertEqual((response.json()['applied'], response.json()['notified']), (3, 2))
+        self.assertEqual(sorted(message.to[0] for message in mail.outbox), ['colleague@iilm.edu', 'faculty@iilm.edu'])
+        summary = next(message.body for message in mail.outbox if message.to == ['faculty@iilm.edu'])
+        self.assertIn('2 of your submissions on the IILM Faculty Portal have been reviewed', summary)
+        self.assertIn('- Awards & Achievements: First - Approved by the Dean', summary)
+        single = next(message.body for message in mail.outbox if message.to == ['colleague@iilm.edu'])
+        self.assertIn('One of your submissions on the IILM Faculty Portal has been reviewed', single)
+
+    def test_only_applied_decisions_are_mailed(self):
+        apply_review(self.waiting[2], 'dean', 'reject', '')
+        login(self.client, self.dean)
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(self.url, json.dumps({'items': self.items()}), content_type='application/json')
+
+        self.assertEqual((response.json()['conflict'], response.json()['notified']), (1, 1))
+        self.assertEqual([message.to for message in mail.outbox], [['faculty@iilm.edu']])
+
+    def test_nothing_is_sent_when_the_batch_rolls_back(self):
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            with self.assertRaises(RuntimeError):
+                with transaction.atomic():
+                    outcomes = apply_reviews('dean', [
+                        (item['type'], item['id'], item['decision'], item['remarks']) for item in self.items()
+                    ])
+                    self.assertEqual(len(queue_decision_notifications('dean', outcomes)), 2)
+                    raise RuntimeError
+
+        self.assertEqual(callbacks, [])
+        self.assertEqual(mail.outbox, [])
+        self.assertEqual(AwardsAchievements.objects.filter(status='approved_by_cluster').count(), 2)
+
+    def test_a_mail_outage_does_not_fail_the_sign_off(self):
+        login(self.client, self.dean)
+        with mock.patch('django.core.mail.backends.locmem.EmailBackend.send_messages', side_effect=OSError):
+            with self.assertLogs('accounts.notifications', 'ERROR'), self.captureOnCommitCallbacks(execute=True):
+                response = self.client.post(self.url, json.dumps({'items': self.items()}), content_type='application/json')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(AwardsAchievements.objects.filter(status='approved_by_dean').count(), 2)
+
+
+class SubmissionStatsTests(PortalTestCase):
+
+    def assertNoDrift(self):
+        self.assertEqual(find_drift(), {})
+
+    def test_counters_follow_a_submission_lifecycle(self):
+        award, role = make_award(self.faculty), make_reviewer_role(self.faculty)
+        self.assertNoDrift()
+        self.assertEqual(user_submission_counts(self.faculty)['total'], 2)
+
+        # Status change through save(), as the edit forms do.
+        award.cluster_head_status = 'revision'
+        award.status = 'revision'
+        award.save()
+        self.assertNoDrift()
+
+        # Partial loads read the stored state before it is overwritten.
+        partial = AwardsAchievements.objects.only('pk', 'status').get(pk=award.pk)
+        partial.cluster_head_status = 'approved'
+        partial.save(update_fields=['cluster_head_status'])
+        self.assertNoDrift()
+
+        # Single and batch decisions skip post_save and bump the counters themselves.
+        apply_review(role, 'cluster_head', 'approved_by_cluster', '')
+        self.assertNoDrift()
+        others = [make_award(self.faculty, title=f'Batch {i}') for i in range(3)]
+        apply_reviews('cluster_head', [('awards_achievements', other.pk, 'approved_by_cluster', '') for other in others])
+        apply_reviews('dean', [
+            ('awards_achievements', others[0].pk, 'approve', ''),
+            ('awards_achievements', others[1].pk, 'reject', ''),
+            ('reviewer_roles', role.pk, 'approve', ''),
+        ])
+        self.assertNoDrift()
+
+        others[2].delete()
+        award.delete()
+        self.assertNoDrift()
+        self.assertEqual(user_submission_counts(self.faculty)['total'], 3)
+
+    def test_bump_many_creates_updates_and_ignores_ownerless_buckets(self):
+        bump_many({
+            ('journal', (self.faculty.pk, 'pending', 'pending')): 2,
+            ('journal', (None, 'pending', 'pending')): 5,
+        })
+        bump_many({
+            ('journal', (self.faculty.pk, 'pending', 'pending')): -1,
+            ('journal', (self.faculty.pk, 'approved', 'pending')): 1,
+        })
+        self.assertEqual(stored_submission_stats(), {
+            (self.faculty.pk, 'journal', 'pending', 'pending'): 1,
+            (self.faculty.pk, 'journal', 'approved', 'pending'): 1,
+        })
+
+
+class KeysetPaginationTests(PortalTestCase):
+
+    def setUp(self):
+        super().setUp()
+        submissions = [make_award(self.faculty, title=f'Award {i}') for i in range(4)]
+        submissions += [make_reviewer_role(self.faculty, name=f'Journal {i}') for i in range(3)]
+        # Several submissions of both types at the same instant: only (type, id) orders them.
+        tie = timezone.now() - timedelta(days=1)
+        SubmissionIndex.objects.filter(object_id__in=[submissions[i].pk for i in (1, 2, 4, 5)]).update(submitted_at=tie)
+        self.expected = [(entry.content_type_id, entry.object_id) for entry in cluster_head_queue()]
+
+    def positions(self, page):
+        return [(submission.index_entry.content_type_id, submission.index_entry.object_id) for submission in page]
+
+    def walk_forward(self, page_size):
+        seen, cursor = [], None
+        while True:
+            page = keyset_page(cluster_head_queue(), after=cursor, page_size=page_size)
+            seen += self.positions(page)
+            if not page.has_next():
+                return seen, page
+            cursor = page.next_cursor
+
+    def test_pages_cover_the_queue_once_despite_ties(self):
+        for page_size in (1, 2, 3, 7, 10):
+            with self.subTest(page_size=page_size):
+                self.assertEqual(self.walk_forward(page_size)[0], self.expected)
+
+    def test_before_pages_walk_back_to_the_start(self):
+        _, page = self.walk_forward(2)
+        seen = self.positions(page)
+        while page.has_previous():
+            page = keyset_page(cluster_head_queue(), before=page.previous_cursor, page_size=2)
+            seen = self.positions(page) + seen
+        self.assertEqual(seen, self.expected)
+        self.assertFalse(page.has_previous())
+
+    def test_invalid_cursors_fall_back_to_the_first_page(self):
+        first = self.positions(keyset_page(cluster_head_queue(), page_size=3))
+        tampered = base64.urlsafe_b64encode(b'yesterday|12|x').decode()
+        for cursor in ('not-a-cursor', '!!!', tampered, base64.urlsafe_b64encode(b'\xff\xfe').decode()):
+            with self.subTest(cursor=cursor):
+                self.assertIsNone(decode_cursor(cursor))
+                self.assertEqual(self.positions(keyset_page(cluster_head_queue(), after=cursor, page_size=3)), first)
+                self.assertEqual(self.positions(keyset_page(cluster_head_queue(), before=cursor, page_size=3)), first)
+
+    def test_page_size_bounds(self):
+        self.assertEqual(parse_page_size('0'), 1)
+        self.assertEqual(parse_page_size('-5'), 1)
+        self.assertEqual(parse_page_size('100000'), QUEUE_MAX_PAGE_SIZE)
+        self.assertEqual(parse_page_size('ten'), QUEUE_PAGE_SIZE)
+        self.assertEqual(parse_page_size(None), QUEUE_PAGE_SIZE)
+
+    def test_links_keep_the_other_query_parameters(self):
+        params = QueryDict('view=mine&after=stale&page_size=50')
+        page = keyset_page(cluster_head_queue(), page_size=2, params=params)
+
+        self.assertEqual(QueryDict(page.next_querystring()).dict(), {'view': 'mine', 'after': page.next_cursor, 'page_size': '2'})
+        later = keyset_page(cluster_head_queue(), after=page.next_cursor, page_size=2, params=params)
+        self.assertEqual(QueryDict(later.previous_querystring()).dict(), {'view': 'mine', 'before': later.previous_cursor, 'page_size': '2'})
+
+    def test_my_claims_view_survives_paging(self):
+        claim_next(self.cluster_head, 3)
+        login(self.client, self.cluster_head)
+        response = self.client.get(reverse('cluster_head_dashboard'), {'view': 'mine', 'page_size': 2})
+        next_page = self.client.get(f"{reverse('cluster_head_dashboard')}?{response.context['submissions'].next_querystring()}")
+
+        self.assertTrue(next_page.context['view_mine'])
+        self.assertEqual(len(next_page.context['submissions']), 1)
+
+
+class ReviewBacklogTests(PortalTestCase):
+
+    def backlog_generation(self):
+        return generations((BACKLOG_GENERATION,))[0]
+
+    def assertMovesBacklog(self, change, moves=True):
+        before = self.backlog_generation()
+        with self.captureOnCommitCallbacks(execute=True):
+            change()
+        (self.assertNotEqual if moves else self.assertEqual)(self.backlog_generation(), before)
+
+    def test_only_transitions_move_the_backlog_generation(self):
+        award = make_award(self.faculty)
+        role = make_reviewer_role(self.faculty)
+
+        def edit():
+            award.title_of_award = 'Renamed'
+            award.save()
+
+        self.assertMovesBacklog(lambda: make_award(self.faculty))
+        self.assertMovesBacklog(edit, moves=False)
+        self.assertMovesBacklog(lambda: claim_next(self.cluster_head, 2), moves=False)
+        self.assertMovesBacklog(lambda: apply_review(award, 'cluster_head', 'revision', ''))
+        self.assertMovesBacklog(lambda: apply_reviews('cluster_head', [('reviewer_roles', role.pk, 'approved_by_cluster', '')]))
+        self.assertMovesBacklog(lambda: apply_reviews('cluster_head', [('reviewer_roles', role.pk, 'approved_by_cluster', '')]), moves=False)
+        self.assertMovesBacklog(role.delete)
+
+    def test_resubmission_requeues_the_entry(self):
+        award = make_award(self.faculty)
+        apply_review(award, 'cluster_head', 'revision', '')
+        entry = SubmissionIndex.objects.filter(content_type__model='awardsachievements', object_id=award.pk)
+        sent_back_at = entry.get().queued_at
+        award.status, award.cluster_head_status = 'submitted', 'pending'
+
+        self.assertMovesBacklog(award.save)
+        self.assertEqual(entry.get().status, 'submitted')
+        self.assertGreater(entry.get().queued_at, sent_back_at)
+
+    def test_report_depth_age_and_threshold(self):
+        old = make_award(self.faculty, title='Old')
+        make_award(self.faculty, title='New')
+        approved_by_cluster(make_reviewer_role(self.faculty))
+        three_days_ago = timezone.now() - timedelta(days=3)
+        SubmissionIndex.objects.filter(content_type__model='awardsachievements', object_id=old.pk).update(queued_at=three_days_ago)
+
+        report = review_backlog(max_age={'cluster_head': 48 * 3600, 'dean': 48 * 3600})
+
+        cluster_head, dean = report['stages']['cluster_head'], report['stages']['dean']
+        self.assertEqual((cluster_head['depth'], cluster_head['over_threshold']), (2, True))
+        self.assertEqual(cluster_head['oldest_queued_at'], three_days_ago.isoformat())
+        self.assertAlmostEqual(cluster_head['oldest_age_seconds'], 3 * 86400, delta=5)
+        self.assertEqual(cluster_head['types']['awards_achievements']['depth'], 2)
+        self.assertEqual((dean['depth'], dean['over_threshold'], list(dean['types'])), (1, False, ['reviewer_roles']))
+
+
+class FacultyWiseSubmissionsTests(PortalTestCase):
+
+    url = reverse_lazy('faculty_submissions_api')
+
+    def setUp(self):
+        super().setUp()
+        self.busy = make_user('busy@iilm.edu')
+        self.idle = make_user('idle@iilm.edu')
+        for i in range(3):
+            make_award(self.busy, title=f'Award {i}')
+        make_reviewer_role(self.busy)
+        last_year = make_award(self.faculty)
+        make_reviewer_role(self.faculty)
+        AwardsAchievements.objects.filter(pk=last_year.pk).update(submitted_at=timezone.now() - timedelta(days=400))
+
+    def faculty_data(self, **params):
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, 200)
+        return [(row['name'], row['count']) for row in response.json()['faculty_data']]
+
+    def test_counts_are_sorted_with_idle_faculty_last(self):
+        self.assertEqual(self.faculty_data(), [('Busy', 4), ('Faculty', 2), ('Idle', 0)])
+
+    def test_filters(self):
+        self.assertEqual(self.faculty_data(type='awards_achievements'), [('Busy', 3), ('Faculty', 1), ('Idle', 0)])
+        this_year = timezone.now().year
+        self.assertEqual(self.faculty_data(year=this_year), [('Busy', 4), ('Faculty', 1), ('Idle', 0)])
+        # Ties keep sign-up order.
+        self.assertEqual(self.faculty_data(year=this_year, type='reviewer_roles'), [('Faculty', 1), ('Busy', 1), ('Idle', 0)])
+
+    def test_limit_is_applied_by_the_query(self):
+        with self.assertNumQueries(1):
+            rows = list(annotate_submission_totals(FacultyUser.objects.filter(role='faculty')).order_by('-total', 'pk')[:1]
+                        .values_list('full_name', 'total'))
+        self.assertEqual(rows, [('Busy', 4)])
+        self.assertEqual(self.faculty_data(limit=2), [('Busy', 4), ('Faculty', 2)])
+        self.assertEqual(self.client.get(self.url, {'limit': -1}).status_code, 400)
+
+
+class DashboardEventsTests(PortalTestCase):
+
+    url = reverse_lazy('dashboard_events')
+
+    def test_wsgi_requests_fall_back_to_polling(self):
+        login(self.client, self.dean)
+        self.assertEqual(self.client.get(self.url).status_code, 204)
+
+    def submit_award(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            make_award(self.faculty)
+
+    async def test_stream_pushes_queue_changes(self):
+        await sync_to_async(login)(self.async_client, self.cluster_head)
+        stream = dashboard_event_stream('cluster_head')
+        with mock.patch('accounts.events.SSE_CHECK_INTERVAL', 0):
+            self.assertTrue((await anext(stream)).startswith('retry:'))
+            await sync_to_async(self.submit_award)()
+            frame = await anext(stream)
+        await stream.aclose()
+
+        self.assertEqual(frame, format_event('queue', {'queue': 'cluster_head', 'size': 1, 'added': 1}))
 
-# Create your tests here.
+    async def test_stream_requires_a_reviewer(self):
+        self.assertEqual((await self.async_client.get(self.url)).status_code, 401)
+        await sync_to_async(login)(self.async_client, self.faculty)
+        self.assertEqual((await self.async_client.get(self.url)).status_code, 403)
@@ -33,14 +33,20 @@ urlpatterns = [
     path('journal-publication/', views.journal_publication, name='journal_publication'),
 
     path('cluster-head/dashboard/', views.cluster_head_dashboard, name='cluster_head_dashboard'),
+    path('cluster-head/bulk-review/', views.cluster_head_bulk_review, name='cluster_head_bulk_review'),
+    path('cluster-head/claim/', views.cluster_head_claim, name='cluster_head_claim'),
+    path('cluster-head/release/', views.cluster_head_release, name='cluster_head_release'),
 
     path('cluster-head/review-journal/<int:submission_id>/', views.review_submission_journal, name='review_submission_journal'),
 
     path('my-submissions/', views.my_submissions, name='my_submissions'),
 
     path('api/dean-analytics/', views.dean_analytics_api, name='dean_analytics_api'),
+    path('api/review-metrics/', views.review_metrics_api, name='review_metrics_api'),
+    path('api/review-backlog/', views.review_backlog_api, name='review_backlog_api'),
 
     path('dean-dashboard/', views.dean_dashboard, name='dean_dashboard'),
+    path('dean-dashboard/bulk-review/', views.dean_bulk_review, name='dean_bulk_review'),
 
     path('dean-review-journal/<int:pk>/', views.dean_review_journal, name='dean_review_journal'),
 
@@ -51,6 +57,7 @@ urlpatterns = [
     path('cluster-head/review-conference/<int:submission_id>/', views.review_submission_conference, name='review_submission_conference'),
 
     path('api/faculty-submissions/', views.faculty_wise_submissions_api, name='faculty_submissions_api'),
+    path('api/dashboard-events/', views.dashboard_events, name='dashboard_events'),
 
 
     path('dean-review-conference/<int:pk>/', views.dean_review_conference, name='dean_review_conference'),
@@ -9,25 +9,53 @@ from .models import FacultyUser, FacultyProfile, JournalPublication, ConferenceP
 
 from .forms import FacultyProfileForm, JournalPublicationForm, ConferencePublicationForm, ResearchProjectForm, PatentForm, CopyrightForm, PhdGuidanceForm, BookChapterForm, BooksAuthoredForm, ConsultancyProjectsForm, EditorialRolesForm, ReviewerRolesForm, AwardsAchievementsForm, IndustryCollaborationForm
 
-
+from .submissions import SUBMISSION_TYPES_BY_KEY, annotate_submission_totals, get_submission_type, user_submission_counts, user_submission_feed
+from .submission_index import cluster_head_queue, dean_queue, keyset_page, paginate_queue, parse_page_size, user_queue
+from .cache import (
+    ALL_TYPES, DASHBOARD_FRAGMENT_TTL, FACULTY_GENERATION, dean_analytics, dean_review_stats, generation_etag,
+    institution_stats, user_generation, user_generation_name,
+)
+from .decorators import faculty_login_required
+from .middleware import get_faculty_profile, get_faculty_user
+from .review import BULK_REVIEW_MAX_ITEMS, InvalidDecision, ReviewConflict, apply_review, apply_reviews
+from .review_schema import review_context
+from .review_metrics import parse_days, review_turnaround
+from .backlog import has_backlog_token, review_backlog
+from .claims import (
+    CLAIM_BATCH, CLAIM_LEASE, CLAIM_MAX_BATCH, annotate_claims, claim_holder, claim_next, claim_summary, held_by,
+    held_by_others, release_claims, renew_claim,
+)
+from .notifications import queue_decision_notifications
+from .roles import role_for_email
+from .events import REVIEW_QUEUES, dashboard_event_stream
+
+
+import json
 import random
 from django.conf import settings
 from django.contrib.auth import login
 
 from django.contrib.auth.hashers import check_password
-from django.http import JsonResponse
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
+from django.core.handlers.asgi import ASGIRequest
+from asgiref.sync import sync_to_async
 from django.shortcuts import render, get_object_or_404, redirect
 
 from django.contrib.auth.decorators import login_required
 from django.urls import reverse
-from itertools import chain
 
 from django.views.decorators.clickjacking import xframe_options_exempt
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import condition, require_POST
 from django.http import FileResponse, Http404, HttpResponseRedirect
 
 from django.utils import timezone
 from datetime import timedelta
 
+from django.db import transaction
+from django.db.models import Count, Q
+from django.utils.functional import SimpleLazyObject
+
 
 
 
@@ -56,13 +84,9 @@ def signup(request):
             messages.error(request, "Passwords do not match!")
             return redirect('signup')
         
-        if email in settings.DEAN_EMAIL:
-            role = 'dean'
-        elif email in settings.CLUSTER_HEAD_EMAIL:
-            role = 'cluster_head'
-        elif email in settings.FACULTY_EMAIL:
-            role = 'faculty'
-        else:
+        # ✅ Role comes from the RoleAssignment roster (cached per process)
+        role = role_for_email(email)
+        if role is None:
             messages.error(request, "Email ID didn't Matched")
             return redirect('signup')
 
@@ -212,6 +236,7 @@ def logout_view(request):
     return redirect('login')
 
 
+@faculty_login_required
 def dashboard(request):
 
 
@@ -219,13 +244,9 @@ def dashboard(request):
     The dashboard function first checks whether the user is logged in by verifying the presence of 'user_id' in the session. If not, it redirects to the login page. Once verified, it retrieves the logged-in user’s data from the FacultyUser model and fetches their associated profile from the FacultyProfile model. To enhance user experience, it calculates the profile completion percentage by checking how many profile fields (such as department, designation, or ORCID ID) are filled out of the total available. This completion percentage, along with user and profile details, is then passed to the dashboard.html template for rendering.
     """
 
-    # ✅ Check if user is logged in
-    if 'user_id' not in request.session:
-        return redirect('login')
-
-    # ✅ Fetch user and related profile
-    user = FacultyUser.objects.get(user_id=request.session['user_id'])
-    profile = FacultyProfile.objects.filter(user=user).first()
+    # ✅ User and profile come from the request (one query, shared by the whole request)
+    user = request.faculty_user
+    profile = get_faculty_profile(request)
     user_role = request.session.get('user_role')
 
     
@@ -243,13 +264,19 @@ def dashboard(request):
     else:
         profile_completion = 0
     
-    total_count = JournalPublication.objects.filter(user=user).count() + ConferencePublication.objects.filter(user=user).count() + ResearchProject.objects.filter(user=user).count() + Patents.objects.filter(user=user).count() + Copyright.objects.filter(user=user).count() + PhdGuidance.objects.filter(user=user).count() + BookChapter.objects.filter(user=user).count() + BooksAuthored.objects.filter(user=user).count() + ConsultancyProjects.objects.filter(user=user).count() + EditorialRoles.objects.filter(user=user).count() + ReviewerRoles.objects.filter(user=user).count() + AwardsAchievements.objects.filter(user=user).count() + IndustryCollaboration.objects.filter(user=user).count()
-
-    pending_count = JournalPublication.objects.filter(user=user, dean_status__in=['submitted', 'pending']).count() + ConferencePublication.objects.filter(user=user, dean_status__in=['submitted', 'pending']).count() + ResearchProject.objects.filter(user=user, overall_status__in=['submitted', 'pending']).count() + Patents.objects.filter(user=user, dean_status__in=['submitted', 'pending']).count() + Copyright.objects.filter(user=user, dean_status__in=['submitted', 'pending']).count() + PhdGuidance.objects.filter(user=user, dean_status__in=['submitted', 'pending']).count() + BookChapter.objects.filter(user=user, dean_status__in=['submitted', 'pending']).count() + BooksAuthored.objects.filter(user=user, dean_status__in=['submitted', 'pending']).count() + ConsultancyProjects.objects.filter(user=user, dean_status__in=['submitted', 'pending']).count() + EditorialRoles.objects.filter(user=user, dean_status__in=['submitted', 'pending']).count() + ReviewerRoles.objects.filter(user=user, dean_status__in=['submitted', 'pending']).count() + AwardsAchievements.objects.filter(user=user, dean_status__in=['submitted', 'pending']).count() + IndustryCollaboration.objects.filter(user=user, dean_status__in=['submitted', 'pending']).count()
-
-    approved_count = JournalPublication.objects.filter(user=user, dean_status='approved').count() + ConferencePublication.objects.filter(user=user, dean_status='approved').count() + ResearchProject.objects.filter(user=user, overall_status='approved').count() + Patents.objects.filter(user=user, dean_status='approved').count() + Copyright.objects.filter(user=user, dean_status='approved').count() + PhdGuidance.objects.filter(user=user, dean_status='approved').count() + BookChapter.objects.filter(user=user, dean_status='approved').count() + BooksAuthored.objects.filter(user=user, dean_status='approved').count() + ConsultancyProjects.objects.filter(user=user, dean_status='approved').count() + EditorialRoles.objects.filter(user=user, dean_status='approved').count() + ReviewerRoles.objects.filter(user=user, dean_status='approved').count() + AwardsAchievements.objects.filter(user=user, dean_status='approved').count() + IndustryCollaboration.objects.filter(user=user, dean_status='approved').count()
+    # ✅ Counters and recent panels are cached template fragments keyed by the user's
+    # submission generation; both are lazy, so a cache hit runs none of their queries
+    def dashboard_counters():
+        counts = user_submission_counts(user)
+        total = counts['total']
+        return {
+            'total': total,
+            'pending': counts['pending'],
+            'approved': counts['approved'],
+            'approval_rate': (counts['approved'] / total * 100) if total > 0 else 0,
+        }
 
-    approval_rate = (approved_count / total_count * 100) if total_count > 0 else 0
+    counters = SimpleLazyObject(dashboard_counters)
 
     recent_journal = JournalPublication.objects.filter(user=user).order_by('-submitted_at')[:5]
 
@@ -283,10 +310,9 @@ def dashboard(request):
         'profile': profile,
         'profile_completion': profile_completion,
         'user_role': user_role,
-        'total_count': total_count,
-        'pending_count': pending_count,
-        'approved_count': approved_count,
-        'approval_rate': approval_rate,
+        'counters': counters,
+        'dashboard_generation': user_generation(user),
+        'dashboard_cache_ttl': DASHBOARD_FRAGMENT_TTL,
         'recent_journal': recent_journal,
         'recent_conference': recent_conference,
         'recent_research': recent_research,
@@ -411,16 +437,16 @@ def verify_reset_otp(request):
     return render(request, 'verify_reset_otp.html')
 
 
+@faculty_login_required
 def profile_completion(request):
     """
     The profile_completion function allows logged-in users to complete or update their faculty profile. It first checks if the user is authenticated by verifying the presence of 'user_id' in the session. If not authenticated, it redirects to the login page. Once authenticated, it retrieves the user’s existing profile or creates a new one if it doesn’t exist. When the user submits the profile form, it validates and saves the data, linking it to the logged-in user. A success message is displayed upon successful submission, and the user is redirected to the dashboard. If there are form errors, they are communicated back to the user for correction.
     """
 
-    if 'user_id' not in request.session:
-        return redirect('login')
-
-    user = FacultyUser.objects.get(user_id=request.session['user_id'])
-    profile, created = FacultyProfile.objects.get_or_create(user=user)
+    user = request.faculty_user
+    profile = get_faculty_profile(request)
+    if profile is None:
+        profile, created = FacultyProfile.objects.get_or_create(user=user)
 
     if request.method == 'POST':
         form = FacultyProfileForm(request.POST, request.FILES, instance=profile)
@@ -446,20 +472,17 @@ def view_profile(request):
     - Passes both user and profile objects to the template for display.
     """
 
-    user_id = request.session.get('user_id')
-
-    if not user_id:
+    if not request.session.get('user_id'):
         messages.error(request, "Please log in to view your profile.")
         return redirect('login')
 
-    try:
-        user = FacultyUser.objects.get(user_id=user_id)
-    except FacultyUser.DoesNotExist:
+    user = get_faculty_user(request)
+    if user is None:
         messages.error(request, "User not found. Please log in again.")
         return redirect('login')
 
-    # Try to get related profile, if it exists
-    profile = FacultyProfile.objects.filter(user=user).first()
+    # Related profile, if it exists (loaded together with the user)
+    profile = get_faculty_profile(request)
 
     if not profile:
         messages.info(request, "You haven’t completed your profile yet.")
@@ -471,13 +494,12 @@ def view_profile(request):
     })
 
 
+@faculty_login_required
 def edit_profile(request):
-    # ✅ Ensure user is logged in
-    if 'user_id' not in request.session:
-        return redirect('login')
-
-    user = FacultyUser.objects.get(user_id=request.session['user_id'])
-    profile, created = FacultyProfile.objects.get_or_create(user=user)
+    user = request.faculty_user
+    profile = get_faculty_profile(request)
+    if profile is None:
+        profile, created = FacultyProfile.objects.get_or_create(user=user)
 
     if request.method == 'POST':
         form = FacultyProfileForm(request.POST, request.FILES, instance=profile)
@@ -495,20 +517,18 @@ def edit_profile(request):
 
 
 
+@faculty_login_required
 def journal_publication(request):
     
 
     """
     The journal_publication function allows logged-in users to submit details about their journal publications. It checks for user authentication, processes the submitted form data, and saves a new JournalPublication record linked to the user. Upon successful submission, a success message is displayed, and the user is redirected to the dashboard. If there are form errors, they are communicated back to the user for correction."""
 
-    if 'user_id' not in request.session:
-        return redirect('login')
-
     if request.method == 'POST':
         form = JournalPublicationForm(request.POST, request.FILES)
         if form.is_valid():
             publication = form.save(commit=False)
-            user = FacultyUser.objects.get(user_id=request.session['user_id'])
+            user = request.faculty_user
             publication.user = user
             publication.save()
             messages.success(request, "Journal publication submitted successfully!")
@@ -522,468 +542,403 @@ def journal_publication(request):
 
 
 
+@faculty_login_required
 def cluster_head_dashboard(request):
 
 
     """
-    The cluster_head_dashboard function displays all journal publication submissions that are pending or need review by the cluster head. It retrieves these submissions from the database and renders them in the cluster_head_dashboard.html template.
+    The cluster_head_dashboard function displays all submissions, across every submission type, that are waiting for review by the cluster head. The queue is read from the SubmissionIndex table with keyset (cursor) pagination over (submitted_at, type, id) using the ?after= / ?before= / ?page_size= parameters, so every page costs the same no matter how deep it is; only the submissions on the current page are loaded from their own tables, and the summary counters are computed with a single aggregate query. With ?view=mine only the submissions the cluster head has claimed are listed, and every row shows who holds a live claim on it. Only a logged in cluster head may open it; other roles get 403 Forbidden. The page is rendered with the cluster_head_dashboard.html template.
     """
-    journal_publications = JournalPublication.objects.filter(status='submitted').order_by('-submitted_at')
-
-    conference_publications = ConferencePublication.objects.filter(status='submitted').order_by('-submitted_at')
-
-    research_projects = ResearchProject.objects.filter(overall_status='submitted').order_by('-submitted_at')
-
-    patent_submissions = Patents.objects.filter(status='submitted').order_by('-submitted_at')
-
-    copyright_submissions = Copyright.objects.filter(status='submitted').order_by('-submitted_at')
-
-    phd_guidance_submissions = PhdGuidance.objects.filter(status='submitted').order_by('-submitted_at')
-
-    book_chapter_submissions = BookChapter.objects.filter(status='submitted').order_by('-submitted_at')
 
-    books_authored_submissions = BooksAuthored.objects.filter(status='submitted').order_by('-submitted_at')
+    user = request.faculty_user
+    if user.role != 'cluster_head':
+        return HttpResponse('Forbidden', status=403)
 
-    consultancy_projects_submissions = ConsultancyProjects.objects.filter(status='submitted').order_by('-submitted_at')
+    now = timezone.now()
+    mine = request.GET.get('view') == 'mine'
 
-    editorial_roles_submissions = EditorialRoles.objects.filter(status='submitted').order_by('-submitted_at')
+    queue = cluster_head_queue()
 
-    reviewer_roles_submissions = ReviewerRoles.objects.filter(status='submitted').order_by('-submitted_at')
-
-    awards_achievements_submissions = AwardsAchievements.objects.filter(status='submitted').order_by('-submitted_at')
-
-    industry_collaboration_submissions = IndustryCollaboration.objects.filter(status='submitted').order_by('-submitted_at')
-
-    for sub in journal_publications:
-        sub.submission_type = 'Journal Publication'
-        sub.review_url = reverse('review_submission_journal', args=[sub.id])
-    
-    for sub in conference_publications:
-        sub.submission_type = 'Conference Publication'
-        sub.review_url = reverse('review_submission_conference', args=[sub.id])
-    
-    for sub in research_projects:
-        sub.submission_type = 'Research Project'
-        sub.review_url = reverse('review_submission_research', args=[sub.id])
-
-    for sub in patent_submissions:
-        sub.submission_type = 'Patent Submission'
-        sub.review_url = reverse('review_submission_patent', args=[sub.id])
-    
-    for sub in copyright_submissions:
-        sub.submission_type = 'Copyright Submission'
-        sub.review_url = reverse('review_submission_copyright', args=[sub.id])
-    
-    for sub in phd_guidance_submissions:
-        sub.submission_type = 'PhD Guidance'
-        sub.review_url = reverse('review_submission_phd_guidance', args=[sub.id])
-    
-    for sub in book_chapter_submissions:
-        sub.submission_type = 'Book Chapter'
-        sub.review_url = reverse('review_submission_book_chapter', args=[sub.id])
-    
-    for sub in books_authored_submissions:
-        sub.submission_type = 'Books Authored'
-        sub.review_url = reverse('review_submission_books_authored', args=[sub.id])
-    
-    for sub in consultancy_projects_submissions:
-        sub.submission_type = 'Consultancy Project'
-        sub.review_url = reverse('review_submission_consultancy_project', args=[sub.id])
-    
-    for sub in editorial_roles_submissions:
-        sub.submission_type = 'Editorial Roles'
-        sub.review_url = reverse('review_submission_editorial_roles', args=[sub.id])
-    
-    for sub in reviewer_roles_submissions:
-        sub.submission_type = 'Reviewer Roles'
-        sub.review_url = reverse('review_submission_reviewer_roles', args=[sub.id])
-    
-    for sub in awards_achievements_submissions:
-        sub.submission_type = 'Awards & Achievements'
-        sub.review_url = reverse('review_submission_awards_achievements', args=[sub.id])
-    
-    for sub in industry_collaboration_submissions:
-        sub.submission_type = 'Industry Collaboration'
-        sub.review_url = reverse('review_submission_industry_collaboration', args=[sub.id])
-
-    all_submissions = sorted(
-        list(journal_publications) + list(conference_publications) + list(research_projects) + list(patent_submissions) + list(copyright_submissions) + list(phd_guidance_submissions) + list(book_chapter_submissions) + list(books_authored_submissions) + list(consultancy_projects_submissions) + list(editorial_roles_submissions) + list(reviewer_roles_submissions) + list(awards_achievements_submissions) + list(industry_collaboration_submissions),
-        key=lambda x: x.submitted_at,
-        reverse=True
+    submissions = keyset_page(
+        (held_by(queue, user, now) if mine else queue).select_related('claimed_by'),
+        after=request.GET.get('after'),
+        before=request.GET.get('before'),
+        page_size=parse_page_size(request.GET.get('page_size')),
+        review_url_attr='review_url',
+        params=request.GET,
     )
+    annotate_claims(submissions, now)
 
-    total_submissions = len(all_submissions)
+    summary = queue.aggregate(
+        total_submissions=Count('id'),
+        pending_submissions=Count('id', filter=Q(cluster_head_status='pending')),
+        approved_submissions=Count('id', filter=Q(cluster_head_status='approved')),
+        rejected_submissions=Count('id', filter=Q(cluster_head_status='rejected')),
+    )
+    claims = claim_summary(user, now)
 
-    pending_submissions = sum(1 for sub in all_submissions if sub.cluster_head_status == 'pending')
+    return render(request, 'cluster_head_dashboard.html', {'submissions': submissions, 'claims': claims, 'view_mine': mine, 'claim_batch': CLAIM_BATCH, **summary})
 
-    approved_submissions = sum(1 for sub in all_submissions if sub.cluster_head_status == 'approved')
 
-    rejected_submissions = sum(1 for sub in all_submissions if sub.cluster_head_status == 'rejected')
+@require_POST
+@faculty_login_required
+def cluster_head_claim(request):
 
-    return render(request, 'cluster_head_dashboard.html', {'submissions': all_submissions, 'total_submissions': total_submissions, 'pending_submissions': pending_submissions, 'approved_submissions': approved_submissions, 'rejected_submissions': rejected_submissions})
+    """
+    The cluster_head_claim function leases the next submissions of the cluster head queue to the logged in cluster head, oldest first, so that several cluster heads working the same queue do not open the same submission. The number asked for (the count field, 10 by default) is capped at the cluster head's share of the queue given how many they already hold. Claimed submissions are marked with one conditional UPDATE that skips anything another cluster head claimed first, and the leases lapse on their own after REVIEW_CLAIM_LEASE seconds. The cluster head is redirected to their claimed submissions.
+    """
 
+    user = request.faculty_user
+    if user.role != 'cluster_head':
+        return HttpResponse('Forbidden', status=403)
 
+    try:
+        count = max(1, min(int(request.POST.get('count', CLAIM_BATCH)), CLAIM_MAX_BATCH))
+    except ValueError:
+        count = CLAIM_BATCH
+
+    # ✅ One conditional UPDATE; entries leased to another cluster head are skipped
+    claimed = claim_next(user, count)
+    if claimed:
+        messages.success(request, f"{claimed} submission(s) claimed for {CLAIM_LEASE // 60} minutes.")
+    else:
+        messages.info(request, "Nothing left to claim: the queue is empty or you already hold your share of it.")
+    return redirect(f"{reverse('cluster_head_dashboard')}?view=mine")
 
-def review_submission_journal(request, submission_id):
 
+@require_POST
+@faculty_login_required
+def cluster_head_release(request):
 
     """
-    The review_submission function allows a cluster head to review individual journal publication submissions. It retrieves the specific submission by its ID and processes the review form submitted by the cluster head. Depending on the selected status (approved, rejected, or revision), it updates the submission’s cluster_head_status and overall status accordingly, along with any remarks provided. After saving the changes, it redirects back to the cluster head dashboard with a success message. If the request method is not POST, it simply renders the review_submission.html template with the submission details.
+    The cluster_head_release function hands every submission the logged in cluster head has claimed back to the shared queue, so other cluster heads can pick them up before the leases would have lapsed.
     """
 
-    submission = get_object_or_404(JournalPublication, id=submission_id)
+    user = request.faculty_user
+    if user.role != 'cluster_head':
+        return HttpResponse('Forbidden', status=403)
 
-    if request.method == 'POST':
-        status = request.POST.get('status')  # 'approved_by_cluster', 'rejected_by_cluster', 'revision'
-        remarks = request.POST.get('remarks')
+    released = release_claims(user)
+    messages.success(request, f"{released} claimed submission(s) released.")
+    return redirect('cluster_head_dashboard')
 
-        if status not in ['approved_by_cluster', 'rejected_by_cluster', 'revision']:
-            messages.error(request, 'Invalid status.')
-            return redirect('review_submission_journal', submission_id=submission.id)
-
-        # Map status to cluster_head_status
-        if status == 'approved_by_cluster':
-            submission.cluster_head_status = 'approved'
-            submission.status = 'approved_by_cluster'
-        elif status == 'rejected_by_cluster':
-            submission.cluster_head_status = 'rejected'
-            submission.status = 'rejected_by_cluster'
-        elif status == 'revision':
-            submission.cluster_head_status = 'revision'
-            submission.status = 'revision'
-
-        submission.cluster_head_remarks = remarks
-        submission.save()
-
-        messages.success(request, f"Submission '{submission.title_of_paper}' reviewed successfully.")
-        return redirect('cluster_head_dashboard')
-
-    return render(request, 'review_submission_journal.html', {'submission': submission})
 
 
-
-def my_submissions(request):
+@require_POST
+def cluster_head_bulk_review(request):
 
     """
-    The my_submissions function retrieves and displays all journal publication submissions made by the logged-in user. It first checks if the user is authenticated by verifying the presence of 'user_id' in the session. If not authenticated, it redirects to the login page. Once authenticated, it fetches the user’s submissions from the JournalPublication model and renders them in the my_submissions.html template.
+    The cluster_head_bulk_review function lets a cluster head decide many queue entries, of any mix of submission types, in one request. It expects a JSON body {"items": [{"type": ..., "id": ..., "decision": ..., "remarks": ...}, ...]} where type is a submission type key (journal, patent, ...) and decision is approved_by_cluster, rejected_by_cluster or revision. All items are applied in one transaction with one conditional UPDATE per submission type, and the response lists an outcome per item (applied, conflict, not_found or invalid) so the dashboard can tell which entries another reviewer had already decided.
     """
 
-    if 'user_id' not in request.session:
-        return redirect('login')
+    return bulk_review(request, 'cluster_head')
 
-    user_uuid = request.session['user_id']
-    user = FacultyUser.objects.get(user_id=user_uuid)
-    
-    journal_submissions = JournalPublication.objects.filter(user=user).order_by('-submitted_at')
 
-    conference_submissions = ConferencePublication.objects.filter(user=user).order_by('-submitted_at')
+@require_POST
+def dean_bulk_review(request):
 
-    research_submissions = ResearchProject.objects.filter(user=user).order_by('-submitted_at')
+    """
+    The dean_bulk_review function is the dean's batch sign-off of the dean dashboard queue. It takes the same JSON body as cluster_head_bulk_review, with approve or reject as the decision, groups the IDs by submission type and applies every transition in one transaction, with one conditional UPDATE per submission type and one update per affected counter. Each faculty member whose submissions were decided then gets a single summary e-mail covering all of them, sent once the transaction has committed, instead of one e-mail per submission.
+    """
 
-    patent_submissions = Patents.objects.filter(user=user).order_by('-submitted_at')
+    return bulk_review(request, 'dean', notify=True)
 
-    copyright_submissions = Copyright.objects.filter(user=user).order_by('-submitted_at')
 
-    phd_guidance_submissions = PhdGuidance.objects.filter(user=user).order_by('-submitted_at')
+def bulk_review(request, stage, notify=False):
 
-    book_chapter_submissions = BookChapter.objects.filter(user=user).order_by('-submitted_at')
+    """
+    The bulk_review function is the shared body of the two bulk review endpoints. It checks that the logged in user has the reviewer role of the stage, parses the {"items": [...]} body, applies the decisions with apply_reviews(), skipping (as 'claimed') the cluster head entries another cluster head holds a live claim on, and, when notify is set, queues one decision e-mail per faculty member. It answers with a per-item outcome and the totals of each outcome.
+    """
 
-    books_authored_submissions = BooksAuthored.objects.filter(user=user).order_by('-submitted_at')
+    user = get_faculty_user(request)
+    if user is None:
+        return JsonResponse({'error': 'Unauthorized'}, status=401)
+    if user.role != stage:
+        return JsonResponse({'error': 'Forbidden'}, status=403)
 
-    consultancy_project_submissions = ConsultancyProjects.objects.filter(user=user).order_by('-submitted_at')
+    try:
+        items = json.loads(request.body)['items']
+        decisions = [(item.get('type'), item.get('id'), item.get('decision'), item.get('remarks')) for item in items]
+    except (ValueError, KeyError, TypeError, AttributeError):
+        return JsonResponse({'error': 'Expected a JSON body of the form {"items": [{"type", "id", "decision", "remarks"}, ...]}'}, status=400)
+    if len(decisions) > BULK_REVIEW_MAX_ITEMS:
+        return JsonResponse({'error': f'At most {BULK_REVIEW_MAX_ITEMS} items per request'}, status=400)
+
+    # ✅ One transaction, one grouped UPDATE per submission type
+    with transaction.atomic():
+        # ✅ Entries another cluster head has claimed are left to them
+        held = held_by_others(user, decisions) if stage == 'cluster_head' else frozenset()
+        outcomes = apply_reviews(stage, decisions, actor=user, held=held)
+        # ✅ One summary e-mail per faculty member, sent after commit
+        notified = len(queue_decision_notifications(stage, outcomes)) if notify else 0
+
+    summary = {outcome: 0 for outcome in ('applied', 'conflict', 'claimed', 'not_found', 'invalid')}
+    for result in outcomes:
+        summary[result.outcome] += 1
 
-    editorial_roles_submissions = EditorialRoles.objects.filter(user=user).order_by('-submitted_at')
+    return JsonResponse({
+        'results': [
+            {'type': result.key, 'id': result.pk, 'outcome': result.outcome, 'status': result.status}
+            for result in outcomes
+        ],
+        **summary,
+        'notified': notified,
+    })
 
-    reviewer_roles_submissions = ReviewerRoles.objects.filter(user=user).order_by('-submitted_at')
 
-    awards_achievements_submissions = AwardsAchievements.objects.filter(user=user).order_by('-submitted_at')
+@faculty_login_required
+def cluster_head_review(request, model, submission_id):
 
-    industry_collaboration_submissions = IndustryCollaboration.objects.filter(user=user).order_by('-submitted_at')
+    """
+    The cluster_head_review function is the shared body of the 13 review_submission_* views, open to logged in cluster heads only. On GET it renders the schema-driven review_submission.html page for the submission. On POST it applies the selected status (approved, rejected or revision) through the review state machine in accounts/review.py, which only writes the review columns and only if the submission is still waiting for a cluster head. If another cluster head decided it in the meantime, or holds a live claim on it, the reviewer is told so instead of overwriting or duplicating their work.
+    """
 
-    for sub in journal_submissions:
-        sub.submission_type = 'Journal Publication'
-        
-    for sub in conference_submissions:
-        sub.submission_type = 'Conference Publication'
+    user = request.faculty_user
+    if user.role != 'cluster_head':
+        return HttpResponse('Forbidden', status=403)
 
-    for sub in research_submissions:
-        sub.submission_type = 'Research Project'
+    submission = get_object_or_404(model, id=submission_id)
+    submission_type = get_submission_type(model)
 
-    for sub in patent_submissions:
-        sub.submission_type = 'Patent Submission'
+    if request.method == 'POST':
+        status = request.POST.get('status')  # 'approved_by_cluster', 'rejected_by_cluster', 'revision'
+        remarks = request.POST.get('remarks')
 
-    for sub in copyright_submissions:
-        sub.submission_type = 'Copyright Submission'
+        # ✅ A live claim reserves the submission for the cluster head holding it
+        holder = claim_holder(user, submission)
+        if holder is not None:
+            messages.error(request, f"{holder.full_name} has claimed this submission. Your decision was not saved; it can be reviewed once they release it or the claim lapses.")
+            return redirect('cluster_head_dashboard')
 
-    for sub in phd_guidance_submissions:
-        sub.submission_type = 'PhD Guidance'
+        try:
+            apply_review(submission, 'cluster_head', status, remarks, actor=user)
+        except InvalidDecision:
+            messages.error(request, 'Invalid status.')
+            return redirect(submission_type.review_url, submission_id=submission.id)
+        except ReviewConflict as conflict:
+            # ✅ Someone else got there first; their decision stands
+            messages.error(request, f"Submission '{getattr(submission, submission_type.title_field)}' was already reviewed ({conflict.get_current_status_display()}). Your decision was not saved.")
+            return redirect('cluster_head_dashboard')
 
-    for sub in book_chapter_submissions:
-        sub.submission_type = 'Book Chapter'
+        messages.success(request, f"Submission '{getattr(submission, submission_type.title_field)}' reviewed successfully.")
+        return redirect('cluster_head_dashboard')
 
-    for sub in books_authored_submissions:
-        sub.submission_type = 'Books Authored'
+    # ✅ Renew our lease, or warn that another cluster head holds one
+    holder = renew_claim(user, submission)
+    if holder is not None:
+        messages.warning(request, f"{holder.full_name} has claimed this submission and may be reviewing it.")
 
-    for sub in consultancy_project_submissions:
-        sub.submission_type = 'Consultancy Project'
+    return render(request, 'review_submission.html', review_context(submission, 'cluster_head'))
 
-    for sub in editorial_roles_submissions:
-        sub.submission_type = 'Editorial Roles'
 
-    for sub in reviewer_roles_submissions:
-        sub.submission_type = 'Reviewer Roles'
+@faculty_login_required
+def dean_review(request, model, pk):
 
-    for sub in awards_achievements_submissions:
-        sub.submission_type = 'Awards & Achievements'
+    """
+    The dean_review function is the shared body of the 13 dean_review_* views, open to the logged in dean only. On GET it renders the schema-driven review_submission.html page with the per-type review statistics. On POST it applies the dean's action (approve or reject) through the review state machine in accounts/review.py, which only succeeds while the submission is still approved by the cluster head and waiting for the dean, so a decision taken in another tab or by another dean is never silently overwritten.
+    """
 
-    for sub in industry_collaboration_submissions:
-        sub.submission_type = 'Industry Collaboration'
+    user = request.faculty_user
+    if user.role != 'dean':
+        return HttpResponse('Forbidden', status=403)
 
-    submissions = sorted(
-        chain(journal_submissions, conference_submissions, research_submissions, patent_submissions, copyright_submissions, phd_guidance_submissions, book_chapter_submissions, books_authored_submissions, consultancy_project_submissions, editorial_roles_submissions, reviewer_roles_submissions, awards_achievements_submissions, industry_collaboration_submissions),
-        key=lambda x: x.submitted_at,
-        reverse=True
-    )
+    submission = get_object_or_404(model, pk=pk)
+    submission_type = get_submission_type(model)
 
-    approved_count = sum(1 for sub in submissions if sub.dean_status == 'approved')
+    if request.method == 'POST':
+        action = request.POST.get('action')
+        remarks = request.POST.get('remarks')
 
-    pending_count = sum(1 for sub in submissions if sub.dean_status in ['submitted', 'pending'])
+        try:
+            apply_review(submission, 'dean', action, remarks, actor=user)
+        except InvalidDecision:
+            messages.error(request, "Invalid action.")
+            return redirect(submission_type.dean_review_url, pk=pk)
+        except ReviewConflict as conflict:
+            messages.error(request, f"Submission '{getattr(submission, submission_type.title_field)}' was already reviewed ({conflict.get_current_status_display()}). Your decision was not saved.")
+            return redirect('dean_dashboard')
 
-    total_count = len(submissions)
+        messages.success(request, f"Submission '{getattr(submission, submission_type.title_field)}' reviewed by Dean successfully.")
+        return redirect('dean_dashboard')
 
-    revision_count = sum(1 for sub in submissions if sub.dean_status == 'revision')
+    # ✅ Sidebar counters from the per-type cached review stats
+    stats = dean_review_stats(model)
+    total_count = stats['total']
+    approved_count = stats['approved']
+    rejected_count = stats['rejected']
 
-    rejected_count = sum(1 for sub in submissions if sub.dean_status == 'rejected')
+    return render(request, 'review_submission.html', review_context(submission, 'dean', total_count=total_count, approved_count=approved_count, rejected_count=rejected_count))
 
-    approved_by_cluster_count = sum(1 for sub in submissions if sub.cluster_head_status == 'approved')
 
-    pending_by_cluster_count = sum(1 for sub in submissions if sub.cluster_head_status == 'pending')
-    
-    revision_by_cluster_count = sum(1 for sub in submissions if sub.cluster_head_status == 'revision')
+def review_submission_journal(request, submission_id):
 
-    rejected_by_cluster_count = sum(1 for sub in submissions if sub.cluster_head_status == 'rejected')
 
+    """
+    The review_submission function allows a cluster head to review individual journal publication submissions. It retrieves the specific submission by its ID and processes the review form submitted by the cluster head. Depending on the selected status (approved, rejected, or revision), it updates the submission’s cluster_head_status and overall status accordingly, along with any remarks provided, with a conditional update that fails if another cluster head decided first. After saving the changes, it redirects back to the cluster head dashboard with a success message. If the request method is not POST, it simply renders the review_submission.html template with the submission details.
+    """
 
-    return render(request, 'my_submissions.html', {'submissions': submissions, 'approved_count': approved_count, 'pending_count': pending_count, 'total_count': total_count, 'revision_count': revision_count, 'approved_by_cluster_count': approved_by_cluster_count, 'pending_by_cluster_count': pending_by_cluster_count, 'revision_by_cluster_count': revision_by_cluster_count, 'rejected_by_cluster_count': rejected_by_cluster_count, 'rejected_count': rejected_count})
+    return cluster_head_review(request, JournalPublication, submission_id)
 
 
 
-def dean_dashboard(request):
+@faculty_login_required
+def my_submissions(request):
 
     """
-    The dean_dashboard function displays all journal publication submissions that were approved by the cluster head. It retrieves these submissions from the database and renders them in the dean_dashboard.html template.
+    The my_submissions function retrieves and displays all submissions made by the logged-in user. It first checks if the user is authenticated by verifying the presence of 'user_id' in the session. If not authenticated, it redirects to the login page. Once authenticated, it pages through the user’s entries in the SubmissionIndex table (newest first), loads the submissions on the current page, and renders them in the my_submissions.html template together with the user’s status counters.
     """
 
-
-    if 'user_id' not in request.session:
-        return redirect('login')
-
-    user = FacultyUser.objects.get(user_id=request.session['user_id'])
-
-    journal_submissions = JournalPublication.objects.filter(status='approved_by_cluster').order_by('-submitted_at')
-
-    for sub in journal_submissions:
-        sub.review_url = reverse('dean_review_journal', args=[sub.id])
-        sub.submission_type = 'Journal Publication'
+    user = request.faculty_user
     
-    conference_submissions = ConferencePublication.objects.filter(status='approved_by_cluster').order_by('-submitted_at')
+    # ✅ One ordered, paginated query over the submission index
+    submissions = paginate_queue(user_queue(user), request.GET.get('page'))
 
-    for sub in conference_submissions:
-        sub.review_url = reverse('dean_review_conference', args=[sub.id])
-        sub.submission_type = 'Conference Publication'
-    
-    research_submissions = ResearchProject.objects.filter(overall_status='approved_by_cluster').order_by('-submitted_at')
+    # ✅ Latest three submissions overall (not just on this page), streamed from the per-type tables
+    recent_submissions = list(user_submission_feed(user, limit=3))
 
-    for sub in research_submissions:
-        sub.review_url = reverse('dean_review_research', args=[sub.id])
-        sub.submission_type = 'Research Project'
+    # ✅ Status counters come from one aggregate query instead of nine passes over the list
+    counts = user_submission_counts(user)
 
-    patent_submissions = Patents.objects.filter(status='approved_by_cluster').order_by('-submitted_at')
+    approved_count = counts['approved']
 
-    for sub in patent_submissions:
-        sub.review_url = reverse('dean_review_patent', args=[sub.id])
-        sub.submission_type = 'Patent Submission'
-    
-    copyright_submissions = Copyright.objects.filter(status='approved_by_cluster').order_by('-submitted_at')
+    pending_count = counts['pending']
 
-    for sub in copyright_submissions:
-        sub.review_url = reverse('dean_review_copyright', args=[sub.id])
-        sub.submission_type = 'Copyright Submission'
+    total_count = counts['total']
 
-    phd_guidance_submissions = PhdGuidance.objects.filter(status='approved_by_cluster').order_by('-submitted_at')
+    revision_count = counts['revision']
 
-    for sub in phd_guidance_submissions:
-        sub.review_url = reverse('dean_review_phd_guidance', args=[sub.id])
-        sub.submission_type = 'PhD Guidance'
+    rejected_count = counts['rejected']
 
-    book_chapter_submissions = BookChapter.objects.filter(status='approved_by_cluster').order_by('-submitted_at')
+    approved_by_cluster_count = counts['cluster_approved']
 
-    for sub in book_chapter_submissions:
-        sub.review_url = reverse('dean_review_book_chapter', args=[sub.id])
-        sub.submission_type = 'Book Chapter'
+    pending_by_cluster_count = counts['cluster_pending']
 
-    books_authored_submissions = BooksAuthored.objects.filter(status='approved_by_cluster').order_by('-submitted_at')
+    revision_by_cluster_count = counts['cluster_revision']
 
-    for sub in books_authored_submissions:
-        sub.review_url = reverse('dean_review_books_authored', args=[sub.id])
-        sub.submission_type = 'Books Authored'
+    rejected_by_cluster_count = counts['cluster_rejected']
 
-    consultancy_project_submissions = ConsultancyProjects.objects.filter(status='approved_by_cluster').order_by('-submitted_at')
 
-    for sub in consultancy_project_submissions:
-        sub.review_url = reverse('dean_review_consultancy_project', args=[sub.id])
-        sub.submission_type = 'Consultancy Project'
-    
+    return render(request, 'my_submissions.html', {'submissions': submissions, 'recent_submissions': recent_submissions, 'approved_count': approved_count, 'pending_count': pending_count, 'total_count': total_count, 'revision_count': revision_count, 'approved_by_cluster_count': approved_by_cluster_count, 'pending_by_cluster_count': pending_by_cluster_count, 'revision_by_cluster_count': revision_by_cluster_count, 'rejected_by_cluster_count': rejected_by_cluster_count, 'rejected_count': rejected_count})
 
-    editorial_roles_submissions = EditorialRoles.objects.filter(status='approved_by_cluster').order_by('-submitted_at')
 
-    for sub in editorial_roles_submissions:
-        sub.review_url = reverse('dean_review_editorial_roles', args=[sub.id])
-        sub.submission_type = 'Editorial Roles'
-    
 
-    reviewer_roles_submissions = ReviewerRoles.objects.filter(status='approved_by_cluster').order_by('-submitted_at')
+@faculty_login_required
+def dean_dashboard(request):
 
-    for sub in reviewer_roles_submissions:
-        sub.review_url = reverse('dean_review_reviewer_roles', args=[sub.id])
-        sub.submission_type = 'Reviewer Roles'
+    """
+    The dean_dashboard function displays all submissions, across every submission type, that were approved by the cluster head and are waiting for the dean. The queue is read from the SubmissionIndex table with the same keyset (cursor) pagination as the cluster head queue, only the submissions on the current page are loaded from their own tables, and the counters come from a single aggregate query. Only the dean may open it; other roles get 403 Forbidden. The page is rendered with the dean_dashboard.html template.
+    """
 
-    awards_achievements_submissions = AwardsAchievements.objects.filter(status='approved_by_cluster').order_by('-submitted_at')
 
-    for sub in awards_achievements_submissions:
-        sub.review_url = reverse('dean_review_awards_achievements', args=[sub.id])
-        sub.submission_type = 'Awards & Achievements'
+    user = request.faculty_user
+    if user.role != 'dean':
+        return HttpResponse('Forbidden', status=403)
 
-    industry_collaboration_submissions = IndustryCollaboration.objects.filter(status='approved_by_cluster').order_by('-submitted_at')
+    queue = dean_queue()
 
-    for sub in industry_collaboration_submissions:
-        sub.review_url = reverse('dean_review_industry_collaboration', args=[sub.id])
-        sub.submission_type = 'Industry Collaboration'
+    submissions = keyset_page(
+        queue,
+        after=request.GET.get('after'),
+        before=request.GET.get('before'),
+        page_size=parse_page_size(request.GET.get('page_size')),
+        review_url_attr='dean_review_url',
+        params=request.GET,
+    )
 
-    all_submissions = sorted(
-        list(journal_submissions) + list(conference_submissions) + list(research_submissions) + list(patent_submissions) + list(copyright_submissions) + list(phd_guidance_submissions) + list(book_chapter_submissions) + list(books_authored_submissions) + list(consultancy_project_submissions) + list(editorial_roles_submissions) + list(reviewer_roles_submissions) + list(awards_achievements_submissions) + list(industry_collaboration_submissions),
-        key=lambda x: x.submitted_at,
-        reverse=True
+    summary = queue.aggregate(
+        total_submissions=Count('id'),
+        approved_count=Count('id', filter=Q(dean_status='approved')),
     )
 
     total_faculty = FacultyUser.objects.filter(role='faculty').count()
 
-    approved_count = sum(1 for sub in all_submissions if sub.dean_status == 'approved')
+    return render(request, 'dean_dashboard.html', {'submissions': submissions, 'approved_count': summary['approved_count'], 'total_submissions': summary['total_submissions'], 'total_faculty': total_faculty})
+
 
-    return render(request, 'dean_dashboard.html', {'submissions': all_submissions, 'approved_count': approved_count, 'total_faculty': total_faculty})
+def dean_analytics_etag(request):
+    return generation_etag(ALL_TYPES, 'dean_analytics')
 
 
+@cache_control(private=True, no_cache=True)
+@condition(etag_func=dean_analytics_etag)
 def dean_analytics_api(request):
-    total_submissions = (
-        JournalPublication.objects.count()
-        + ConferencePublication.objects.count()
-        + ResearchProject.objects.count()
-        + Patents.objects.count() + Copyright.objects.count()
-        + PhdGuidance.objects.count() + BookChapter.objects.count()
-        + BooksAuthored.objects.count() + ConsultancyProjects.objects.count() + EditorialRoles.objects.count()
-        + ReviewerRoles.objects.count() + AwardsAchievements.objects.count() + IndustryCollaboration.objects.count()
-    )
-    approved = (
-        JournalPublication.objects.filter(dean_status='approved').count()
-        + ConferencePublication.objects.filter(dean_status='approved').count()
-        + ResearchProject.objects.filter(overall_status='approved').count()
-        + Patents.objects.filter(dean_status='approved').count() + Copyright.objects.filter(dean_status='approved').count()
-        + PhdGuidance.objects.filter(dean_status='approved').count() + BookChapter.objects.filter(dean_status='approved').count()
-        + BooksAuthored.objects.filter(dean_status='approved').count() + ConsultancyProjects.objects.filter(dean_status='approved').count()
-        + EditorialRoles.objects.filter(dean_status='approved').count() + ReviewerRoles.objects.filter(dean_status='approved').count()
-        + AwardsAchievements.objects.filter(dean_status='approved').count() + IndustryCollaboration.objects.filter(dean_status='approved').count()
-    )
-    pending = (
-        JournalPublication.objects.filter(dean_status='pending').count()
-        + ConferencePublication.objects.filter(dean_status='pending').count()
-        + ResearchProject.objects.filter(overall_status='pending').count()
-        + Patents.objects.filter(dean_status='pending').count() + Copyright.objects.filter(dean_status='pending').count()
-        + PhdGuidance.objects.filter(dean_status='pending').count() + BookChapter.objects.filter(dean_status='pending').count()
-        + BooksAuthored.objects.filter(dean_status='pending').count() + ConsultancyProjects.objects.filter(dean_status='pending').count()
-        + EditorialRoles.objects.filter(dean_status='pending').count() + ReviewerRoles.objects.filter(dean_status='pending').count()
-        + AwardsAchievements.objects.filter(dean_status='pending').count() + IndustryCollaboration.objects.filter(dean_status='pending').count()
-    )
-    
-    revision = (
-        JournalPublication.objects.filter(dean_status='revision').count()
-        + ConferencePublication.objects.filter(dean_status='revision').count()
-        + ResearchProject.objects.filter(overall_status='revision').count()
-        + Patents.objects.filter(dean_status='revision').count() + Copyright.objects.filter(dean_status='revision').count()
-        + PhdGuidance.objects.filter(dean_status='revision').count() + BookChapter.objects.filter(dean_status='revision').count()
-        + BooksAuthored.objects.filter(dean_status='revision').count() + ConsultancyProjects.objects.filter(dean_status='revision').count()
-        + EditorialRoles.objects.filter(dean_status='revision').count() + ReviewerRoles.objects.filter(dean_status='revision').count()
-        + AwardsAchievements.objects.filter(dean_status='revision').count() + IndustryCollaboration.objects.filter(dean_status='revision').count()
-    )
 
-    return JsonResponse({
-        "approved": approved,
-        "pending": pending,
-        "revision": revision,
-        "total": total_submissions,
-    })
+    """
+    The dean_analytics_api function returns the institution-wide approved, pending, revision and total submission counts polled by the dean dashboard. The numbers are computed across all 13 submission types in a single aggregate query and served from the cache, keyed by the submission generations, so repeated polling does not rescan the submission tables. Responses carry an ETag built from the same generations; a poll sending it back in If-None-Match gets a 304 Not Modified without any database work.
+    """
 
+    # ✅ One cached aggregate instead of 52 COUNT queries per poll
+    return JsonResponse(dean_analytics())
 
-def dean_review_journal(request, pk):
 
+@cache_control(private=True, max_age=60)
+def review_metrics_api(request):
 
     """
-    The dean_review_journal function allows the dean to review individual journal publication submissions. It retrieves the specific submission by its ID and processes the review form submitted by the dean. Depending on the selected action (approve or reject), it updates the submission’s dean_status and overall status accordingly, along with any remarks provided. After saving the changes, it redirects back to the dean dashboard with a success message. If the request method is not POST, it simply renders the dean_review.html template with the submission details.
+    The review_metrics_api function returns how long submissions wait at each review stage, for the dean. For every decision taken in the last `days` days (30 by default, at most 365) the turnaround is the time from the event that put the submission in the stage's queue to the decision itself, read from the append-only ReviewEvent log. The response lists the count, mean and p50/p90/p99 turnaround in seconds per stage (cluster_head, dean) and per stage and reviewer, computed in a single windowed SQL query and cached until the next decision.
     """
 
-    submission = get_object_or_404(JournalPublication, pk=pk)
+    user = get_faculty_user(request)
+    if user is None:
+        return JsonResponse({'error': 'Unauthorized'}, status=401)
+    if user.role != 'dean':
+        return JsonResponse({'error': 'Forbidden'}, status=403)
 
-    if request.method == 'POST':
-        action = request.POST.get('action')
-        remarks = request.POST.get('remarks')
+    # ✅ LAG() + ROW_NUMBER() over the event log instead of per-submission history in Python
+    return JsonResponse(review_turnaround(parse_days(request.GET.get('days'))))
 
-        
 
-        # Validate and set dean review status
-        if action == 'approve':
-            submission.dean_status = 'approved'
-            submission.status = 'approved_by_dean'
-        elif action == 'reject':
-            submission.dean_status = 'rejected'
-            submission.status = 'rejected_by_dean'
-        else:
-            messages.error(request, "Invalid action.")
-            return redirect('dean_review_journal', pk=pk)   
+@cache_control(private=True, no_cache=True)
+def review_backlog_api(request):
 
-        # Save remarks separately for dean
-        submission.dean_remarks = remarks
-        submission.save()
+    """
+    The review_backlog_api function reports how deep each review queue is and how long its oldest submission has been waiting, per stage (cluster_head, dean) and per submission type, for the reviewers and for monitoring. It answers a logged in dean or cluster head, or a request carrying the REVIEW_BACKLOG_TOKEN bearer token. The figures come from one grouped query over the SubmissionIndex table that is cached until the next review transition, so polling it is cheap. With ?fail=1 the response status is 503 when a stage's oldest submission is older than its REVIEW_BACKLOG_MAX_AGE threshold, for HTTP monitors that only look at status codes.
+    """
 
-        messages.success(request, f"Submission '{submission.title_of_paper}' reviewed by Dean successfully.")
-        return redirect('dean_dashboard')
-    
-    total_count = JournalPublication.objects.count()
-    approved_count = JournalPublication.objects.filter(dean_status='approved').count()
-    rejected_count = JournalPublication.objects.filter(dean_status='rejected').count()
+    if not has_backlog_token(request):
+        user = get_faculty_user(request)
+        if user is None:
+            return JsonResponse({'error': 'Unauthorized'}, status=401)
+        if user.role not in REVIEW_QUEUES:
+            return JsonResponse({'error': 'Forbidden'}, status=403)
 
-    return render(request, 'dean_review_journal.html', {'submission': submission, 'total_count': total_count, 'approved_count': approved_count, 'rejected_count': rejected_count})
+    # ✅ One cached GROUP BY over the index instead of loading the dashboards
+    report = review_backlog()
+    over = any(stage['over_threshold'] for stage in report['stages'].values())
+    return JsonResponse(report, status=503 if over and request.GET.get('fail') else 200)
 
-def research_form(request):
-    total_count = JournalPublication.objects.count() + ConferencePublication.objects.count() + ResearchProject.objects.count() + Patents.objects.count() + Copyright.objects.count() + PhdGuidance.objects.count() + BookChapter.objects.count() + BooksAuthored.objects.count() + ConsultancyProjects.objects.count() + EditorialRoles.objects.count() + ReviewerRoles.objects.count() + AwardsAchievements.objects.count() + IndustryCollaboration.objects.count()
 
+def dean_review_journal(request, pk):
 
-    pending_count = JournalPublication.objects.filter(dean_status='pending').count() + ConferencePublication.objects.filter(dean_status='pending').count() + ResearchProject.objects.filter(overall_status='pending').count() + Patents.objects.filter(dean_status='pending').count() + Copyright.objects.filter(dean_status='pending').count() + PhdGuidance.objects.filter(dean_status='pending').count() + BookChapter.objects.filter(dean_status='pending').count() + BooksAuthored.objects.filter(dean_status='pending').count() + ConsultancyProjects.objects.filter(dean_status='pending').count() + EditorialRoles.objects.filter(dean_status='pending').count() + ReviewerRoles.objects.filter(dean_status='pending').count() + AwardsAchievements.objects.filter(dean_status='pending').count() + IndustryCollaboration.objects.filter(dean_status='pending').count()
 
-    approved_by_cluster_head = JournalPublication.objects.filter(cluster_head_status='approved').count() + ConferencePublication.objects.filter(cluster_head_status='approved').count() + ResearchProject.objects.filter(cluster_head_status='approved').count() + Patents.objects.filter(cluster_head_status='approved').count() + Copyright.objects.filter(cluster_head_status='approved').count() + PhdGuidance.objects.filter(cluster_head_status='approved').count() + BookChapter.objects.filter(cluster_head_status='approved').count() + BooksAuthored.objects.filter(cluster_head_status='approved').count() + ConsultancyProjects.objects.filter(cluster_head_status='approved').count() + EditorialRoles.objects.filter(cluster_head_status='approved').count() + ReviewerRoles.objects.filter(cluster_head_status='approved').count() + AwardsAchievements.objects.filter(cluster_head_status='approved').count() + IndustryCollaboration.objects.filter(cluster_head_status='approved').count()
+    """
+    The dean_review_journal function allows the dean to review individual journal publication submissions. It retrieves the specific submission by its ID and processes the review form submitted by the dean. Depending on the selected action (approve or reject), it updates the submission’s dean_status and overall status accordingly, along with any remarks provided, with a conditional update that fails if the submission was decided in the meantime. After saving the changes, it redirects back to the dean dashboard with a success message. If the request method is not POST, it simply renders the dean_review.html template with the submission details.
+    """
 
+    return dean_review(request, JournalPublication, pk)
 
-    approved_by_dean = JournalPublication.objects.filter(dean_status='approved').count() + ConferencePublication.objects.filter(dean_status='approved').count() + ResearchProject.objects.filter(overall_status='approved').count() + Patents.objects.filter(dean_status='approved').count() + Copyright.objects.filter(dean_status='approved').count() + PhdGuidance.objects.filter(dean_status='approved').count() + BookChapter.objects.filter(dean_status='approved').count() + BooksAuthored.objects.filter(dean_status='approved').count() + ConsultancyProjects.objects.filter(dean_status='approved').count() + EditorialRoles.objects.filter(dean_status='approved').count() + ReviewerRoles.objects.filter(dean_status='approved').count() + AwardsAchievements.objects.filter(dean_status='approved').count() + IndustryCollaboration.objects.filter(dean_status='approved').count()
+def research_form(request):
+
+    """
+    The research_form function renders the landing page listing the 13 submission forms, together with four institution-wide statistics: the total number of submissions, those pending with the dean, those approved by a cluster head and those approved by the dean. The statistics come from a single aggregate query over all submission types that is cached until the next submission is saved, so opening the page does not rescan every submission table.
+    """
+
+    # ✅ Institution-wide counters from one cached aggregate
+    stats = institution_stats()
+    total_count = stats['total']
+    pending_count = stats['pending']
+    approved_by_cluster_head = stats['cluster_approved']
+    approved_by_dean = stats['approved']
 
     return render(request, 'research_forms.html', {'total_count': total_count, 'pending_count': pending_count, 'approved_by_cluster_head': approved_by_cluster_head, 'approved_by_dean': approved_by_dean})
 
+@faculty_login_required
 def conference_publication(request):
-    if 'user_id' not in request.session:
-        return redirect('login')
-    
     if request.method == 'POST':
         form = ConferencePublicationForm(request.POST, request.FILES)
         if form.is_valid():
             publication = form.save(commit=False)
-            user = FacultyUser.objects.get(user_id=request.session['user_id'])
+            user = request.faculty_user
             publication.user = user
             publication.save()
             messages.success(request, "Conference publication submitted successfully.")
@@ -994,75 +949,19 @@ def conference_publication(request):
 
 
 def review_submission_conference(request, submission_id):
-    submission = get_object_or_404(ConferencePublication, id=submission_id)
-
-    if request.method == 'POST':
-        status = request.POST.get('status')  # 'approved_by_cluster', 'rejected_by_cluster', 'revision'
-        remarks = request.POST.get('remarks')
-
-        if status not in ['approved_by_cluster', 'rejected_by_cluster', 'revision']:
-            messages.error(request, 'Invalid status.')
-            return redirect('review_submission_conference', submission_id=submission.id)
-
-        # Map status to cluster_head_status
-        if status == 'approved_by_cluster':
-            submission.cluster_head_status = 'approved'
-            submission.status = 'approved_by_cluster'
-        elif status == 'rejected_by_cluster':
-            submission.cluster_head_status = 'rejected'
-            submission.status = 'rejected_by_cluster'
-        elif status == 'revision':
-            submission.cluster_head_status = 'revision'
-            submission.status = 'revision'
-
-        submission.cluster_head_remarks = remarks
-        submission.save()
-
-        messages.success(request, f"Submission '{submission.title_of_paper}' reviewed successfully.")
-        return redirect('cluster_head_dashboard')
-    return render(request, 'review_submission_conference.html', {'submission': submission})
+    return cluster_head_review(request, ConferencePublication, submission_id)
 
 
 def dean_review_conference(request, pk):
-    submission = get_object_or_404(ConferencePublication, pk=pk)
-
-    if request.method == 'POST':
-        action = request.POST.get('action')
-        remarks = request.POST.get('remarks')
-
-        # Validate and set dean review status
-        if action == 'approve':
-            submission.dean_status = 'approved'
-            submission.status = 'approved_by_dean'
-        elif action == 'reject':
-            submission.dean_status = 'rejected'
-            submission.status = 'rejected_by_dean'
-        else:
-            messages.error(request, "Invalid action.")
-            return redirect('dean_review_conference', pk=pk)
-
-        # Save remarks separately for dean
-        submission.dean_remarks = remarks
-        submission.save()
-
-        messages.success(request, f"Submission '{submission.title_of_paper}' reviewed by Dean successfully.")
-        return redirect('dean_dashboard')
-    
-    total_count = ConferencePublication.objects.count()
-    approved_count = ConferencePublication.objects.filter(dean_status='approved').count()
-    rejected_count = ConferencePublication.objects.filter(dean_status='rejected').count()
-
-    return render(request, 'dean_review_conference.html', {'submission': submission, 'total_count': total_count, 'approved_count': approved_count, 'rejected_count': rejected_count})
+    return dean_review(request, ConferencePublication, pk)
 
+@faculty_login_required
 def research_project(request):
-    if 'user_id' not in request.session:
-        return redirect('login')
-    
     if request.method == 'POST':
         form = ResearchProjectForm(request.POST, request.FILES)
         if form.is_valid():
             project = form.save(commit=False)
-            user = FacultyUser.objects.get(user_id=request.session['user_id'])
+            user = request.faculty_user
             project.user = user
             project.save()
             messages.success(request, "Research project submitted successfully.")
@@ -1072,75 +971,19 @@ def research_project(request):
     return render(request, 'research_project.html', {'form': form})
 
 def review_submission_research(request, submission_id):
-    submission = get_object_or_404(ResearchProject, id=submission_id)
-
-    if request.method == 'POST':
-        status = request.POST.get('status')  # 'approved_by_cluster', 'rejected_by_cluster', 'revision'
-        remarks = request.POST.get('remarks')
-
-        if status not in ['approved_by_cluster', 'rejected_by_cluster', 'revision']:
-            messages.error(request, 'Invalid status.')
-            return redirect('review_submission_research', submission_id=submission.id)
-
-        # Map status to cluster_head_status
-        if status == 'approved_by_cluster':
-            submission.cluster_head_status = 'approved'
-            submission.overall_status = 'approved_by_cluster'
-        elif status == 'rejected_by_cluster':
-            submission.cluster_head_status = 'rejected'
-            submission.overall_status = 'rejected_by_cluster'
-        elif status == 'revision':
-            submission.cluster_head_status = 'revision'
-            submission.overall_status = 'revision'
-
-        submission.cluster_head_remarks = remarks
-        submission.save()
-
-        messages.success(request, f"Submission '{submission.project_title}' reviewed successfully.")
-        return redirect('cluster_head_dashboard')
-    return render(request, 'review_submission_research.html', {'submission': submission})
+    return cluster_head_review(request, ResearchProject, submission_id)
 
 def dean_review_research(request, pk):
-    submission = get_object_or_404(ResearchProject, pk=pk)
-
-    if request.method == 'POST':
-        action = request.POST.get('action')
-        remarks = request.POST.get('remarks')
-
-        # Validate and set dean review status
-        if action == 'approve':
-            submission.dean_status = 'approved'
-            submission.overall_status = 'approved_by_dean'
-        elif action == 'reject':
-            submission.dean_status = 'rejected'
-            submission.overall_status = 'rejected_by_dean'
-        else:
-            messages.error(request, "Invalid action.")
-            return redirect('dean_review_research', pk=pk)
-
-        # Save remarks separately for dean
-        submission.dean_remarks = remarks
-        submission.save()
-
-        messages.success(request, f"Submission '{submission.project_title}' reviewed by Dean successfully.")
-        return redirect('dean_dashboard')
-    
-    total_count = ResearchProject.objects.count()
-    approved_count = ResearchProject.objects.filter(dean_status='approved').count()
-    rejected_count = ResearchProject.objects.filter(dean_status='rejected').count()
-
-    return render(request, 'dean_review_research.html', {'submission': submission, 'total_count': total_count, 'approved_count': approved_count, 'rejected_count': rejected_count})
+    return dean_review(request, ResearchProject, pk)
 
 
+@faculty_login_required
 def patent_submission(request):
-    if 'user_id' not in request.session:
-        return redirect('login')
-    
     if request.method == 'POST':
         form = PatentForm(request.POST, request.FILES)
         if form.is_valid():
             patent = form.save(commit=False)
-            user = FacultyUser.objects.get(user_id=request.session['user_id'])
+            user = request.faculty_user
             patent.user = user
             patent.save()
             messages.success(request, "Patent submitted successfully.")
@@ -1151,76 +994,20 @@ def patent_submission(request):
 
 
 def review_submission_patent(request, submission_id):
-    submission = get_object_or_404(Patents, id=submission_id)
-
-    if request.method == 'POST':
-        status = request.POST.get('status')  # 'approved_by_cluster', 'rejected_by_cluster', 'revision'
-        remarks = request.POST.get('remarks')
-
-        if status not in ['approved_by_cluster', 'rejected_by_cluster', 'revision']:
-            messages.error(request, 'Invalid status.')
-            return redirect('review_submission_patent', submission_id=submission.id)
-
-        # Map status to cluster_head_status
-        if status == 'approved_by_cluster':
-            submission.cluster_head_status = 'approved'
-            submission.status = 'approved_by_cluster'
-        elif status == 'rejected_by_cluster':
-            submission.cluster_head_status = 'rejected'
-            submission.status = 'rejected_by_cluster'
-        elif status == 'revision':
-            submission.cluster_head_status = 'revision'
-            submission.status = 'revision'
-
-        submission.cluster_head_remarks = remarks
-        submission.save()
-
-        messages.success(request, f"Submission '{submission.title_of_patent}' reviewed successfully.")
-        return redirect('cluster_head_dashboard')
-    return render(request, 'review_submission_patent.html', {'submission': submission})
+    return cluster_head_review(request, Patents, submission_id)
 
 def dean_review_patent(request, pk):
-    submission = get_object_or_404(Patents, pk=pk)
-
-    if request.method == 'POST':
-        action = request.POST.get('action')
-        remarks = request.POST.get('remarks')
-
-        # Validate and set dean review status
-        if action == 'approve':
-            submission.dean_status = 'approved'
-            submission.status = 'approved_by_dean'
-        elif action == 'reject':
-            submission.dean_status = 'rejected'
-            submission.status = 'rejected_by_dean'
-        else:
-            messages.error(request, "Invalid action.")
-            return redirect('dean_review_patent', pk=pk)
-
-        # Save remarks separately for dean
-        submission.dean_remarks = remarks
-        submission.save()
-
-        messages.success(request, f"Submission '{submission.title_of_patent}' reviewed by Dean successfully.")
-        return redirect('dean_dashboard')
-    
-    total_count = Patents.objects.count()
-    approved_count = Patents.objects.filter(dean_status='approved').count()
-    rejected_count = Patents.objects.filter(dean_status='rejected').count()
-
-    return render(request, 'dean_review_patent.html', {'submission': submission, 'total_count': total_count, 'approved_count': approved_count, 'rejected_count': rejected_count})
+    return dean_review(request, Patents, pk)
 
 
+@faculty_login_required
 def copyright_submission(request):
 
-    if 'user_id' not in request.session:
-        return redirect('login')
-    
     if request.method == 'POST':
         form = CopyrightForm(request.POST, request.FILES)
         if form.is_valid():
             copyright = form.save(commit=False)
-            user = FacultyUser.objects.get(user_id=request.session['user_id'])
+            user = request.faculty_user
             copyright.user = user
             copyright.save()
             messages.success(request, "Copyright submitted successfully.")
@@ -1231,76 +1018,20 @@ def copyright_submission(request):
 
 
 def review_submission_copyright(request, submission_id):
-    submission = get_object_or_404(Copyright, id=submission_id)
-
-    if request.method == 'POST':
-        status = request.POST.get('status')  # 'approved_by_cluster', 'rejected_by_cluster', 'revision'
-        remarks = request.POST.get('remarks')
-
-        if status not in ['approved_by_cluster', 'rejected_by_cluster', 'revision']:
-            messages.error(request, 'Invalid status.')
-            return redirect('review_submission_copyright', submission_id=submission.id)
-
-        # Map status to cluster_head_status
-        if status == 'approved_by_cluster':
-            submission.cluster_head_status = 'approved'
-            submission.status = 'approved_by_cluster'
-        elif status == 'rejected_by_cluster':
-            submission.cluster_head_status = 'rejected'
-            submission.status = 'rejected_by_cluster'
-        elif status == 'revision':
-            submission.cluster_head_status = 'revision'
-            submission.status = 'revision'
-
-        submission.cluster_head_remarks = remarks
-        submission.save()
-
-        messages.success(request, f"Submission '{submission.title_of_work}' reviewed successfully.")
-        return redirect('cluster_head_dashboard')
-    return render(request, 'review_submission_copyright.html', {'submission': submission})
+    return cluster_head_review(request, Copyright, submission_id)
 
 
 def dean_review_copyright(request, pk):
-    submission = get_object_or_404(Copyright, pk=pk)
-
-    if request.method == 'POST':
-        action = request.POST.get('action')
-        remarks = request.POST.get('remarks')
-
-        # Validate and set dean review status
-        if action == 'approve':
-            submission.dean_status = 'approved'
-            submission.status = 'approved_by_dean'
-        elif action == 'reject':
-            submission.dean_status = 'rejected'
-            submission.status = 'rejected_by_dean'
-        else:
-            messages.error(request, "Invalid action.")
-            return redirect('dean_review_copyright', pk=pk)
-
-        # Save remarks separately for dean
-        submission.dean_remarks = remarks
-        submission.save()
-
-        messages.success(request, f"Submission '{submission.title_of_work}' reviewed by Dean successfully.")
-        return redirect('dean_dashboard')
-    
-    total_count = Copyright.objects.count()
-    approved_count = Copyright.objects.filter(dean_status='approved').count()
-    rejected_count = Copyright.objects.filter(dean_status='rejected').count()
-
-    return render(request, 'dean_review_copyright.html', {'submission': submission, 'total_count': total_count, 'approved_count': approved_count, 'rejected_count': rejected_count})
+    return dean_review(request, Copyright, pk)
 
 
+@faculty_login_required
 def phd_guidance_submission(request):
-    if 'user_id' not in request.session:
-        return redirect('login')
-    
     if request.method == 'POST':
         form = PhdGuidanceForm(request.POST, request.FILES)
         if form.is_valid():
             guidance = form.save(commit=False)
-            user = FacultyUser.objects.get(user_id=request.session['user_id'])
+            user = request.faculty_user
             guidance.user = user
             guidance.save()
             messages.success(request, "PhD Guidance details submitted successfully.")
@@ -1311,77 +1042,21 @@ def phd_guidance_submission(request):
 
 
 def review_submission_phd_guidance(request, submission_id):
-    submission = get_object_or_404(PhdGuidance, id=submission_id)
-
-    if request.method == 'POST':
-        status = request.POST.get('status')  # 'approved_by_cluster', 'rejected_by_cluster', 'revision'
-        remarks = request.POST.get('remarks')
-
-        if status not in ['approved_by_cluster', 'rejected_by_cluster', 'revision']:
-            messages.error(request, 'Invalid status.')
-            return redirect('review_submission_phd_guidance', submission_id=submission.id)
-
-        # Map status to cluster_head_status
-        if status == 'approved_by_cluster':
-            submission.cluster_head_status = 'approved'
-            submission.status = 'approved_by_cluster'
-        elif status == 'rejected_by_cluster':
-            submission.cluster_head_status = 'rejected'
-            submission.status = 'rejected_by_cluster'
-        elif status == 'revision':
-            submission.cluster_head_status = 'revision'
-            submission.status = 'revision'
-
-        submission.cluster_head_remarks = remarks
-        submission.save()
-
-        messages.success(request, f"Submission '{submission.thesis_title}' reviewed successfully.")
-        return redirect('cluster_head_dashboard')
-    return render(request, 'review_submission_phd_guidance.html', {'submission': submission})
+    return cluster_head_review(request, PhdGuidance, submission_id)
 
 
 def dean_review_phd_guidance(request, pk):
-    submission = get_object_or_404(PhdGuidance, pk=pk)
-
-    if request.method == 'POST':
-        action = request.POST.get('action')
-        remarks = request.POST.get('remarks')
-
-        # Validate and set dean review status
-        if action == 'approve':
-            submission.dean_status = 'approved'
-            submission.status = 'approved_by_dean'
-        elif action == 'reject':
-            submission.dean_status = 'rejected'
-            submission.status = 'rejected_by_dean'
-        else:
-            messages.error(request, "Invalid action.")
-            return redirect('dean_review_phd_guidance', pk=pk)
-
-        # Save remarks separately for dean
-        submission.dean_remarks = remarks
-        submission.save()
-
-        messages.success(request, f"Submission '{submission.thesis_title}' reviewed by Dean successfully.")
-        return redirect('dean_dashboard')
-    
-    total_count = PhdGuidance.objects.count()
-    approved_count = PhdGuidance.objects.filter(dean_status='approved').count()
-    rejected_count = PhdGuidance.objects.filter(dean_status='rejected').count()
-
-    return render(request, 'dean_review_phd_guidance.html', {'submission': submission, 'total_count': total_count, 'approved_count': approved_count, 'rejected_count': rejected_count})
+    return dean_review(request, PhdGuidance, pk)
 
 
+@faculty_login_required
 def book_chapter_submission(request):
 
-    if 'user_id' not in request.session:
-        return redirect('login')
-    
     if request.method == 'POST':
         form = BookChapterForm(request.POST, request.FILES)
         if form.is_valid():
             book_chapter = form.save(commit=False)
-            user = FacultyUser.objects.get(user_id=request.session['user_id'])
+            user = request.faculty_user
             book_chapter.user = user
             book_chapter.save()
             messages.success(request, "Book Chapter submitted successfully.")
@@ -1393,76 +1068,20 @@ def book_chapter_submission(request):
 
 
 def review_submission_book_chapter(request, submission_id):
-    submission = get_object_or_404(BookChapter, id=submission_id)
-
-    if request.method == 'POST':
-        status = request.POST.get('status')  # 'approved_by_cluster', 'rejected_by_cluster', 'revision'
-        remarks = request.POST.get('remarks')
-
-        if status not in ['approved_by_cluster', 'rejected_by_cluster', 'revision']:
-            messages.error(request, 'Invalid status.')
-            return redirect('review_submission_book_chapter', submission_id=submission.id)
-
-        # Map status to cluster_head_status
-        if status == 'approved_by_cluster':
-            submission.cluster_head_status = 'approved'
-            submission.status = 'approved_by_cluster'
-        elif status == 'rejected_by_cluster':
-            submission.cluster_head_status = 'rejected'
-            submission.status = 'rejected_by_cluster'
-        elif status == 'revision':
-            submission.cluster_head_status = 'revision'
-            submission.status = 'revision'
-
-        submission.cluster_head_remarks = remarks
-        submission.save()
-
-        messages.success(request, f"Submission '{submission.chapter_title}' reviewed successfully.")
-        return redirect('cluster_head_dashboard')
-    return render(request, 'review_submission_book_chapter.html', {'submission': submission})
+    return cluster_head_review(request, BookChapter, submission_id)
 
 
 def dean_review_book_chapter(request, pk):
-    submission = get_object_or_404(BookChapter, pk=pk)
-
-    if request.method == 'POST':
-        action = request.POST.get('action')
-        remarks = request.POST.get('remarks')
-
-        # Validate and set dean review status
-        if action == 'approve':
-            submission.dean_status = 'approved'
-            submission.status = 'approved_by_dean'
-        elif action == 'reject':
-            submission.dean_status = 'rejected'
-            submission.status = 'rejected_by_dean'
-        else:
-            messages.error(request, "Invalid action.")
-            return redirect('dean_review_book_chapter', pk=pk)
-
-        # Save remarks separately for dean
-        submission.dean_remarks = remarks
-        submission.save()
-
-        messages.success(request, f"Submission '{submission.chapter_title}' reviewed by Dean successfully.")
-        return redirect('dean_dashboard')
-    
-    total_count = BookChapter.objects.count()
-    approved_count = BookChapter.objects.filter(dean_status='approved').count()
-    rejected_count = BookChapter.objects.filter(dean_status='rejected').count()
-
-    return render(request, 'dean_review_book_chapter.html', {'submission': submission, 'total_count': total_count, 'approved_count': approved_count, 'rejected_count': rejected_count})
+    return dean_review(request, BookChapter, pk)
 
 
+@faculty_login_required
 def books_authored_submission(request):
-    if 'user_id' not in request.session:
-        return redirect('login')
-    
     if request.method == 'POST':
         form = BooksAuthoredForm(request.POST, request.FILES)
         if form.is_valid():
             book = form.save(commit=False)
-            user = FacultyUser.objects.get(user_id=request.session['user_id'])
+            user = request.faculty_user
             book.user = user
             book.save()
             messages.success(request, "Book Authored details submitted successfully.")
@@ -1473,75 +1092,19 @@ def books_authored_submission(request):
 
 
 def review_submission_books_authored(request, submission_id):
-    submission = get_object_or_404(BooksAuthored, id=submission_id)
-
-    if request.method == 'POST':
-        status = request.POST.get('status')  # 'approved_by_cluster', 'rejected_by_cluster', 'revision'
-        remarks = request.POST.get('remarks')
-
-        if status not in ['approved_by_cluster', 'rejected_by_cluster', 'revision']:
-            messages.error(request, 'Invalid status.')
-            return redirect('review_submission_books_authored', submission_id=submission.id)
-
-        # Map status to cluster_head_status
-        if status == 'approved_by_cluster':
-            submission.cluster_head_status = 'approved'
-            submission.status = 'approved_by_cluster'
-        elif status == 'rejected_by_cluster':
-            submission.cluster_head_status = 'rejected'
-            submission.status = 'rejected_by_cluster'
-        elif status == 'revision':
-            submission.cluster_head_status = 'revision'
-            submission.status = 'revision'
-
-        submission.cluster_head_remarks = remarks
-        submission.save()
-
-        messages.success(request, f"Submission '{submission.book_title}' reviewed successfully.")
-        return redirect('cluster_head_dashboard')
-    return render(request, 'review_submission_books_authored.html', {'submission': submission})
+    return cluster_head_review(request, BooksAuthored, submission_id)
 
 
 def dean_review_books_authored(request, pk):
-    submission = get_object_or_404(BooksAuthored, pk=pk)
-
-    if request.method == 'POST':
-        action = request.POST.get('action')
-        remarks = request.POST.get('remarks')
-
-        # Validate and set dean review status
-        if action == 'approve':
-            submission.dean_status = 'approved'
-            submission.status = 'approved_by_dean'
-        elif action == 'reject':
-            submission.dean_status = 'rejected'
-            submission.status = 'rejected_by_dean'
-        else:
-            messages.error(request, "Invalid action.")
-            return redirect('dean_review_books_authored', pk=pk)
-
-        # Save remarks separately for dean
-        submission.dean_remarks = remarks
-        submission.save()
-
-        messages.success(request, f"Submission '{submission.book_title}' reviewed by Dean successfully.")
-        return redirect('dean_dashboard')
-    
-    total_count = BooksAuthored.objects.count()
-    approved_count = BooksAuthored.objects.filter(dean_status='approved').count()
-    rejected_count = BooksAuthored.objects.filter(dean_status='rejected').count()
-
-    return render(request, 'dean_review_books_authored.html', {'submission': submission, 'total_count': total_count, 'approved_count': approved_count, 'rejected_count': rejected_count})
+    return dean_review(request, BooksAuthored, pk)
 
+@faculty_login_required
 def consultancy_project(request):
-    if 'user_id' not in request.session:
-        return redirect('login')
-    
     if request.method == 'POST':
         form = ConsultancyProjectsForm(request.POST, request.FILES)
         if form.is_valid():
             project = form.save(commit=False)
-            user = FacultyUser.objects.get(user_id=request.session['user_id'])
+            user = request.faculty_user
             project.user = user
             project.save()
             messages.success(request, "Consultancy project submitted successfully.")
@@ -1552,77 +1115,21 @@ def consultancy_project(request):
 
 
 def review_submission_consultancy_project(request, submission_id):
-    submission = get_object_or_404(ConsultancyProjects, id=submission_id)
-
-    if request.method == 'POST':
-        status = request.POST.get('status')  # 'approved_by_cluster', 'rejected_by_cluster', 'revision'
-        remarks = request.POST.get('remarks')
-
-        if status not in ['approved_by_cluster', 'rejected_by_cluster', 'revision']:
-            messages.error(request, 'Invalid status.')
-            return redirect('review_submission_consultancy_project', submission_id=submission.id)
-
-        # Map status to cluster_head_status
-        if status == 'approved_by_cluster':
-            submission.cluster_head_status = 'approved'
-            submission.status = 'approved_by_cluster'
-        elif status == 'rejected_by_cluster':
-            submission.cluster_head_status = 'rejected'
-            submission.status = 'rejected_by_cluster'
-        elif status == 'revision':
-            submission.cluster_head_status = 'revision'
-            submission.status = 'revision'
-
-        submission.cluster_head_remarks = remarks
-        submission.save()
-
-        messages.success(request, f"Submission '{submission.project_title}' reviewed successfully.")
-        return redirect('cluster_head_dashboard')
-    return render(request, 'review_submission_consultancy_project.html', {'submission': submission})
+    return cluster_head_review(request, ConsultancyProjects, submission_id)
 
 
 def dean_review_consultancy_project(request, pk):
-    submission = get_object_or_404(ConsultancyProjects, pk=pk)
-
-    if request.method == 'POST':
-        action = request.POST.get('action')
-        remarks = request.POST.get('remarks')
-
-        # Validate and set dean review status
-        if action == 'approve':
-            submission.dean_status = 'approved'
-            submission.status = 'approved_by_dean'
-        elif action == 'reject':
-            submission.dean_status = 'rejected'
-            submission.status = 'rejected_by_dean'
-        else:
-            messages.error(request, "Invalid action.")
-            return redirect('dean_review_consultancy_project', pk=pk)
-
-        # Save remarks separately for dean
-        submission.dean_remarks = remarks
-        submission.save()
-
-        messages.success(request, f"Submission '{submission.project_title}' reviewed by Dean successfully.")
-        return redirect('dean_dashboard')
-    
-    total_count = ConsultancyProjects.objects.count()
-    approved_count = ConsultancyProjects.objects.filter(dean_status='approved').count()
-    rejected_count = ConsultancyProjects.objects.filter(dean_status='rejected').count()
-
-    return render(request, 'dean_review_consultancy_project.html', {'submission': submission, 'total_count': total_count, 'approved_count': approved_count, 'rejected_count': rejected_count})
+    return dean_review(request, ConsultancyProjects, pk)
 
 
 
+@faculty_login_required
 def editorial_roles(request):
-    if 'user_id' not in request.session:
-        return redirect('login')
-    
     if request.method == 'POST':
         form = EditorialRolesForm(request.POST, request.FILES)
         if form.is_valid():
             role = form.save(commit=False)
-            user = FacultyUser.objects.get(user_id=request.session['user_id'])
+            user = request.faculty_user
             role.user = user
             role.save()
             messages.success(request, "Editorial role submitted successfully.")
@@ -1634,77 +1141,21 @@ def editorial_roles(request):
 
 
 def review_submission_editorial_roles(request, submission_id):
-    submission = get_object_or_404(EditorialRoles, id=submission_id)
-
-    if request.method == 'POST':
-        status = request.POST.get('status')  # 'approved_by_cluster', 'rejected_by_cluster', 'revision'
-        remarks = request.POST.get('remarks')
-
-        if status not in ['approved_by_cluster', 'rejected_by_cluster', 'revision']:
-            messages.error(request, 'Invalid status.')
-            return redirect('review_submission_editorial_roles', submission_id=submission.id)
-
-        # Map status to cluster_head_status
-        if status == 'approved_by_cluster':
-            submission.cluster_head_status = 'approved'
-            submission.status = 'approved_by_cluster'
-        elif status == 'rejected_by_cluster':
-            submission.cluster_head_status = 'rejected'
-            submission.status = 'rejected_by_cluster'
-        elif status == 'revision':
-            submission.cluster_head_status = 'revision'
-            submission.status = 'revision'
-
-        submission.cluster_head_remarks = remarks
-        submission.save()
-
-        messages.success(request, f"Submission '{submission.editorial_role}' reviewed successfully.")
-        return redirect('cluster_head_dashboard')
-    return render(request, 'review_submission_editorial_roles.html', {'submission': submission})
+    return cluster_head_review(request, EditorialRoles, submission_id)
 
 
 
 def dean_review_editorial_roles(request, pk):
-    submission = get_object_or_404(EditorialRoles, pk=pk)
-
-    if request.method == 'POST':
-        action = request.POST.get('action')
-        remarks = request.POST.get('remarks')
-
-        # Validate and set dean review status
-        if action == 'approve':
-            submission.dean_status = 'approved'
-            submission.status = 'approved_by_dean'
-        elif action == 'reject':
-            submission.dean_status = 'rejected'
-            submission.status = 'rejected_by_dean'
-        else:
-            messages.error(request, "Invalid action.")
-            return redirect('dean_review_editorial_roles', pk=pk)
-
-        # Save remarks separately for dean
-        submission.dean_remarks = remarks
-        submission.save()
-
-        messages.success(request, f"Submission '{submission.editorial_role}' reviewed by Dean successfully.")
-        return redirect('dean_dashboard')
-    
-    total_count = EditorialRoles.objects.count()
-    approved_count = EditorialRoles.objects.filter(dean_status='approved').count()
-    rejected_count = EditorialRoles.objects.filter(dean_status='rejected').count()
-
-    return render(request, 'dean_review_editorial_roles.html', {'submission': submission, 'total_count': total_count, 'approved_count': approved_count, 'rejected_count': rejected_count})
+    return dean_review(request, EditorialRoles, pk)
 
 
+@faculty_login_required
 def reviewer_roles(request):
-    if 'user_id' not in request.session:
-        return redirect('login')
-    
     if request.method == 'POST':
         form = ReviewerRolesForm(request.POST, request.FILES)
         if form.is_valid():
             role = form.save(commit=False)
-            user = FacultyUser.objects.get(user_id=request.session['user_id'])
+            user = request.faculty_user
             role.user = user
             role.save()
             messages.success(request, "Reviewer role submitted successfully.")
@@ -1715,77 +1166,21 @@ def reviewer_roles(request):
 
 
 def review_submission_reviewer_roles(request, submission_id):
-    submission = get_object_or_404(ReviewerRoles, id=submission_id)
-
-    if request.method == 'POST':
-        status = request.POST.get('status')  # 'approved_by_cluster', 'rejected_by_cluster', 'revision'
-        remarks = request.POST.get('remarks')
-
-        if status not in ['approved_by_cluster', 'rejected_by_cluster', 'revision']:
-            messages.error(request, 'Invalid status.')
-            return redirect('review_submission_reviewer_roles', submission_id=submission.id)
-
-        # Map status to cluster_head_status
-        if status == 'approved_by_cluster':
-            submission.cluster_head_status = 'approved'
-            submission.status = 'approved_by_cluster'
-        elif status == 'rejected_by_cluster':
-            submission.cluster_head_status = 'rejected'
-            submission.status = 'rejected_by_cluster'
-        elif status == 'revision':
-            submission.cluster_head_status = 'revision'
-            submission.status = 'revision'
-
-        submission.cluster_head_remarks = remarks
-        submission.save()
-
-        messages.success(request, f"Submission '{submission.journal_or_conference_name}' reviewed successfully.")
-        return redirect('cluster_head_dashboard')
-    return render(request, 'review_submission_reviewer_roles.html', {'submission': submission})
+    return cluster_head_review(request, ReviewerRoles, submission_id)
 
 
 def dean_review_reviewer_roles(request, pk):
-    submission = get_object_or_404(ReviewerRoles, pk=pk)
-
-    if request.method == 'POST':
-        action = request.POST.get('action')
-        remarks = request.POST.get('remarks')
-
-        # Validate and set dean review status
-        if action == 'approve':
-            submission.dean_status = 'approved'
-            submission.status = 'approved_by_dean'
-        elif action == 'reject':
-            submission.dean_status = 'rejected'
-            submission.status = 'rejected_by_dean'
-        else:
-            messages.error(request, "Invalid action.")
-            return redirect('dean_review_reviewer_roles', pk=pk)
-
-        # Save remarks separately for dean
-        submission.dean_remarks = remarks
-        submission.save()
-
-        messages.success(request, f"Submission '{submission.journal_or_conference_name}' reviewed by Dean successfully.")
-        return redirect('dean_dashboard')
-    
-    total_count = ReviewerRoles.objects.count()
-    approved_count = ReviewerRoles.objects.filter(dean_status='approved').count()
-    rejected_count = ReviewerRoles.objects.filter(dean_status='rejected').count()
-
-    return render(request, 'dean_review_reviewer_roles.html', {'submission': submission, 'total_count': total_count, 'approved_count': approved_count, 'rejected_count': rejected_count})
+    return dean_review(request, ReviewerRoles, pk)
 
 
 
+@faculty_login_required
 def awards_achievements_submission(request):
-    if 'user_id' not in request.session:
-        return redirect('login')
-    
     if request.method == 'POST':
         form = AwardsAchievementsForm(request.POST, request.FILES)
         if form.is_valid():
             award = form.save(commit=False)
-            user = FacultyUser.objects.get(user_id=request.session['user_id'])
+            user = request.faculty_user
             award.user = user
             award.save()
             messages.success(request, "Award/Achievement submitted successfully.")
@@ -1797,77 +1192,21 @@ def awards_achievements_submission(request):
 
 
 def review_submission_awards_achievements(request, submission_id):
-    submission = get_object_or_404(AwardsAchievements, id=submission_id)
-
-    if request.method == 'POST':
-        status = request.POST.get('status')  # 'approved_by_cluster', 'rejected_by_cluster', 'revision'
-        remarks = request.POST.get('remarks')
-
-        if status not in ['approved_by_cluster', 'rejected_by_cluster', 'revision']:
-            messages.error(request, 'Invalid status.')
-            return redirect('review_submission_awards_achievements', submission_id=submission.id)
-
-        # Map status to cluster_head_status
-        if status == 'approved_by_cluster':
-            submission.cluster_head_status = 'approved'
-            submission.status = 'approved_by_cluster'
-        elif status == 'rejected_by_cluster':
-            submission.cluster_head_status = 'rejected'
-            submission.status = 'rejected_by_cluster'
-        elif status == 'revision':
-            submission.cluster_head_status = 'revision'
-            submission.status = 'revision'
-
-        submission.cluster_head_remarks = remarks
-        submission.save()
-
-        messages.success(request, f"Submission '{submission.title_of_award}' reviewed successfully.")
-        return redirect('cluster_head_dashboard')
-    return render(request, 'review_submission_awards_achievements.html', {'submission': submission})
+    return cluster_head_review(request, AwardsAchievements, submission_id)
 
 
 
 def dean_review_awards_achievements(request, pk):
-    submission = get_object_or_404(AwardsAchievements, pk=pk)
-
-    if request.method == 'POST':
-        action = request.POST.get('action')
-        remarks = request.POST.get('remarks')
-
-        # Validate and set dean review status
-        if action == 'approve':
-            submission.dean_status = 'approved'
-            submission.status = 'approved_by_dean'
-        elif action == 'reject':
-            submission.dean_status = 'rejected'
-            submission.status = 'rejected_by_dean'
-        else:
-            messages.error(request, "Invalid action.")
-            return redirect('dean_review_awards_achievements', pk=pk)
-
-        # Save remarks separately for dean
-        submission.dean_remarks = remarks
-        submission.save()
-
-        messages.success(request, f"Submission '{submission.title_of_award}' reviewed by Dean successfully.")
-        return redirect('dean_dashboard')
-    
-    approved_count = AwardsAchievements.objects.filter(dean_status='approved').count()
-    total_count = AwardsAchievements.objects.count()
-    rejected_count = AwardsAchievements.objects.filter(dean_status='rejected').count()
-
-    return render(request, 'dean_review_awards_achievements.html', {'submission': submission, 'approved_count': approved_count, 'rejected_count': rejected_count, 'total_count': total_count})
+    return dean_review(request, AwardsAchievements, pk)
 
 
+@faculty_login_required
 def industry_collaboration(request):
-    if 'user_id' not in request.session:
-        return redirect('login')
-    
     if request.method == 'POST':
         form = IndustryCollaborationForm(request.POST, request.FILES)
         if form.is_valid():
             collaboration = form.save(commit=False)
-            user = FacultyUser.objects.get(user_id=request.session['user_id'])
+            user = request.faculty_user
             collaboration.user = user
             collaboration.save()
             messages.success(request, "Industry Collaboration details submitted successfully.")
@@ -1879,102 +1218,38 @@ def industry_collaboration(request):
 
 
 def review_submission_industry_collaboration(request, submission_id):
-    submission = get_object_or_404(IndustryCollaboration, id=submission_id)
-
-    if request.method == 'POST':
-        status = request.POST.get('status')  # 'approved_by_cluster', 'rejected_by_cluster', 'revision'
-        remarks = request.POST.get('remarks')
-
-        if status not in ['approved_by_cluster', 'rejected_by_cluster', 'revision']:
-            messages.error(request, 'Invalid status.')
-            return redirect('review_submission_industry_collaboration', submission_id=submission.id)
-
-        # Map status to cluster_head_status
-        if status == 'approved_by_cluster':
-            submission.cluster_head_status = 'approved'
-            submission.status = 'approved_by_cluster'
-        elif status == 'rejected_by_cluster':
-            submission.cluster_head_status = 'rejected'
-            submission.status = 'rejected_by_cluster'
-        elif status == 'revision':
-            submission.cluster_head_status = 'revision'
-            submission.status = 'revision'
-
-        submission.cluster_head_remarks = remarks
-        submission.save()
-
-        messages.success(request, f"Submission '{submission.industry_name}' reviewed successfully.")
-        return redirect('cluster_head_dashboard')
-    return render(request, 'review_submission_industry_collaboration.html', {'submission': submission})
+    return cluster_head_review(request, IndustryCollaboration, submission_id)
 
 
 def dean_review_industry_collaboration(request, pk):
-    submission = get_object_or_404(IndustryCollaboration, pk=pk)
-
-    if request.method == 'POST':
-        action = request.POST.get('action')
-        remarks = request.POST.get('remarks')
-
-        # Validate and set dean review status
-        if action == 'approve':
-            submission.dean_status = 'approved'
-            submission.status = 'approved_by_dean'
-        elif action == 'reject':
-            submission.dean_status = 'rejected'
-            submission.status = 'rejected_by_dean'
-        else:
-            messages.error(request, "Invalid action.")
-            return redirect('dean_review_industry_collaboration', pk=pk)
+    return dean_review(request, IndustryCollaboration, pk)
 
-        # Save remarks separately for dean
-        submission.dean_remarks = remarks
-        submission.save()
 
-        messages.success(request, f"Submission '{submission.industry_name}' reviewed by Dean successfully.")
-        return redirect('dean_dashboard')
-    
-    total_count = IndustryCollaboration.objects.count()
-    approved_count = IndustryCollaboration.objects.filter(dean_status='approved').count()
-    rejected_count = IndustryCollaboration.objects.filter(dean_status='rejected').count()
-
-    return render(request, 'dean_review_industry_collaboration.html', {'submission': submission, 'total_count': total_count, 'approved_count': approved_count, 'rejected_count': rejected_count})
+def analytics_etag(request):
+    user = get_faculty_user(request)
+    if user is None:
+        return None
+    return generation_etag((user_generation_name(user.pk), FACULTY_GENERATION), 'analytics', user.pk)
 
 
+@cache_control(private=True, no_cache=True)
+@condition(etag_func=analytics_etag)
 def analytics_api(request):
     """
     Returns real-time analytics data for the logged-in faculty user.
     Data includes total submissions, approved, pending, and approval rate.
+    Polls repeating the ETag of the last response get 304 Not Modified until one of the user's submissions changes.
     """
 
-    # ✅ Get the logged-in user (session-based authentication)
-    user_id = request.session.get('user_id')
-    if not user_id:
+    # ✅ Get the logged-in user (session-based authentication, loaded once per request)
+    user = get_faculty_user(request)
+    if user is None:
         return JsonResponse({'error': 'Unauthorized'}, status=401)
 
-    # ✅ Fetch user safely
-    user = get_object_or_404(FacultyUser, user_id=user_id)
-
-    # ✅ Calculate total submissions across models
-    total_count = (
-        JournalPublication.objects.filter(user=user).count() +
-        ConferencePublication.objects.filter(user=user).count() +
-        ResearchProject.objects.filter(user=user).count() +
-        Patents.objects.filter(user=user).count() + Copyright.objects.filter(user=user).count() +
-        PhdGuidance.objects.filter(user=user).count() + BookChapter.objects.filter(user=user).count() +
-        BooksAuthored.objects.filter(user=user).count() + ConsultancyProjects.objects.filter(user=user).count() +
-        EditorialRoles.objects.filter(user=user).count() + ReviewerRoles.objects.filter(user=user).count() + AwardsAchievements.objects.filter(user=user).count() + IndustryCollaboration.objects.filter(user=user).count()
-    )
-
-    # ✅ Count pending submissions (Dean or Cluster review stages)
-    pending_count = (
-        JournalPublication.objects.filter(user=user, dean_status__in=['pending', 'submitted']).count() +
-        ConferencePublication.objects.filter(user=user, dean_status__in=['pending', 'submitted']).count() +
-        ResearchProject.objects.filter(user=user, overall_status__in=['pending', 'submitted']).count() +
-        Patents.objects.filter(user=user, dean_status__in=['pending', 'submitted']).count() + Copyright.objects.filter(user=user, dean_status__in=['pending', 'submitted']).count() +
-        PhdGuidance.objects.filter(user=user, dean_status__in=['pending', 'submitted']).count() + BookChapter.objects.filter(user=user, dean_status__in=['pending', 'submitted']).count() +
-        BooksAuthored.objects.filter(user=user, dean_status__in=['pending', 'submitted']).count() + ConsultancyProjects.objects.filter(user=user, dean_status__in=['pending', 'submitted']).count() +
-        EditorialRoles.objects.filter(user=user, dean_status__in=['pending', 'submitted']).count() + ReviewerRoles.objects.filter(user=user, dean_status__in=['pending', 'submitted']).count() + AwardsAchievements.objects.filter(user=user, dean_status__in=['pending', 'submitted']).count() + IndustryCollaboration.objects.filter(user=user, dean_status__in=['pending', 'submitted']).count()
-    )
+    # ✅ Total and pending (Dean or Cluster review stages) submissions in one aggregate query
+    counts = user_submission_counts(user)
+    total_count = counts['total']
+    pending_count = counts['pending']
 
     # ✅ Count approved submissions
     approved_count = total_count - pending_count
@@ -1998,47 +1273,83 @@ def view_analytics(request):
     Renders the analytics dashboard for the logged-in faculty user.
     """
 
-    # ✅ Get the logged-in user (session-based authentication)
-    user_id = request.session.get('user_id')
-    if not user_id:
+    # ✅ Get the logged-in user (session-based authentication, loaded once per request)
+    user = get_faculty_user(request)
+    if user is None:
         return redirect('login')
 
-    # ✅ Fetch user safely
-    user = get_object_or_404(FacultyUser, user_id=user_id)
-
     return render(request, 'view_analytics.html', {'user': user})
 
 
+def faculty_submissions_etag(request):
+    return generation_etag((*ALL_TYPES, FACULTY_GENERATION), 'faculty_submissions', request.GET.urlencode())
+
+
+@cache_control(private=True, no_cache=True)
+@condition(etag_func=faculty_submissions_etag)
 def faculty_wise_submissions_api(request):
     """
     Returns real-time submission counts per faculty member across all modules.
+
+    Counts, the ordering by count and the top-N limit are all computed in one query (no per-faculty queries, nothing sorted in Python) and can be narrowed with optional query parameters:
+    - type: one or more comma separated submission type keys (e.g. journal,patent)
+    - year: only count submissions made in that calendar year
+    - department: only include faculty whose profile lists this department
+    - limit: only return the top N faculty members
+
+    Responses carry an ETag derived from the submission and faculty generations and the query string, so an unchanged poll is answered with 304 Not Modified.
     """
 
-    # ✅ Collect submission counts across all models
-    faculty_data = []
-
-    for faculty in FacultyUser.objects.filter(role='faculty'):
-        total_submissions = (
-            JournalPublication.objects.filter(user=faculty).count() +
-            ConferencePublication.objects.filter(user=faculty).count() +
-            ResearchProject.objects.filter(user=faculty).count() +
-            Patents.objects.filter(user=faculty).count() + Copyright.objects.filter(user=faculty).count() +
-            PhdGuidance.objects.filter(user=faculty).count() + BookChapter.objects.filter(user=faculty).count() +
-            BooksAuthored.objects.filter(user=faculty).count() + ConsultancyProjects.objects.filter(user=faculty).count() +
-            EditorialRoles.objects.filter(user=faculty).count() + ReviewerRoles.objects.filter(user=faculty).count() + AwardsAchievements.objects.filter(user=faculty).count() + IndustryCollaboration.objects.filter(user=faculty).count()
-        )
+    # ✅ Validate optional filters
+    types = [t for t in request.GET.get('type', '').split(',') if t]
+    unknown_types = [t for t in types if t not in SUBMISSION_TYPES_BY_KEY]
+    if unknown_types:
+        return JsonResponse({'error': f"Unknown submission type: {', '.join(unknown_types)}"}, status=400)
+
+    try:
+        year = int(request.GET['year']) if request.GET.get('year') else None
+        limit = int(request.GET['limit']) if request.GET.get('limit') else None
+    except ValueError:
+        return JsonResponse({'error': 'year and limit must be integers'}, status=400)
+    if limit is not None and limit < 0:
+        return JsonResponse({'error': 'limit must not be negative'}, status=400)
 
-        faculty_data.append({
-            'name': faculty.full_name,
-            'count': total_submissions
-        })
+    faculty = FacultyUser.objects.filter(role='faculty')
+    department = request.GET.get('department')
+    if department:
+        faculty = faculty.filter(facultyprofile__department__iexact=department)
 
-    # ✅ Sort by submission count (descending)
-    faculty_data.sort(key=lambda x: x['count'], reverse=True)
+    # ✅ Counts, sort by submission count (descending) and top N in one query
+    faculty = annotate_submission_totals(faculty, types=types or None, year=year).order_by('-total', 'pk')
+    if limit is not None:
+        faculty = faculty[:limit]
+
+    faculty_data = [{'name': full_name, 'count': total} for full_name, total in faculty.values_list('full_name', 'total')]
 
     return JsonResponse({'faculty_data': faculty_data})
 
 
+async def dashboard_events(request):
+    """
+    Server-Sent Events stream for the dean and cluster head dashboards. It pushes a "queue" event when the reviewer's queue grows or shrinks and, for the dean, an "analytics" event with the new counters and their deltas, but only after a submission or review has actually changed something. The stream needs an ASGI server, which is how the Procfile runs the site (gunicorn with uvicorn workers); under WSGI, e.g. manage.py runserver, it answers 204 No Content, which makes the browser's EventSource give up so the dashboard falls back to polling.
+    """
+
+    # ✅ Long-lived streams only make sense under ASGI
+    if not isinstance(request, ASGIRequest):
+        return HttpResponse(status=204)
+
+    user = await sync_to_async(get_faculty_user)(request)
+    if user is None:
+        return JsonResponse({'error': 'Unauthorized'}, status=401)
+    if user.role not in REVIEW_QUEUES:
+        return JsonResponse({'error': 'Forbidden'}, status=403)
+
+    response = StreamingHttpResponse(dashboard_event_stream(user.role), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'
+    return response
+
+
 # @xframe_options_exempt
 # def serve_pdf(request, path):
 #     file_path = os.path.join(settings.MEDIA_ROOT, path)